@@ -0,0 +1,32 @@
+from planqk.qiskit import PlanqkQuantumProvider
+from planqk.qiskit.client.backend_dtos import BackendDto
+from planqk.qiskit.emulator import catalog
+
+# Backend of each provider class, described as by the PlanQK API
+BACKENDS = {
+    "aws": catalog.aws_sv1,
+    "aws_rigetti": catalog.aws_rigetti,
+    "azure_ionq": catalog.azure_ionq_simulator,
+    "qryd": catalog.qryd_emulator,
+    "ibm": catalog.ibm_simulator,
+    "ibm_qpu": catalog.ibm_qpu,
+}
+
+
+def create_backend(name: str, provider: PlanqkQuantumProvider = None, shared: bool = True):
+    """Creates the backend object as done by the provider, without requesting the backend from PlanQK.
+
+    Backends not shared do not reuse the target and connectivity of other backends having the same id and version.
+    """
+    provider = provider or PlanqkQuantumProvider(access_token="benchmark")
+    backend_dto = BackendDto(**BACKENDS[name]())
+    if not shared:
+        backend_dto.updated_at = None
+    return provider._get_backend_object(backend_dto, {
+        "backend_info": backend_dto,
+        "provider": provider,
+        "name": backend_dto.id,
+        "description": f"PlanQK Backend: {backend_dto.hardware_provider.name} {backend_dto.id}.",
+        "online_date": backend_dto.updated_at,
+        "backend_version": "2",
+    })
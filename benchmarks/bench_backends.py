@@ -0,0 +1,73 @@
+import pytest
+
+from benchmarks.backends import BACKENDS, create_backend
+from planqk.qiskit import PlanqkQuantumProvider
+
+
+@pytest.mark.parametrize("backend", BACKENDS.keys())
+def test_backend_construction(benchmark, backend):
+    provider = PlanqkQuantumProvider(access_token="benchmark")
+    planqk_backend = benchmark(create_backend, backend, provider)
+    benchmark.extra_info["num_qubits"] = planqk_backend.num_qubits
+
+
+@pytest.mark.parametrize("backend", BACKENDS.keys())
+def test_target_construction(benchmark, backend):
+    # The target and configuration are built on first access
+    provider = PlanqkQuantumProvider(access_token="benchmark")
+
+    def create_target():
+        planqk_backend = create_backend(backend, provider, shared=False)
+        return planqk_backend.target, planqk_backend.configuration()
+
+    benchmark(create_target)
+
+
+@pytest.fixture
+def emulator():
+    from planqk.qiskit.client.client import _PlanqkClient
+    from planqk.qiskit.client.transport import RequestsTransport
+    from planqk.qiskit.emulator import MiddlewareEmulator
+
+    # Each request takes 20 ms, as a request to the PlanQK platform at least
+    middleware = MiddlewareEmulator(latency=0.02, access_token="benchmark")
+    _PlanqkClient.set_transport(middleware.transport())
+    original_get_default_headers = _PlanqkClient._get_default_headers
+    _PlanqkClient._get_default_headers = classmethod(lambda cls: {"x-auth-token": "benchmark"})
+    yield middleware
+    _PlanqkClient._get_default_headers = original_get_default_headers
+    _PlanqkClient.set_transport(RequestsTransport())
+
+
+def _get_backends_sequentially(provider):
+    return [provider.get_backend(backend_id) for backend_id in provider.backends()]
+
+
+@pytest.mark.parametrize("startup", ["sequential", "warm_up"])
+def test_backend_startup(benchmark, emulator, startup):
+    def start():
+        provider = PlanqkQuantumProvider(access_token="benchmark")
+        if startup == "warm_up":
+            return list(provider.warm_up(concurrency=16).values())
+        return _get_backends_sequentially(provider)
+
+    backends = benchmark.pedantic(start, rounds=3)
+    benchmark.extra_info["num_backends"] = len(backends)
+
+
+@pytest.mark.parametrize("backend", ["aws_rigetti", "ibm_qpu"])
+def test_transpile(benchmark, backend):
+    # Sweeps create backends of the same version repeatedly, the routing data of their target is computed once
+    from qiskit import QuantumCircuit, transpile
+
+    provider = PlanqkQuantumProvider(access_token="benchmark")
+    circuit = QuantumCircuit(5)
+    circuit.h(0)
+    for qubit in range(1, 5):
+        circuit.cx(0, qubit)
+    circuit.measure_all()
+
+    def transpile_circuit():
+        return transpile(circuit, create_backend(backend, provider), optimization_level=1, seed_transpiler=42)
+
+    benchmark(transpile_circuit)
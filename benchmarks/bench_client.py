@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from benchmarks.backends import create_backend
+from benchmarks.payloads import qoqo_input, ibm_input, counts_result, memory_result
+from planqk.qiskit import PlanqkJob
+from planqk.qiskit.client.client import _PlanqkClient
+from planqk.qiskit.client.job_dtos import JobDto, INPUT_FORMAT
+from planqk.qiskit.client.transport import InProcessTransport, RequestsTransport
+
+JOB_INPUTS = {
+    "qoqo_10k_ops": lambda: (INPUT_FORMAT.QOQO, qoqo_input(10_000)),
+    "qoqo_100k_ops": lambda: (INPUT_FORMAT.QOQO, qoqo_input(100_000)),
+    "ibm_1mb_blob": lambda: (INPUT_FORMAT.QISKIT, ibm_input(768 * 1024)),
+}
+
+RESULTS = {
+    "counts_20_bits_10k_outcomes": lambda: counts_result(20, 10_000),
+    "memory_20_bits_100k_shots": lambda: memory_result(20, 100_000),
+}
+
+
+@pytest.fixture
+def transport():
+    def use_transport(handler):
+        _PlanqkClient.set_transport(InProcessTransport(handler))
+
+    original_get_default_headers = _PlanqkClient._get_default_headers
+    _PlanqkClient._get_default_headers = classmethod(lambda cls: {"x-auth-token": "benchmark"})
+    yield use_transport
+    _PlanqkClient._get_default_headers = original_get_default_headers
+    _PlanqkClient.set_transport(RequestsTransport())
+
+
+@pytest.mark.parametrize("job_input", JOB_INPUTS.keys())
+def test_submit_job(benchmark, transport, job_input):
+    # The server only acknowledges the job so that the client side of the submission is measured
+    response = json.dumps({"id": "123", "provider": "QRYD", "status": "PENDING"}).encode()
+    received = {}
+
+    def handler(method, url, params, headers, body):
+        received["bytes"] = len(body)
+        return 201, {"content-type": "application/json"}, response
+
+    transport(handler)
+    input_format, job_input = JOB_INPUTS[job_input]()
+    job = JobDto(provider="QRYD", backend_id="qryd.sim.square", shots=100, input_format=input_format, input=job_input)
+
+    benchmark(_PlanqkClient.submit_job, job)
+    benchmark.extra_info["bytes"] = received["bytes"]
+
+
+@pytest.mark.parametrize("result", RESULTS.keys())
+def test_job_result(benchmark, transport, result):
+    job_details = JobDto(id="123", provider="QRYD", backend_id="qryd.sim.square", shots=100_000, status="COMPLETED")
+    job_body = job_details.model_dump_json(exclude_none=True).encode()
+    result_body = json.dumps(RESULTS[result]()).encode()
+
+    def handler(method, url, params, headers, body):
+        return 200, {"content-type": "application/json"}, result_body if url.endswith("/result") else job_body
+
+    transport(handler)
+    backend = create_backend("qryd")
+
+    def job_result():
+        return PlanqkJob(backend=backend, job_id="123", job_details=job_details).result()
+
+    benchmark(job_result)
+    benchmark.extra_info["bytes"] = len(result_body)
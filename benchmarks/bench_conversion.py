@@ -0,0 +1,87 @@
+from copy import copy
+
+import pytest
+
+from benchmarks.backends import create_backend
+from benchmarks.payloads import layered_circuit
+
+BACKENDS = ["aws", "azure_ionq", "qryd", "ibm"]
+WIDTHS = [5, 20]
+DEPTHS = [10, 100]
+
+
+@pytest.mark.parametrize("depth", DEPTHS)
+@pytest.mark.parametrize("width", WIDTHS)
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_convert_to_job_input(benchmark, backend, width, depth):
+    planqk_backend = create_backend(backend)
+    circuit = layered_circuit(width, depth)
+    circuit.name = "circ0"
+    options = planqk_backend.options
+
+    benchmark(planqk_backend.convert_to_job_input, circuit, options)
+    benchmark.extra_info["num_gates"] = circuit.size()
+
+
+@pytest.mark.parametrize("depth", DEPTHS)
+@pytest.mark.parametrize("width", WIDTHS)
+@pytest.mark.parametrize("backend", ["aws", "qryd"])
+def test_validate_circuit(benchmark, backend, width, depth):
+    # Validation precedes the conversion in run, compare with test_convert_to_job_input
+    planqk_backend = create_backend(backend)
+    circuit = layered_circuit(width, depth)
+    planqk_backend.target
+
+    benchmark(planqk_backend.validate_circuit, circuit, 100)
+    benchmark.extra_info["num_gates"] = circuit.size()
+
+
+@pytest.mark.parametrize("depth", [100, 1000])
+def test_aws_openqasm(benchmark, depth):
+    # Conversion of deep circuits to OpenQASM as done by run
+    planqk_backend = create_backend("aws")
+    circuit = layered_circuit(20, depth)
+    options = planqk_backend.options
+
+    benchmark(planqk_backend.convert_to_job_input, circuit, options)
+    benchmark.extra_info["num_gates"] = circuit.size()
+
+
+def test_convert_transpiled_circuit_repeatedly(benchmark):
+    # Circuits not consisting of the gates of the backend are transpiled once, their programs are memoized
+    planqk_backend = create_backend("aws_rigetti")
+    circuit = layered_circuit(20, 100)
+    options = planqk_backend.options
+    planqk_backend.convert_to_job_input(circuit, options)
+
+    benchmark(planqk_backend.convert_to_job_input, circuit, options)
+    benchmark.extra_info["num_gates"] = circuit.size()
+
+
+def test_qryd_wire_format(benchmark):
+    from planqk.qiskit.providers.qryd.qryd_converter_utils import convert_to_wire_format
+
+    planqk_backend = create_backend("qryd")
+    circuit = layered_circuit(50, 1350)
+
+    benchmark(convert_to_wire_format, circuit, planqk_backend.options)
+    benchmark.extra_info["num_gates"] = circuit.size()
+
+
+@pytest.mark.parametrize("peephole_optimization", [False, True])
+def test_qryd_peephole_optimization(benchmark, peephole_optimization):
+    # Conversion of a QFT transpiled without optimization, the optimization reduces the number of qoqo operations
+    from qiskit import transpile
+    from qiskit.circuit.library import QFT
+
+    planqk_backend = create_backend("qryd")
+    circuit = QFT(12).decompose()
+    circuit.measure_all()
+    circuit = transpile(circuit, basis_gates=["u", "cz", "measure"], optimization_level=0)
+    options = copy(planqk_backend.options)
+    options.peephole_optimization = peephole_optimization
+
+    job_input = benchmark(planqk_backend.convert_to_job_input, circuit, options)
+    benchmark.extra_info["num_gates"] = circuit.size()
+    benchmark.extra_info["num_operations"] = len(
+        job_input["ClassicalRegister"]["measurement"]["circuits"][0]["operations"])
@@ -0,0 +1,64 @@
+import os
+from unittest.mock import patch
+
+import pytest
+from qiskit import transpile
+
+from benchmarks.payloads import layered_circuit
+from planqk.qiskit import PlanqkQuantumProvider
+from planqk.qiskit.client.client import _PlanqkClient
+from planqk.qiskit.client.transport import RequestsTransport
+from planqk.qiskit.emulator import MiddlewareEmulator, EmulatorServer
+
+BACKENDS = ["aws.sim.sv1", "azure.ionq.simulator", "qryd.sim.square", "ibmq_qasm_simulator"]
+
+
+@pytest.fixture(scope="module")
+def provider():
+    # Jobs complete immediately, hence the benchmarks measure the SDK and the HTTP round trips
+    with EmulatorServer(MiddlewareEmulator(seed=42)) as server, \
+            patch.dict(os.environ, {"PLANQK_QUANTUM_BASE_URL": server.url}), \
+            patch.object(_PlanqkClient, "_get_default_headers", classmethod(lambda cls: {"x-auth-token": "bench"})):
+        _PlanqkClient.set_transport(RequestsTransport())
+        yield PlanqkQuantumProvider(access_token="benchmark")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_get_backend(benchmark, provider, backend):
+    benchmark(provider.get_backend, backend)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_run_and_get_result(benchmark, provider, backend):
+    planqk_backend = provider.get_backend(backend)
+    circuit = layered_circuit(10, 20)
+    if backend.startswith("ibm"):
+        # IBM backends do not transpile the circuit before submitting it
+        circuit = transpile(circuit, planqk_backend)
+
+    def run():
+        return planqk_backend.run(circuit, shots=1000).result()
+
+    result = benchmark(run)
+    benchmark.extra_info["outcomes"] = len(result.get_counts())
+
+
+@pytest.mark.parametrize("method", ["bound_circuits", "parameter_sweep"])
+def test_aws_parameter_sweep(benchmark, provider, method):
+    # Submission of 20 sweep points, as bound circuits or as one program with input values
+    from qiskit.circuit.library import EfficientSU2
+
+    planqk_backend = provider.get_backend("aws.sim.sv1")
+    circuit = EfficientSU2(10, reps=10).decompose()
+    circuit.measure_all()
+    parameter_binds = [dict.fromkeys(circuit.parameters, 0.01 * point) for point in range(20)]
+
+    if method == "bound_circuits":
+        def run():
+            return [planqk_backend.run(circuit.assign_parameters(values), shots=100) for values in parameter_binds]
+    else:
+        def run():
+            return planqk_backend.run_parameter_sweep(circuit, parameter_binds, shots=100)
+
+    benchmark(run)
+    benchmark.extra_info["num_parameters"] = circuit.num_parameters
@@ -0,0 +1,38 @@
+import pytest
+
+from benchmarks.payloads import qoqo_input, counts_result, memory_result
+from planqk.qiskit.client.payload_formats import get_payload_format
+
+PAYLOADS = {
+    "counts_20_qubits": lambda: counts_result(20, 50_000),
+    "memory_10k_shots": lambda: memory_result(32, 10_000),
+    "qoqo_50k_ops": lambda: qoqo_input(50_000),
+}
+
+FORMATS = ["json", "msgpack", "cbor"]
+
+
+def _payload_format(name: str):
+    if name == "msgpack":
+        pytest.importorskip("msgpack")
+    if name == "cbor":
+        pytest.importorskip("cbor2")
+    return get_payload_format(name)
+
+
+@pytest.mark.parametrize("payload", PAYLOADS.keys())
+@pytest.mark.parametrize("format_name", FORMATS)
+def test_encode(benchmark, format_name, payload):
+    payload_format = _payload_format(format_name)
+    data = PAYLOADS[payload]()
+    encoded = benchmark(payload_format.encode, data)
+    benchmark.extra_info["bytes"] = len(encoded)
+
+
+@pytest.mark.parametrize("payload", PAYLOADS.keys())
+@pytest.mark.parametrize("format_name", FORMATS)
+def test_decode(benchmark, format_name, payload):
+    payload_format = _payload_format(format_name)
+    encoded = payload_format.encode(PAYLOADS[payload]())
+    benchmark(payload_format.decode, encoded)
+    benchmark.extra_info["bytes"] = len(encoded)
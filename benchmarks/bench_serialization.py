@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from benchmarks.payloads import qoqo_input, ibm_input
+from planqk.qiskit.client.client import _PlanqkClient
+from planqk.qiskit.client.job_dtos import JobDto, INPUT_FORMAT
+from planqk.qiskit.client.serialization import serialize_job, PreEncodedJson
+
+PAYLOADS = {
+    "qoqo_100k_ops": lambda: (INPUT_FORMAT.QOQO, qoqo_input(100_000)),
+    "ibm_4mb_blob": lambda: (INPUT_FORMAT.QISKIT, ibm_input(3 * 1024 * 1024)),
+}
+
+
+def _job(payload_name: str) -> JobDto:
+    input_format, job_input = PAYLOADS[payload_name]()
+    return JobDto(provider="QRYD", backend_id="qryd.sim", shots=100, input_format=input_format, input=job_input,
+                  input_params={"seed_simulator": None, "fusion_max_qubits": 4})
+
+
+def _legacy_serialize_job(job: JobDto) -> bytes:
+    # Serialization of submit_job before the dedicated serialization stage
+    return json.dumps(_PlanqkClient.remove_none_values(job.__dict__)).encode("utf-8")
+
+
+@pytest.mark.parametrize("payload", PAYLOADS.keys())
+def test_serialize_job_legacy(benchmark, payload):
+    job = _job(payload)
+    body = benchmark(_legacy_serialize_job, job)
+    benchmark.extra_info["bytes"] = len(body)
+
+
+@pytest.mark.parametrize("payload", PAYLOADS.keys())
+def test_serialize_job(benchmark, payload):
+    job = _job(payload)
+    body = benchmark(serialize_job, job)
+    benchmark.extra_info["bytes"] = len(body)
+
+
+@pytest.mark.parametrize("payload", PAYLOADS.keys())
+def test_serialize_job_pre_encoded_input(benchmark, payload):
+    job = _job(payload)
+    job.input = PreEncodedJson.encode(job.input)
+    body = benchmark(serialize_job, job)
+    benchmark.extra_info["bytes"] = len(body)
+
+
+@pytest.mark.parametrize("encoding", ["dict", "streamed"])
+def test_qryd_job_body_peak_memory(benchmark, encoding):
+    # Peak memory allocated while encoding the body of a deep QRyd circuit, consumed chunk by chunk like a transport
+    import tracemalloc
+
+    from benchmarks.backends import create_backend
+    from benchmarks.payloads import layered_circuit
+    from planqk.qiskit.providers.qryd.qryd_converter_utils import convert_to_wire_format, stream_wire_format
+
+    planqk_backend = create_backend("qryd")
+    circuit = layered_circuit(50, 1350)
+    convert = convert_to_wire_format if encoding == "dict" else stream_wire_format
+
+    def send():
+        job = JobDto(provider="QRYD", backend_id="qryd.sim", shots=100, input_format=INPUT_FORMAT.QOQO,
+                     input=convert(circuit, planqk_backend.options))
+        body = serialize_job(job)
+        return sum(len(chunk) for chunk in ([body] if isinstance(body, bytes) else body))
+
+    tracemalloc.start()
+    try:
+        num_bytes = send()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    benchmark(send)
+    benchmark.extra_info["bytes"] = num_bytes
+    benchmark.extra_info["peak_memory_bytes"] = peak
+    benchmark.extra_info["num_gates"] = circuit.size()
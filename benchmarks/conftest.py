@@ -0,0 +1,29 @@
+from pathlib import Path
+
+import pytest
+
+_BENCHMARKS_DIR = Path(__file__).parent
+
+
+def _benchmarks_requested(config) -> bool:
+    paths = [Path(config.invocation_params.dir, arg.split("::")[0]).resolve() for arg in config.args]
+    return any(path == _BENCHMARKS_DIR or _BENCHMARKS_DIR in path.parents for path in paths)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # Results of benchmark runs are stored as JSON in .benchmarks, named by the commit they were run for, so that
+    # regressions can be spotted with "pytest-benchmark compare" or "--benchmark-compare"
+    if _benchmarks_requested(config) and hasattr(config.option, "benchmark_autosave") \
+            and not config.option.benchmark_save and not config.option.benchmark_disable:
+        from pytest_benchmark.utils import get_tag
+        config.option.benchmark_autosave = get_tag()
+
+
+def pytest_collect_file(file_path, parent):
+    # Benchmark modules are named bench_*.py so that they are only collected if the benchmarks are run explicitly,
+    # e.g., with "python -m pytest benchmarks", and not as part of the test suite.
+    session = parent.session
+    if (file_path.suffix == ".py" and file_path.name.startswith("bench_")
+            and not session.isinitpath(file_path) and session.isinitpath(_BENCHMARKS_DIR)):
+        return pytest.Module.from_parent(parent, path=file_path)
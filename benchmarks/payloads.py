@@ -0,0 +1,67 @@
+import base64
+import random
+
+
+def qoqo_input(num_operations: int, num_qubits: int = 20) -> dict:
+    """Returns a qoqo circuit dict as sent for QRyd jobs."""
+    rng = random.Random(42)
+    operations = []
+    for i in range(num_operations):
+        if i % 3 == 0:
+            operations.append({"CNOT": {"control": i % num_qubits, "target": (i + 1) % num_qubits}})
+        else:
+            operations.append({"RotateZ": {"qubit": i % num_qubits, "theta": rng.uniform(-3.14, 3.14)}})
+    return {
+        "ClassicalRegister": {
+            "measurement": {
+                "circuits": [{
+                    "definitions": [{"DefinitionBit": {"name": "ro", "length": num_qubits, "is_output": True}}],
+                    "operations": operations,
+                    "_roqoqo_version": {"major_version": 1, "minor_version": 0},
+                }],
+            },
+        },
+    }
+
+
+def ibm_input(num_bytes: int) -> dict:
+    """Returns a RuntimeEncoder-like input with a base64 encoded circuit blob as sent for IBM jobs."""
+    blob = base64.standard_b64encode(random.Random(42).randbytes(num_bytes)).decode("ascii")
+    return {"circuits": [{"__type__": "QuantumCircuit", "__value__": blob}], "shots": 1000, "run_options": None}
+
+
+def counts_result(num_clbits: int, num_outcomes: int) -> dict:
+    """Returns a job result with a counts dictionary as returned by the PlanQK API."""
+    rng = random.Random(42)
+    outcomes = rng.sample(range(2 ** num_clbits), num_outcomes)
+    return {"counts": {format(outcome, f"0{num_clbits}b"): rng.randint(1, 100) for outcome in outcomes}}
+
+
+def memory_result(num_clbits: int, shots: int) -> dict:
+    """Returns a job result with per-shot memory as returned by the PlanQK API."""
+    rng = random.Random(42)
+    memory = [format(rng.getrandbits(num_clbits), f"0{num_clbits}b") for _ in range(shots)]
+    counts = {}
+    for bitstring in memory:
+        counts[bitstring] = counts.get(bitstring, 0) + 1
+    return {"counts": counts, "memory": memory}
+
+
+def layered_circuit(num_qubits: int, depth: int):
+    """Returns a circuit of ``depth`` layers of single-qubit rotations and CNOTs supported by all providers, followed
+    by the measurement of all qubits."""
+    from qiskit import QuantumCircuit
+
+    rng = random.Random(42)
+    circuit = QuantumCircuit(num_qubits, num_qubits)
+    for layer in range(depth):
+        for qubit in range(num_qubits):
+            gate = rng.choice(("h", "rx", "rz"))
+            if gate == "h":
+                circuit.h(qubit)
+            else:
+                getattr(circuit, gate)(rng.uniform(-3.14, 3.14), qubit)
+        for qubit in range(layer % 2, num_qubits - 1, 2):
+            circuit.cx(qubit, qubit + 1)
+    circuit.measure(range(num_qubits), range(num_qubits))
+    return circuit
@@ -1,22 +1,34 @@
+import importlib
 import os
 from abc import ABC
 
-from dwave.cloud import Client
-from dwave.samplers import SimulatedAnnealingSampler, TabuSampler
-from dwave.system import LeapHybridSampler, DWaveSampler, DWaveCliqueSampler, LeapHybridCQMSampler, LeapHybridDQMSampler
-
 from planqk.credentials import DefaultCredentialsProvider
 
 
 class Sampler(ABC):
-    def __init__(self, cls: type, **config):
-        self._cls = cls
+    """Sampler class of the D-Wave Ocean SDK, imported once the first sampler is created.
+
+    Args:
+        module: module of the sampler class, e.g., "dwave.system"
+        name: name of the sampler class
+        **config: default configuration of the sampler
+    """
+
+    def __init__(self, module: str, name: str, **config):
+        self._module = module
+        self._cls = None
         self._config = config
-        self.name = cls.__name__
+        self.name = name
+
+    @property
+    def cls(self) -> type:
+        if self._cls is None:
+            self._cls = getattr(importlib.import_module(self._module), self.name)
+        return self._cls
 
     def __call__(self, **config):
         config = {**self._config, **config}
-        return self._cls(**config)
+        return self.cls(**config)
 
     def __str__(self):
         return f"{self.name}"
@@ -28,15 +40,15 @@ class Sampler(ABC):
 SUPPORTED_SAMPLERS = [
     # samplers from dwave-samplers package
     # https://docs.ocean.dwavesys.com/en/stable/docs_samplers/index.html
-    Sampler(SimulatedAnnealingSampler),
-    Sampler(TabuSampler),
+    Sampler("dwave.samplers", "SimulatedAnnealingSampler"),
+    Sampler("dwave.samplers", "TabuSampler"),
     # samplers from dwave-system package
     # https://docs.ocean.dwavesys.com/en/stable/docs_system/sdk_index.html
-    Sampler(DWaveSampler),
-    Sampler(DWaveCliqueSampler),
-    Sampler(LeapHybridSampler),
-    Sampler(LeapHybridCQMSampler),
-    Sampler(LeapHybridDQMSampler),
+    Sampler("dwave.system", "DWaveSampler"),
+    Sampler("dwave.system", "DWaveCliqueSampler"),
+    Sampler("dwave.system", "LeapHybridSampler"),
+    Sampler("dwave.system", "LeapHybridCQMSampler"),
+    Sampler("dwave.system", "LeapHybridDQMSampler"),
 ]
 
 
@@ -63,5 +75,7 @@ class PlanqkDwaveProvider(ABC):
 
     @staticmethod
     def get_solvers(refresh=False, order_by='avg_load', **filters):
+        from dwave.cloud import Client
+
         client = Client.from_config()
         return client.get_solvers(refresh, order_by, **filters)
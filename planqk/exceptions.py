@@ -18,11 +18,36 @@ class PlanqkClientError(Exception):
         self.response = response
 
     def __str__(self):
-        error_json = json.loads(self.response.text) if self.response.text else None
-        error_msg = error_json['error_message'] if error_json is not None else None
-        status = error_json['status'] if error_json is not None else None
+        error_json = self._decode_error()
+        error_msg = error_json.get('error_message') if error_json is not None else None
+        status = error_json.get('status') if error_json is not None else None
         status_code = self.response.status_code
-        return f'{error_msg} (HTTP error: {status})' if error_msg is not None else f'HTTP error code: {status_code}'
+        if error_msg is not None:
+            return f'{error_msg} (HTTP error: {status})'
+        if error_json is None and self.response.text:
+            return f'HTTP error code: {status_code}: {self.response.text}'
+        return f'HTTP error code: {status_code}'
+
+    def _decode_error(self):
+        """Decodes the error body according to its content type, e.g., JSON or msgpack, returning None if it is not
+        a decodable error object."""
+        from planqk.qiskit.client.payload_formats import payload_format_of
+
+        try:
+            payload_format = payload_format_of(self.response.headers.get('content-type'))
+            if payload_format is not None:
+                error_json = payload_format.decode(self.response.content)
+            else:
+                error_json = json.loads(self.response.text) if self.response.text else None
+        except Exception:
+            return None
+        return error_json if isinstance(error_json, dict) else None
+
+
+class CircuitValidationError(PlanqkError):
+    def __init__(self, violations):
+        self.violations = violations
+        super().__init__("Circuit is not supported by the backend:", "; ".join(violations))
 
 
 class CredentialUnavailableError(PlanqkError):
@@ -1,3 +1,29 @@
-from .job import PlanqkJob
-from .backend import PlanqkBackend
-from .provider import PlanqkQuantumProvider
+from typing import TYPE_CHECKING
+
+# The public classes are imported on first access (PEP 562) as importing them pulls in Qiskit
+_LAZY_ATTRIBUTES = {
+    "PlanqkJob": ".job",
+    "PlanqkBackend": ".backend",
+    "PlanqkQuantumProvider": ".provider",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    from .job import PlanqkJob
+    from .backend import PlanqkBackend
+    from .provider import PlanqkQuantumProvider
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
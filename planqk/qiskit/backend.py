@@ -1,7 +1,11 @@
 import datetime
+import threading
+import weakref
 from abc import ABC, abstractmethod
 from copy import copy
-from typing import Optional, Tuple
+from typing import FrozenSet, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 from qiskit import QuantumCircuit
 from qiskit.circuit import Instruction as QiskitInstruction, Delay, Parameter
@@ -10,10 +14,40 @@ from qiskit.providers import BackendV2, Provider
 from qiskit.providers.models import QasmBackendConfiguration, GateConfig
 from qiskit.transpiler import Target
 
+from . import instrumentation, transpilation, validation
+from .connectivity import Connectivity
+from .routing import PlanqkTarget
 from .client.backend_dtos import ConfigurationDto, TYPE, BackendDto, PROVIDER
 from .client.job_dtos import JobDto, INPUT_FORMAT
 from .job import PlanqkJob
 from .options import OptionsV2
+from ..exceptions import CircuitValidationError
+
+
+class _SharedStructures(object):
+    """Target, configuration and connectivity shared by all backends having the same class, id and version."""
+    __slots__ = ("target", "configuration", "connectivity", "lock", "__weakref__")
+
+    def __init__(self):
+        self.connectivity: Optional[Connectivity] = None
+        self.target: Optional[Target] = None
+        self.configuration: Optional[QasmBackendConfiguration] = None
+        self.lock = threading.RLock()
+
+
+# Weakly referenced so that the structures are collected once no backend uses them anymore
+_shared_structures: "weakref.WeakValueDictionary[tuple, _SharedStructures]" = weakref.WeakValueDictionary()
+_shared_structures_lock = threading.Lock()
+
+
+def _get_shared_structures(key: Optional[tuple]) -> _SharedStructures:
+    if key is None:
+        return _SharedStructures()
+    with _shared_structures_lock:
+        shared = _shared_structures.get(key)
+        if shared is None:
+            shared = _shared_structures[key] = _SharedStructures()
+        return shared
 
 
 class PlanqkBackend(BackendV2, ABC):
@@ -57,14 +91,47 @@ class PlanqkBackend(BackendV2, ABC):
                            )
         self._backend_info = backend_info
         self._is_simulator = self.backend_info.type == TYPE.SIMULATOR
-        self._target = self._planqk_backend_to_target()
-        self._configuration = self._planqk_backend_dto_to_configuration()
+        # The target and configuration are built on first access, e.g., not when only the backend info is inspected,
+        # and shared with the other backends having the same class, id and version
+        self._target: Optional[Target] = None
+        self._configuration: Optional[QasmBackendConfiguration] = None
+        self._shared = _get_shared_structures(self._shared_structures_key())
+        self._lazy_init_lock = self._shared.lock
         self._instance = None
 
+    def __reduce__(self):
+        """Pickles the backend as its description and options, e.g., to pass it to another process.
+
+        The target and configuration are rebuilt from the description when the backend is unpickled.
+        """
+        return _restore_backend, (type(self), self._backend_info, self._provider, self.name, self.description,
+                                  self.online_date, self.backend_version, dict(self._options.__dict__))
+
     @property
     def backend_info(self):
         return self._backend_info
 
+    @property
+    def connectivity(self) -> Connectivity:
+        """Qubits of the backend and their coupling, parsed once per backend version."""
+        shared = self._shared
+        connectivity = shared.connectivity
+        if connectivity is None:
+            with shared.lock:
+                if shared.connectivity is None:
+                    shared.connectivity = self._create_connectivity()
+                connectivity = shared.connectivity
+        return connectivity
+
+    def _create_connectivity(self) -> Connectivity:
+        return Connectivity.from_configuration(self.backend_info.configuration)
+
+    def _shared_structures_key(self) -> Optional[tuple]:
+        # Backends without version might have changed, hence, their structures are not shared
+        if self._backend_info.updated_at is None:
+            return None
+        return type(self), self._backend_info.id, self._backend_info.updated_at
+
     @property
     def is_simulator(self):
         return self._is_simulator
@@ -103,7 +170,7 @@ class PlanqkBackend(BackendV2, ABC):
 
         configuration: ConfigurationDto = self.backend_info.configuration
         qubit_count: int = configuration.qubit_count
-        target = Target(description=f"Target for PlanQK actual {self.name}", num_qubits=qubit_count)
+        target = PlanqkTarget(description=f"Target for PlanQK actual {self.name}", num_qubits=qubit_count)
 
         single_qubit_props = self.get_single_qubit_gate_properties()
         multi_qubit_props = self.get_multi_qubit_gate_properties()
@@ -157,7 +224,7 @@ class PlanqkBackend(BackendV2, ABC):
             memory=self.backend_info.configuration.memory_result_supported,
             max_shots=self.backend_info.configuration.shots_range.max,
             coupling_map=self.coupling_map,
-            supported_instructions=self._target.instructions,
+            supported_instructions=self.target.instructions,
             max_experiments=self.backend_info.configuration.shots_range.max,  # Only one circuit is supported per job
             description=self.backend_info.documentation.description,
             min_shots=self.backend_info.configuration.shots_range.min,
@@ -165,7 +232,7 @@ class PlanqkBackend(BackendV2, ABC):
         )
 
     def _get_gate_config_from_target(self, name) -> GateConfig:
-        operations = [operation for operation in self._target.operations
+        operations = [operation for operation in self.target.operations
                       if isinstance(operation.name, str)  # Filters out the IBM conditional instructions having no name
                       and operation.name.casefold() == name.casefold()]
         if len(operations) == 1:
@@ -178,7 +245,26 @@ class PlanqkBackend(BackendV2, ABC):
 
     @property
     def target(self):
-        return self._target
+        target = self._target
+        if target is None:
+            shared = self._shared
+            with shared.lock:
+                if shared.target is None:
+                    shared.target = self._planqk_backend_to_target()
+                target = self._target = shared.target
+        return target
+
+    @property
+    def distance_matrix(self) -> Optional[np.ndarray]:
+        """Returns the distances between all qubits, computed once per backend version, or None if the qubits are
+        not constrained in their connectivity."""
+        return self.target.routing_data.distance_matrix
+
+    @property
+    def connected_components(self) -> List[List[int]]:
+        """Returns the qubits of each connected component of the coupling map, computed once per backend
+        version."""
+        return self.target.routing_data.connected_components
 
     @property
     def max_circuits(self):
@@ -203,10 +289,47 @@ class PlanqkBackend(BackendV2, ABC):
     def convert_to_job_params(self, circuit: QuantumCircuit = None, options=None) -> dict:
         return {}
 
+    def _translatable_operation_names(self, options) -> Optional[FrozenSet[str]]:
+        """Returns the names of the instructions that are not part of the target but translated by the conversion to
+        the job input, or None if the conversion translates any instruction."""
+        return frozenset()
+
+    def _uses_physical_qubits(self, options) -> bool:
+        """Returns whether the qubits of the circuit are executed as the physical qubits of the same indices, i.e.,
+        whether instructions must act on qubits supported by the target."""
+        return True
+
     @abstractmethod
     def get_job_input_format(self) -> INPUT_FORMAT:
         pass
 
+    def transpile_cached(self, circuits: Union[QuantumCircuit, Sequence[QuantumCircuit]],
+                         parameter_binds: Optional[Union[Mapping, Sequence[Mapping]]] = None,
+                         cache: Optional["transpilation.TranspilationCache"] = None,
+                         **transpile_options) -> Union[QuantumCircuit, List[QuantumCircuit]]:
+        """Transpile circuits for the backend, reusing the circuits transpiled before for this backend version.
+
+        Example:
+            ansatz = QuantumCircuit(2)
+            ansatz.ry(theta, 0)
+            ansatz.cx(0, 1)
+            circuits = backend.transpile_cached(ansatz, parameter_binds=[{theta: 0.1}, {theta: 0.2}])
+
+        Args:
+            circuits: circuit or circuits to transpile
+            parameter_binds: parameter values, as mapping or list of mappings from parameters to values. If set, the
+                circuits are transpiled once with their parameters unbound and then bound to each of the mappings.
+            cache: cache of the transpiled circuits, by default the circuits are cached in memory and in the
+                directory set by the environment variable PLANQK_TRANSPILATION_CACHE_DIR or ~/.cache/planqk
+            **transpile_options: options passed to qiskit.transpile, e.g., optimization_level
+
+        Returns:
+            the transpiled circuit if a single circuit without parameter binds is given, otherwise the list of
+            transpiled circuits, for parameter binds ordered by circuit and then by parameter bind
+        """
+        return transpilation.transpile_cached(circuits, self, cache=cache, parameter_binds=parameter_binds,
+                                              **transpile_options)
+
     def run(self, circuit, **kwargs) -> PlanqkJob:
         """Run a circuit on the backend as job.
 
@@ -215,8 +338,27 @@ class PlanqkBackend(BackendV2, ABC):
             **kwargs: additional arguments for the execution (see below)
         Returns:
             PlanqkJob: The job instance for the circuit that was run.
+        Raises:
+            CircuitValidationError: if the circuit is not supported by the backend, can be disabled by passing
+                validate=False
         """
 
+        circuit, shots, options = self._prepare_run(circuit, kwargs)
+
+        with instrumentation.span("run", backend=self.name):
+            if kwargs.get("validate", True):
+                with instrumentation.span("validate", num_instructions=len(circuit.data)):
+                    self.validate_circuit(circuit, shots, options)
+
+            with instrumentation.span("convert_to_job_input", num_qubits=circuit.num_qubits):
+                job_input = self.convert_to_job_input(circuit, options)
+            with instrumentation.span("convert_to_job_params"):
+                input_params = self.convert_to_job_params(circuit, options)
+
+            return self._create_job(job_input, input_params, shots)
+
+    def _prepare_run(self, circuit, kwargs) -> Tuple[QuantumCircuit, int, OptionsV2]:
+        """Returns the circuit to run, the number of shots and a copy of the options updated by the run arguments."""
         if isinstance(circuit, (list, tuple)):
             if len(circuit) > 1:
                 raise ValueError("Multi-experiment jobs are not supported")
@@ -232,20 +374,39 @@ class PlanqkBackend(BackendV2, ABC):
             for field in kwargs:
                 if field in options.data:
                     options[field] = kwargs[field]
+        return circuit, shots, options
 
-        job_input_format = self.get_job_input_format()
-        job_input = self.convert_to_job_input(circuit, options)
-        input_params = self.convert_to_job_params(circuit, options)
-
+    def _create_job(self, job_input, input_params: dict, shots: int) -> PlanqkJob:
+        """Submits the job input as job, returning the created job."""
         job_request = JobDto(backend_id=self.backend_info.id,
                              provider=self.backend_info.provider.name,
-                             input_format=job_input_format,
+                             input_format=self.get_job_input_format(),
                              input=job_input,
                              shots=shots,
                              input_params=input_params)
 
         return PlanqkJob(backend=self, job_details=job_request)
 
+    def validate_circuit(self, circuit: QuantumCircuit, shots: Optional[int] = None, options=None):
+        """Validate the circuit and the number of shots against the target and the supported shots range of the
+        backend, without sending a request.
+
+        Args:
+            circuit: circuit to validate
+            shots: number of shots, not validated if None
+            options: options of the execution, the options of the backend if None
+
+        Raises:
+            CircuitValidationError: describing all violations, if the circuit or the shots are not supported
+        """
+        options = options if options is not None else self.options
+        violations = validation.validate_circuit(circuit, self.target, shots,
+                                                 self.backend_info.configuration.shots_range,
+                                                 self._translatable_operation_names(options),
+                                                 self._uses_physical_qubits(options))
+        if violations:
+            raise CircuitValidationError(violations)
+
     def retrieve_job(self, job_id: str) -> PlanqkJob:
         """Return a single job.
 
@@ -263,9 +424,24 @@ class PlanqkBackend(BackendV2, ABC):
         Returns:
             QasmBackendConfiguration: the configuration for the actual.
         """
-        return self._configuration
+        configuration = self._configuration
+        if configuration is None:
+            shared = self._shared
+            with shared.lock:
+                if shared.configuration is None:
+                    shared.configuration = self._planqk_backend_dto_to_configuration()
+                configuration = self._configuration = shared.configuration
+        return configuration
 
     @property
     def backend_provider(self) -> PROVIDER:
         """Return the provider offering the quantum backend resource."""
         return self.backend_info.provider
+
+
+def _restore_backend(backend_cls, backend_info: BackendDto, provider: Optional[Provider], name: str,
+                     description: str, online_date, backend_version: str, options: dict) -> PlanqkBackend:
+    backend = backend_cls(backend_info=backend_info, provider=provider, name=name, description=description,
+                          online_date=online_date, backend_version=backend_version)
+    backend._options.update_options(**options)
+    return backend
@@ -2,18 +2,27 @@ import json
 import logging
 import os
 import random
-from typing import List, Optional, Callable, Any, Dict
+import time
+import warnings
+from datetime import timedelta
+from typing import Callable, List, Optional, Any, Dict, Union
 
 import requests
-from requests import Response, HTTPError
+from requests import HTTPError, Response
 
 from planqk.context import ContextResolver
 from planqk.credentials import DefaultCredentialsProvider
 from planqk.exceptions import InvalidAccessTokenError, PlanqkClientError, PlanqkError
+from planqk.qiskit import instrumentation, metrics, tracing
 from planqk.qiskit.client.backend_dtos import BackendDto, PROVIDER, BackendStateInfosDto
+from planqk.qiskit.client.compression import GZIP, RequestCompression, StreamedBody
+from planqk.qiskit.client import serialization
+from planqk.qiskit.client.serialization import PreEncodedJson, StreamedJson
 from planqk.qiskit.client.job_dtos import JobDto
-
-HEADER_CLOUD_TRACE_CTX = "x-cloud-trace-context"
+from planqk.qiskit.client.payload_formats import PayloadFormat, JSON, get_payload_format, payload_format_of
+from planqk.qiskit.client.single_flight import SingleFlight
+from planqk.qiskit.client.transport import HttpTransport, RequestsTransport
+from planqk.qiskit.tracing import HEADER_CLOUD_TRACE_CTX
 
 logger = logging.getLogger(__name__)
 
@@ -34,9 +43,36 @@ def _dict_values_to_string(obj_values_dict: dict):
             obj_values_dict[key] = str_value
 
 
+def _record_response(request_span, body: Optional[bytes], response):
+    """Adds the status, the sizes and the durations of the phases of an HTTP request to its span."""
+    if not isinstance(request_span, instrumentation.Span):
+        return
+    request_span.set_attribute("status_code", response.status_code)
+    if not isinstance(body, StreamedBody):
+        # The size of streamed bodies is not known
+        request_span.set_attribute("bytes_sent", len(body) if body is not None else 0)
+    if isinstance(response.content, bytes):
+        request_span.set_attribute("bytes_received", len(response.content))
+
+    timings = getattr(response, "timings", None)
+    if not isinstance(timings, dict):
+        # requests measures the time until the response headers were parsed
+        elapsed = getattr(response, "elapsed", None)
+        timings = {"ttfb": elapsed.total_seconds()} if isinstance(elapsed, timedelta) else {}
+    for phase, duration in timings.items():
+        request_span.set_attribute(phase, duration)
+    if "ttfb" in timings:
+        request_span.set_attribute("download", max(time.perf_counter() - request_span.start - timings["ttfb"], 0.0))
+
+
 class _PlanqkClient(object):
     _credentials = None
+    _organization_id: Optional[str] = None
     _context_resolver: ContextResolver = None
+    _single_flight = SingleFlight()
+    _transport: HttpTransport = RequestsTransport()
+    _request_compression: Optional[RequestCompression] = None
+    _payload_format: PayloadFormat = JSON
 
     @classmethod
     def set_credentials(cls, credentials: DefaultCredentialsProvider):
@@ -51,60 +87,202 @@ class _PlanqkClient(object):
         cls._organization_id = organization_id
 
     @classmethod
-    def perform_request(cls, request_func: Callable[..., Response], url: str, params=None, data=None, headers=None):
+    def set_transport(cls, transport: HttpTransport):
+        """Sets the transport used to send requests to PlanQK, e.g., an HttpxTransport multiplexing requests over
+        HTTP/2. The previous transport is closed.
+        """
+        previous_transport = cls._transport
+        cls._transport = transport
+        if previous_transport is not transport:
+            previous_transport.close()
+
+    @classmethod
+    def get_transport(cls) -> HttpTransport:
+        return cls._transport
+
+    @classmethod
+    def set_coalescing_window(cls, seconds: float):
+        """Sets the time in seconds the result of a coalesced GET request is shared with subsequent identical requests.
+
+        Concurrent identical requests for jobs, backends and backend states are always coalesced into a single
+        request. A window of 0 (default) shares results only among callers waiting for the same in-flight request.
+        """
+        cls._single_flight.window = seconds
+        if seconds <= 0:
+            cls._single_flight.clear()
+
+    @classmethod
+    def set_request_compression(cls, encoding: Optional[str] = GZIP, level: Optional[int] = None,
+                                min_size: int = 1024):
+        """Enables the compression of request bodies, e.g., circuits submitted as jobs.
+
+        Args:
+            encoding: content encoding used for request bodies ("gzip" or "zstd"), None disables compression
+            level: compression level, defaults to a level suited for large payloads
+            min_size: minimum size in bytes of a request body to be compressed
+        """
+        cls._request_compression = RequestCompression(encoding, level, min_size) if encoding is not None else None
+
+    @classmethod
+    def set_payload_format(cls, name: Optional[str] = "msgpack"):
+        """Sets the format of job payloads, i.e., of submitted jobs as well as of retrieved jobs and job results.
+
+        Binary formats ("msgpack" or "cbor") encode large numeric payloads more compactly than JSON. They are
+        negotiated with the server: responses are decoded according to their content type and if the server rejects a
+        binary job submission, the job is submitted again as JSON. The configured format is kept for later requests.
+
+        Args:
+            name: "msgpack", "cbor" or "json". None resets the format to JSON.
+
+        Raises:
+            PlanqkError: if the format is unknown or the package it requires is not installed
+        """
+        cls._payload_format = get_payload_format(name) if name is not None else JSON
+
+    @classmethod
+    def _payload_headers(cls, headers: Optional[dict] = None) -> dict:
+        """Adds an Accept header preferring the binary payload format, if set, over JSON."""
+        headers = dict(headers or {})
+        if cls._payload_format is not JSON:
+            headers["accept"] = f"{cls._payload_format.content_type}, application/json;q=0.9"
+        return headers
+
+    @classmethod
+    def perform_request(cls, method: Union[str, Callable[..., Response]], url: str, params=None, data=None,
+                        headers=None):
+        """Sends a request with the configured transport and returns the decoded response body.
+
+        Args:
+            method: HTTP method, e.g., "get". Passing a request function of ``requests``, e.g., ``requests.get``, is
+                deprecated.
+        """
+        if callable(method):
+            warnings.warn("Passing a request function to perform_request is deprecated, pass the HTTP method instead, "
+                          "e.g., 'get' instead of requests.get.", DeprecationWarning, stacklevel=2)
+            method = method.__name__
         headers = {**cls._get_default_headers(), **(headers or {})}
         debug = os.environ.get("PLANQK_QUANTUM_DEBUG", "false").lower() == "true"
 
         trace_id = headers.get(HEADER_CLOUD_TRACE_CTX, 'unknown')
         try:
-            response = request_func(url, json=data, params=params, headers=headers, verify=not debug)
+            body = data if data is None or isinstance(data, (bytes, StreamedBody)) else serialization.dumps(data)
+            with instrumentation.span("http_request", method=method.upper(), url=url) as request_span:
+                headers = tracing.inject_trace_context(headers)
+                trace_id = headers.get(HEADER_CLOUD_TRACE_CTX, 'unknown')
+                response = cls._send_request_measured(method, url, params, body, headers, verify=not debug)
+                _record_response(request_span, body, response)
             response.raise_for_status()
-            return response.json() if response.status_code != 204 else None
+            if response.status_code == 204:
+                return None
+            with instrumentation.span("decode_response"):
+                return cls._decode_response(response)
         except requests.exceptions.ConnectionError as e:
             logger.error(f"Cannot connect to middleware under {url} (Trace {trace_id}): {e}")
             raise e
         except HTTPError as e:
-            logger.error(f"Request {request_func.__name__} {url} failed (Trace {trace_id}): {e}")
+            logger.error(f"Request {method.upper()} {url} failed (Trace {trace_id}): {e}")
             if e.response.status_code == 401:
                 raise InvalidAccessTokenError
             else:
                 raise PlanqkClientError(e.response)
         except Exception as e:
-            logger.error(f"Request {request_func.__name__} {url} failed (Trace {trace_id}): {e}")
+            logger.error(f"Request {method.upper()} {url} failed (Trace {trace_id}): {e}")
             raise PlanqkError("Error while performing request") from e
 
+    @classmethod
+    def _send_request_measured(cls, method: str, url: str, params, body: Optional[bytes], headers: dict, verify: bool):
+        """Sends the request and records its status, duration and response size in the SDK metrics."""
+        if not metrics.is_enabled():
+            return cls._send_request(method, url, params, body, headers, verify)
+
+        metrics.HTTP_REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        status = "connection_error"
+        response_size = None
+        try:
+            response = cls._send_request(method, url, params, body, headers, verify)
+            status = response.status_code
+            response_size = len(response.content) if isinstance(response.content, bytes) else None
+            return response
+        finally:
+            metrics.HTTP_REQUESTS_IN_FLIGHT.dec()
+            metrics.record_http_request(method, url, status, time.perf_counter() - start, response_size)
+
+    @staticmethod
+    def _decode_response(response):
+        payload_format = payload_format_of(response.headers.get("content-type"))
+        if payload_format is not None:
+            return payload_format.decode(response.content)
+        return response.json()
+
+    @classmethod
+    def _send_request(cls, method: str, url: str, params, body: Optional[bytes], headers: dict, verify: bool):
+        """Sends the request body compressed if request compression is enabled.
+
+        If the server does not support the content encoding, i.e., it responds with HTTP status 415 and an
+        Accept-Encoding header, the encoding is renegotiated and the request is sent again.
+        """
+        compression = cls._request_compression
+        while True:
+            request_headers = headers
+            request_body = body
+            if compression is not None and compression.enabled:
+                request_body, content_encoding = compression.compress(body)
+                if content_encoding is not None:
+                    request_headers = {**headers, "content-encoding": content_encoding}
+
+            response = cls._transport.request(method, url, params=params, data=request_body, headers=request_headers,
+                                              verify=verify)
+
+            # Per RFC 7694, servers rejecting the content encoding list the encodings they accept. Other 415
+            # responses, e.g., rejecting the content type, are handled by the caller.
+            if (response.status_code != 415 or request_headers is headers
+                    or "accept-encoding" not in response.headers):
+                return response
+
+            logger.info(f"Server rejected request body encoded with {compression.encoding}, renegotiating encoding")
+            compression.negotiate(response.headers.get("accept-encoding"))
+
     @classmethod
     def get_backends(cls) -> List[BackendDto]:
         headers = {}
         params = {"onlyQiskit": True}
 
-        response = cls.perform_request(requests.get, f"{base_url()}/backends", params=params, headers=headers)
+        response = cls.perform_request("get", f"{base_url()}/backends", params=params, headers=headers)
 
-        return [BackendDto(**backend_info) for backend_info in response]
+        with instrumentation.span("parse_dto", dto=BackendDto.__name__):
+            return [BackendDto(**backend_info) for backend_info in response]
 
     @classmethod
     def get_backend(cls, backend_id: str) -> BackendDto:
-        headers = {}
-
-        response = cls.perform_request(requests.get, f"{base_url()}/backends/{backend_id}", headers=headers)
-        return BackendDto(**response)
+        return cls._perform_coalesced_get(f"{base_url()}/backends/{backend_id}", BackendDto)
 
     @classmethod
     def get_backend_state(cls, backend_id: str) -> BackendStateInfosDto:
-        headers = {}
-
-        response = cls.perform_request(requests.get, f"{base_url()}/backends/{backend_id}/status", headers=headers)
-        return BackendStateInfosDto(**response)
+        return cls._perform_coalesced_get(f"{base_url()}/backends/{backend_id}/status", BackendStateInfosDto)
 
     @classmethod
     def submit_job(cls, job: JobDto) -> JobDto:
-        headers = {"content-type": "application/json"}
-
-        # Create dict from job object and remove attributes with None values from it
-        job_dict = cls.remove_none_values(job.__dict__)
-
-        response = cls.perform_request(requests.post, f"{base_url()}/jobs", data=job_dict, headers=headers)
-        return JobDto(**response)
+        payload_format = cls._payload_format
+        if payload_format is not JSON and not isinstance(job.input, (PreEncodedJson, StreamedJson)):
+            headers = cls._payload_headers({"content-type": payload_format.content_type})
+            try:
+                with instrumentation.span("encode_payload", format=payload_format.name):
+                    body = payload_format.serialize_job(job)
+                response = cls.perform_request("post", f"{base_url()}/jobs", data=body, headers=headers)
+                return cls._parse_dto(JobDto, response)
+            except PlanqkClientError as e:
+                if e.response.status_code != 415:
+                    raise e
+                logger.info(f"Server does not accept {payload_format.name} payloads, submitting the job as JSON")
+
+        headers = cls._payload_headers({"content-type": "application/json"})
+
+        with instrumentation.span("encode_payload", format=JSON.name):
+            body = serialization.serialize_job(job)
+
+        response = cls.perform_request("post", f"{base_url()}/jobs", data=body, headers=headers)
+        return cls._parse_dto(JobDto, response)
 
     @classmethod
     def get_job(cls, job_id: str, provider: Optional[PROVIDER] = None) -> JobDto:
@@ -112,13 +290,14 @@ class _PlanqkClient(object):
         if provider is not None:
             params["provider"] = provider.name
 
-        response = cls.perform_request(requests.get, f"{base_url()}/jobs/{job_id}", params=params)
-        return JobDto(**response)
+        return cls._perform_coalesced_get(f"{base_url()}/jobs/{job_id}", JobDto, params=params,
+                                          headers=cls._payload_headers())
 
     @classmethod
     def get_jobs(cls) -> List[JobDto]:
-        response = cls.perform_request(requests.get, f"{base_url()}/jobs")
-        return [JobDto(**job_info) for job_info in response]
+        response = cls.perform_request("get", f"{base_url()}/jobs")
+        with instrumentation.span("parse_dto", dto=JobDto.__name__):
+            return [JobDto(**job_info) for job_info in response]
 
     @classmethod
     def get_job_result(cls, job_id: str, provider: Optional[PROVIDER] = None) -> Dict[str, Any]:
@@ -126,7 +305,8 @@ class _PlanqkClient(object):
         if provider is not None:
             params["provider"] = provider.name
 
-        response = cls.perform_request(requests.get, f"{base_url()}/jobs/{job_id}/result", params=params)
+        response = cls.perform_request("get", f"{base_url()}/jobs/{job_id}/result", params=params,
+                                       headers=cls._payload_headers())
         return response
 
     @classmethod
@@ -135,10 +315,37 @@ class _PlanqkClient(object):
         if provider is not None:
             params["provider"] = provider.name
 
-        cls.perform_request(requests.delete, f"{base_url()}/jobs/{job_id}", params=params)
+        cls.perform_request("delete", f"{base_url()}/jobs/{job_id}", params=params)
+
+    @classmethod
+    def _perform_coalesced_get(cls, url: str, dto_cls, params=None, headers=None):
+        """Performs an idempotent GET request and decodes the response into a DTO.
+
+        Identical requests running concurrently, i.e., requests for the same URL and parameters sent with the same
+        access token and organization, share a single HTTP request. The decoded DTO is kept private and every caller
+        receives a deep copy so that it can modify it, including its nested DTOs, without affecting other callers.
+        """
+        identity = cls._get_default_headers()
+        key = (url, tuple(sorted(params.items())) if params else (), identity.get("x-auth-token"),
+               identity.get("x-organizationid"))
+
+        def request():
+            response = cls.perform_request("get", url, params=params, headers=headers)
+            return cls._parse_dto(dto_cls, response)
+
+        dto, _ = cls._single_flight.do(key, request)
+        return dto.model_copy(deep=True)
+
+    @staticmethod
+    def _parse_dto(dto_cls, response):
+        with instrumentation.span("parse_dto", dto=dto_cls.__name__):
+            return dto_cls(**response)
 
     @classmethod
     def _get_default_headers(cls):
+        if cls._credentials is None:
+            # E.g., in a process that unpickled a backend, the credentials are resolved from the environment
+            cls._credentials = DefaultCredentialsProvider()
         headers = {"x-auth-token": cls._credentials.get_access_token()}
 
         # inject service execution if present
@@ -162,9 +369,7 @@ class _PlanqkClient(object):
 
     @classmethod
     def remove_none_values(cls, d):
-        if not isinstance(d, dict):
-            return d
-        return {k: cls.remove_none_values(v) for k, v in d.items() if v is not None}
+        return serialization.remove_none_values(d)
 
     @classmethod
     def _generate_trace_id(cls):
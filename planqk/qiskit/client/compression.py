@@ -0,0 +1,152 @@
+import gzip
+import zlib
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+GZIP = "gzip"
+ZSTD = "zstd"
+
+_DEFAULT_LEVELS = {
+    # Lower gzip levels are considerably faster on multi-MB payloads while still shrinking JSON several-fold
+    GZIP: 5,
+    ZSTD: 3,
+}
+
+
+class StreamedBody(object):
+    """Request body sent chunk by chunk, i.e., with chunked transfer encoding.
+
+    The chunks are produced anew each time the body is iterated, hence, a request can be sent again, e.g., after the
+    content encoding of the request was renegotiated.
+    """
+
+    def __init__(self, chunks: Callable[[], Iterable[bytes]]):
+        """
+        Args:
+            chunks: function returning the chunks of the body
+        """
+        self._chunks = chunks
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self._chunks())
+
+    def to_bytes(self) -> bytes:
+        return b"".join(self)
+
+
+def _zstandard():
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        return None
+
+
+def available_encodings() -> List[str]:
+    """Returns the content encodings supported in this environment, ordered by preference.
+
+    zstd requires the optional ``zstandard`` package.
+    """
+    return [ZSTD, GZIP] if _zstandard() is not None else [GZIP]
+
+
+def compress(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    level = _DEFAULT_LEVELS[encoding] if level is None else level
+    if encoding == GZIP:
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    if encoding == ZSTD:
+        zstandard = _zstandard()
+        if zstandard is None:
+            raise ValueError("zstd compression requires the zstandard package")
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    raise ValueError(f"Unsupported content encoding '{encoding}'")
+
+
+def compress_chunks(chunks: Iterable[bytes], encoding: str, level: Optional[int] = None) -> Iterator[bytes]:
+    """Compresses a body chunk by chunk, e.g., while it is sent, without holding the whole body in memory."""
+    level = _DEFAULT_LEVELS[encoding] if level is None else level
+    if encoding == GZIP:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    elif encoding == ZSTD:
+        zstandard = _zstandard()
+        if zstandard is None:
+            raise ValueError("zstd compression requires the zstandard package")
+        compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    else:
+        raise ValueError(f"Unsupported content encoding '{encoding}'")
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def decompress(data: bytes, encoding: Optional[str]) -> bytes:
+    """Decodes data according to the value of a Content-Encoding header."""
+    if not encoding or encoding == "identity":
+        return data
+    if encoding in {GZIP, "x-gzip"}:
+        # wbits 16 + MAX_WBITS expects a gzip header and avoids the overhead of the gzip file object
+        return zlib.decompress(data, 16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        return zlib.decompress(data)
+    if encoding == ZSTD:
+        zstandard = _zstandard()
+        if zstandard is None:
+            raise ValueError("zstd decompression requires the zstandard package")
+        # Frames written by streaming compressors do not declare their content size, which decompressobj supports
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    raise ValueError(f"Unsupported content encoding '{encoding}'")
+
+
+class RequestCompression(object):
+    """Compression of request bodies, negotiated with the server.
+
+    Bodies smaller than ``min_size`` bytes are sent as is. If the server rejects a compressed body with HTTP status
+    415 (Unsupported Media Type), the encodings it accepts are taken from its Accept-Encoding response header
+    (RFC 7694). If none of them is available, compression is disabled.
+    """
+
+    def __init__(self, encoding: str = GZIP, level: Optional[int] = None, min_size: int = 1024):
+        if encoding not in available_encodings():
+            raise ValueError(f"Content encoding '{encoding}' is not available, "
+                             f"supported encodings: {', '.join(available_encodings())}")
+        self.encoding = encoding
+        self.level = level
+        self.min_size = min_size
+        self._rejected = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.encoding is not None
+
+    def compress(self, body: Union[bytes, StreamedBody]) -> Tuple[Union[bytes, StreamedBody], Optional[str]]:
+        """Compresses the body if it is large enough. Streamed bodies are compressed while they are sent, they are
+        assumed to be large.
+
+        Returns:
+            tuple of the body to be sent and its content encoding, or None if it was not compressed
+        """
+        if not self.enabled or body is None:
+            return body, None
+        if isinstance(body, StreamedBody):
+            encoding, level = self.encoding, self.level
+            return StreamedBody(lambda: compress_chunks(body, encoding, level)), encoding
+        if len(body) < self.min_size:
+            return body, None
+        return compress(body, self.encoding, self.level), self.encoding
+
+    def negotiate(self, accept_encoding: Optional[str]) -> bool:
+        """Selects an encoding accepted by the server after it rejected the current one.
+
+        Args:
+            accept_encoding: value of the Accept-Encoding header of the rejecting response
+
+        Returns:
+            True if another encoding was selected, False if compression was disabled
+        """
+        self._rejected.add(self.encoding)
+        accepted = [coding.split(";")[0].strip().lower() for coding in (accept_encoding or "").split(",")]
+        candidates = [coding for coding in available_encodings() if coding in accepted and coding not in self._rejected]
+        self.encoding = candidates[0] if candidates else None
+        self.level = None
+        return self.enabled
@@ -2,7 +2,9 @@ import json
 from enum import Enum
 from typing import Optional, Dict, Set, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from planqk.qiskit.client.serialization import PreEncodedJson, StreamedJson
 
 
 class INPUT_FORMAT(str, Enum):
@@ -23,12 +25,14 @@ class JOB_STATUS(str, Enum):
 
 
 class JobDto(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     provider: str
     shots: int = 1
     backend_id: str = None
     id: Optional[str] = None
     session_id: Optional[str] = None
-    input: Optional[Union[str, Dict]] = None
+    input: Optional[Union[str, Dict, PreEncodedJson, StreamedJson]] = None
     input_format: Optional[INPUT_FORMAT] = None
     input_params: Optional[Dict] = None
     begin_execution_time: Optional[str] = None
@@ -0,0 +1,119 @@
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Optional
+
+from planqk.exceptions import PlanqkError
+from planqk.qiskit.client import serialization
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+CBOR_CONTENT_TYPE = "application/cbor"
+
+
+class PayloadFormat(ABC):
+    """Encoding of request and response bodies exchanged with PlanQK."""
+
+    name: str = None
+    content_type: str = None
+    # Content types of responses recognized as this format
+    content_types = ()
+
+    @abstractmethod
+    def encode(self, obj: Any) -> bytes:
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        pass
+
+    def serialize_job(self, job) -> bytes:
+        """Serializes a job for its submission, omitting attributes with None values."""
+        envelope = serialization.job_envelope(job)
+        if job.input is not None:
+            envelope["input"] = job.input
+        return self.encode(envelope)
+
+
+class JsonFormat(PayloadFormat):
+    name = "json"
+    content_type = JSON_CONTENT_TYPE
+
+    def encode(self, obj):
+        return serialization.dumps(obj)
+
+    def decode(self, data):
+        return serialization.loads(data)
+
+    def serialize_job(self, job):
+        return serialization.serialize_job(job)
+
+
+class MsgpackFormat(PayloadFormat):
+    """MessagePack encoding, requires the ``msgpack`` package."""
+    name = "msgpack"
+    content_type = MSGPACK_CONTENT_TYPE
+    content_types = (MSGPACK_CONTENT_TYPE, "application/x-msgpack", "application/vnd.msgpack")
+
+    def __init__(self):
+        import msgpack
+        self._msgpack = msgpack
+
+    def encode(self, obj):
+        return self._msgpack.packb(obj, default=serialization.default, use_bin_type=True)
+
+    def decode(self, data):
+        return self._msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+class CborFormat(PayloadFormat):
+    """CBOR encoding, requires the ``cbor2`` package."""
+    name = "cbor"
+    content_type = CBOR_CONTENT_TYPE
+    content_types = (CBOR_CONTENT_TYPE,)
+
+    def __init__(self):
+        import cbor2
+        self._cbor2 = cbor2
+
+    def encode(self, obj):
+        return self._cbor2.dumps(obj, default=lambda encoder, value: encoder.encode(serialization.default(value)))
+
+    def decode(self, data):
+        return self._cbor2.loads(data)
+
+
+JSON = JsonFormat()
+
+_BINARY_FORMATS = {
+    MsgpackFormat.name: MsgpackFormat,
+    CborFormat.name: CborFormat,
+}
+
+
+@lru_cache(maxsize=None)
+def get_payload_format(name: str) -> PayloadFormat:
+    """Returns the payload format with the given name, i.e., "json", "msgpack" or "cbor".
+
+    Raises:
+        PlanqkError: if the format is unknown or the package it requires is not installed
+    """
+    if name == JSON.name:
+        return JSON
+    format_cls = _BINARY_FORMATS.get(name)
+    if format_cls is None:
+        raise PlanqkError(f"Unknown payload format '{name}', supported formats: json, {', '.join(_BINARY_FORMATS)}")
+    try:
+        return format_cls()
+    except ImportError as e:
+        raise PlanqkError(f"Payload format '{name}' requires the {e.name} package.") from e
+
+
+def payload_format_of(content_type: Optional[str]) -> Optional[PayloadFormat]:
+    """Returns the binary payload format of a Content-Type header value, or None for other content types."""
+    if not isinstance(content_type, str):
+        return None
+    media_type = content_type.split(";")[0].strip().lower()
+    for name, format_cls in _BINARY_FORMATS.items():
+        if media_type in format_cls.content_types:
+            return get_payload_format(name)
+    return None
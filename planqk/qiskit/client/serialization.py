@@ -0,0 +1,127 @@
+import json
+import math
+from datetime import date, time
+from enum import Enum
+from itertools import chain
+from typing import Any, Union
+
+from planqk.qiskit.client.compression import StreamedBody
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class PreEncodedJson(bytes):
+    """JSON value that is already encoded, e.g., a job input serialized in advance.
+
+    It is embedded into request bodies byte by byte without being parsed or encoded again.
+    """
+
+    @classmethod
+    def encode(cls, obj: Any) -> "PreEncodedJson":
+        return cls(dumps(obj))
+
+
+class StreamedJson(StreamedBody):
+    """JSON value encoded chunk by chunk while the request body is sent, e.g., a large circuit converted during its
+    upload without holding its encoding in memory."""
+
+
+def default(obj: Any) -> Any:
+    """Converts objects not natively supported by the payload encoders."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    if isinstance(obj, PreEncodedJson):
+        return loads(obj)
+    if isinstance(obj, StreamedJson):
+        return loads(obj.to_bytes())
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not serializable")
+
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson is not None else None
+
+
+def dumps(obj: Any) -> bytes:
+    """Encodes an object as compact UTF-8 JSON, using orjson if it is installed.
+
+    Raises:
+        ValueError: if the object contains NaN or infinite floats, which cannot be represented in JSON
+    """
+    if orjson is None:
+        return json.dumps(obj, default=default, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+    encoded = orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS)
+    # orjson encodes non-finite floats as null, hence, they can only be contained if the encoding contains null
+    if b"null" in encoded:
+        _check_finite(obj)
+    return encoded
+
+
+def loads(data) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _check_finite(obj: Any):
+    """Raises a ValueError like the json module if the object contains NaN or infinite floats."""
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                raise ValueError(f"Out of range float values are not JSON compliant: {value!r}")
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            stack.extend(value)
+        elif getattr(getattr(value, "dtype", None), "kind", None) in ("f", "c"):
+            # NumPy arrays and scalars
+            import numpy as np
+            if not np.isfinite(value).all():
+                raise ValueError("Out of range float values are not JSON compliant")
+
+
+def remove_none_values(d):
+    """Returns a copy of the dict and its nested dicts without the entries having None values."""
+    if not isinstance(d, dict):
+        return d
+    return {k: remove_none_values(v) for k, v in d.items() if v is not None}
+
+
+def serialize_job(job) -> Union[bytes, StreamedJson]:
+    """Serializes a job into the JSON body of a job submission.
+
+    Attributes with None values are excluded. In contrast to the other attributes, the job input is neither copied nor
+    cleaned from None values as it may be large, e.g., a circuit with hundreds of thousands of operations. Pre-encoded
+    inputs are embedded as they are, streamed inputs are streamed as part of the body.
+
+    Args:
+        job: the JobDto to be serialized
+
+    Returns:
+        UTF-8 encoded JSON, streamed if the job input is streamed
+    """
+    envelope = job_envelope(job)
+    job_input = job.input
+    if not isinstance(job_input, (PreEncodedJson, StreamedJson)):
+        if job_input is not None:
+            envelope["input"] = job_input
+        return dumps(envelope)
+
+    encoded_envelope = dumps(envelope)
+    separator = b"," if envelope else b""
+    prefix = b"".join((encoded_envelope[:-1], separator, b'"input":'))
+    if isinstance(job_input, StreamedJson):
+        return StreamedJson(lambda: chain((prefix,), job_input, (b"}",)))
+    return b"".join((prefix, job_input, b"}"))
+
+
+def job_envelope(job) -> dict:
+    """Returns the attributes of a job except for its input, omitting None values."""
+    return {name: remove_none_values(value) for name, value in job.__dict__.items()
+            if value is not None and name != "input"}
@@ -0,0 +1,85 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+# Number of completed calls kept for result sharing before expired ones are purged
+_PURGE_THRESHOLD = 256
+
+
+class _Call(object):
+    __slots__ = ("done", "result", "error", "finished_at")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.finished_at = None
+
+
+class SingleFlight(object):
+    """Coalesces concurrent calls having the same key into a single execution.
+
+    The first caller of a key executes the function while all callers arriving in the meantime wait for it and share
+    its outcome, i.e., its result or its exception. If a sharing window is set, successful results are also handed out
+    to callers arriving up to ``window`` seconds after the execution has finished.
+    """
+
+    def __init__(self, window: float = 0.0):
+        self.window = window
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Executes ``func`` unless a call with the same key is in flight or its result can still be shared.
+
+        Args:
+            key: key identifying identical calls
+            func: function performing the call
+
+        Returns:
+            tuple of the result and a flag that is True if the result was shared from another caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None and call.done.is_set() and not self._is_shareable(call):
+                del self._calls[key]
+                call = None
+            leader = call is None
+            if leader:
+                if len(self._calls) >= _PURGE_THRESHOLD:
+                    self._purge_expired()
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            call.finished_at = time.monotonic()
+            with self._lock:
+                if (call.error is not None or self.window <= 0) and self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+
+        return call.result, False
+
+    def clear(self):
+        """Drops all results kept for sharing."""
+        with self._lock:
+            self._calls = {key: call for key, call in self._calls.items() if not call.done.is_set()}
+
+    def _is_shareable(self, call: _Call) -> bool:
+        return call.error is None and time.monotonic() - call.finished_at < self.window
+
+    def _purge_expired(self):
+        expired = [key for key, call in self._calls.items() if call.done.is_set() and not self._is_shareable(call)]
+        for key in expired:
+            del self._calls[key]
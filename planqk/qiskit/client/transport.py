@@ -0,0 +1,201 @@
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import requests
+from requests import HTTPError
+from requests.structures import CaseInsensitiveDict
+
+from planqk.exceptions import PlanqkError
+from planqk.qiskit import instrumentation
+from planqk.qiskit.client.compression import StreamedBody, available_encodings, decompress
+
+
+class TransportResponse(object):
+    """Response returned by transports not based on ``requests``.
+
+    It provides the subset of the ``requests.Response`` interface used by the PlanQK client so that all transports
+    are handled the same way, e.g., ``raise_for_status`` raises a ``requests.HTTPError``.
+    """
+
+    def __init__(self, status_code: int, headers: Optional[Dict[str, str]] = None, content: bytes = b"",
+                 url: str = None, elapsed: timedelta = None, timings: Optional[Dict[str, float]] = None):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.content = content
+        self.url = url
+        self.elapsed = elapsed or timedelta()
+        # Durations in seconds of the phases of the request measured by the transport, e.g., "connect" and "ttfb"
+        self.timings = timings or {}
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8") if self.content else ""
+
+    @property
+    def reason(self) -> str:
+        return "Error" if self.status_code >= 400 else "OK"
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if 400 <= self.status_code < 600:
+            raise HTTPError(f"{self.status_code} {self.reason} for url: {self.url}", response=self)
+
+
+class HttpTransport(ABC):
+    """Sends the HTTP requests of the PlanQK client."""
+
+    @abstractmethod
+    def request(self, method: str, url: str, params: Optional[Dict] = None, json: Any = None,
+                data: Optional[bytes] = None, headers: Optional[Dict[str, str]] = None, verify: bool = True):
+        """Sends an HTTP request.
+
+        Args:
+            method: lower case HTTP method, e.g., "get"
+            url: request url
+            params: query parameters
+            json: JSON-serializable request body
+            data: raw request body, mutually exclusive with json. Streamed bodies are sent with chunked transfer
+                encoding.
+            headers: request headers
+            verify: whether to verify the TLS certificate of the server
+
+        Returns:
+            response providing the ``requests.Response`` interface used by the client
+
+        Raises:
+            requests.exceptions.ConnectionError: if the server cannot be reached
+        """
+        pass
+
+    def close(self):
+        """Releases the connections held by the transport."""
+        pass
+
+
+class RequestsTransport(HttpTransport):
+    """Default transport sending each request with ``requests``."""
+
+    def request(self, method, url, params=None, json=None, data=None, headers=None, verify=True):
+        request_func = getattr(requests, method)
+        return request_func(url, json=json, data=data, params=params, headers=headers, verify=verify)
+
+
+class HttpxTransport(HttpTransport):
+    """Transport based on ``httpx`` multiplexing concurrent requests over HTTP/2 connections.
+
+    All threads share the same client and thus its connection pool. With HTTP/2, hundreds of concurrent requests,
+    e.g., job status polls, are sent as streams of a single connection instead of opening a socket each.
+    Requires the ``httpx`` package with HTTP/2 support (``pip install planqk-quantum[http2]``).
+    """
+
+    def __init__(self, http2: bool = True, max_connections: Optional[int] = None, timeout: Optional[float] = None,
+                 client=None):
+        try:
+            import httpx
+        except ImportError as e:
+            raise PlanqkError("HttpxTransport requires httpx. Install it with 'pip install httpx[http2]'.") from e
+
+        self._httpx = httpx
+        self._http2 = http2
+        self._limits = httpx.Limits(max_connections=max_connections)
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        # httpx configures certificate verification per client, hence one client is kept per verification mode
+        self._clients = {} if client is None else {True: client, False: client}
+
+    def _get_client(self, verify: bool):
+        client = self._clients.get(verify)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(verify)
+                if client is None:
+                    client = self._httpx.Client(http2=self._http2, verify=verify, limits=self._limits,
+                                                timeout=self._timeout)
+                    self._clients[verify] = client
+        return client
+
+    def request(self, method, url, params=None, json=None, data=None, headers=None, verify=True):
+        client = self._get_client(verify)
+        tracer = _HttpxTracer() if instrumentation.is_enabled() else None
+        try:
+            response = client.request(method.upper(), url, params=params, json=json, content=data, headers=headers,
+                                      extensions={"trace": tracer} if tracer is not None else None)
+        except self._httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+
+        try:
+            elapsed = response.elapsed
+        except RuntimeError:
+            # Responses of custom httpx transports, e.g., mock transports, do not track the elapsed time
+            elapsed = None
+        return TransportResponse(status_code=response.status_code, headers=dict(response.headers),
+                                 content=response.content, url=str(response.url), elapsed=elapsed,
+                                 timings=tracer.timings() if tracer is not None else None)
+
+    def close(self):
+        with self._lock:
+            for client in set(self._clients.values()):
+                client.close()
+            self._clients = {}
+
+
+class _HttpxTracer(object):
+    """Records the time of the connection and the response headers using the trace extension of httpx."""
+
+    _CONNECTED_EVENTS = {"connection.connect_tcp.complete", "connection.start_tls.complete"}
+    _HEADERS_EVENTS = {"http11.receive_response_headers.complete", "http2.receive_response_headers.complete"}
+
+    def __init__(self):
+        self._start = time.perf_counter()
+        self._connected = None
+        self._headers_received = None
+
+    def __call__(self, event_name: str, info: dict):
+        if event_name in self._CONNECTED_EVENTS:
+            self._connected = time.perf_counter()
+        elif event_name in self._HEADERS_EVENTS:
+            self._headers_received = time.perf_counter()
+
+    def timings(self) -> Dict[str, float]:
+        timings = {}
+        if self._connected is not None:
+            timings["connect"] = self._connected - self._start
+        if self._headers_received is not None:
+            timings["ttfb"] = self._headers_received - self._start
+        return timings
+
+
+class InProcessTransport(HttpTransport):
+    """Transport passing requests to a handler function in the same process, e.g., for tests and benchmarks.
+
+    The handler is called with the method, url, query parameters, headers and the encoded request body and returns
+    the status code, the response headers and the encoded response body. Like HTTP transports, it advertises the
+    available content encodings in the Accept-Encoding header and decodes compressed response bodies.
+    """
+
+    def __init__(self, handler: Callable[[str, str, Dict, Dict, Optional[bytes]], Tuple[int, Dict[str, str], bytes]]):
+        self._handler = handler
+
+    def request(self, method, url, params=None, json=None, data=None, headers=None, verify=True):
+        headers = {"accept-encoding": ", ".join(available_encodings()), **(headers or {})}
+        if isinstance(data, StreamedBody):
+            data = data.to_bytes()
+            headers = {**headers, "transfer-encoding": "chunked"}
+        if json is not None:
+            data = _json_dumps(json)
+            headers = {"content-type": "application/json", **headers}
+
+        status_code, response_headers, content = self._handler(method.upper(), url, dict(params or {}), headers, data)
+        response = TransportResponse(status_code=status_code, headers=response_headers, url=url)
+        response.content = decompress(content, response.headers.get("content-encoding"))
+        return response
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj).encode("utf-8")
@@ -0,0 +1,104 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from planqk.qiskit.client.backend_dtos import ConfigurationDto
+
+
+class Connectivity(object):
+    """Qubits of a backend and the qubit pairs multi-qubit gates can act on.
+
+    The integer qubit ids are parsed once from the backend configuration. The couplings of fully-connected backends
+    are not stored but generated when required, hence, fully-connected backends with many qubits take constant
+    memory until their edges are requested.
+    """
+    __slots__ = ("qubits", "fully_connected", "_edges")
+
+    def __init__(self, qubits: Iterable[int], edges: Optional[np.ndarray] = None, fully_connected: bool = False):
+        """
+        Args:
+            qubits: ids of the qubits
+            edges: array of shape (number of edges, 2) with the directed qubit pairs, ignored if fully connected
+            fully_connected: whether each qubit is coupled to each other qubit
+        """
+        self.qubits = np.fromiter(qubits, dtype=np.int64)
+        self.fully_connected = fully_connected
+        self._edges = None if fully_connected else edges
+
+    @classmethod
+    def from_configuration(cls, configuration: ConfigurationDto) -> "Connectivity":
+        """Parses the connectivity of a backend configuration. Configurations without coupling graph are treated as
+        fully connected, as no coupling constrains the qubit pairs of multi-qubit gates."""
+        qubits = [int(qubit.id) for qubit in configuration.qubits]
+        connectivity = configuration.connectivity
+        if connectivity.fully_connected or connectivity.graph is None:
+            return cls(qubits, fully_connected=True)
+        return cls(qubits, edges=_graph_to_edges(connectivity.graph))
+
+    @classmethod
+    def all_to_all(cls, qubits: Iterable[int]) -> "Connectivity":
+        return cls(qubits, fully_connected=True)
+
+    @property
+    def num_qubits(self) -> int:
+        return len(self.qubits)
+
+    @property
+    def num_edges(self) -> int:
+        if self.fully_connected:
+            return self.num_qubits * (self.num_qubits - 1)
+        return len(self._edges)
+
+    @property
+    def edges(self) -> np.ndarray:
+        """Returns the directed qubit pairs as array of shape (number of edges, 2)."""
+        if self._edges is None:
+            # Pairs of distinct qubits in the order of the qubits, i.e., (q0, q1), (q0, q2), ..., (q1, q0), ...
+            rows, columns = np.nonzero(~np.eye(self.num_qubits, dtype=bool))
+            self._edges = np.column_stack((self.qubits[rows], self.qubits[columns]))
+        return self._edges
+
+    def edge_list(self) -> List[Tuple[int, int]]:
+        return list(map(tuple, self.edges.tolist()))
+
+    def adjacency_matrix(self) -> np.ndarray:
+        """Returns the adjacency matrix indexed by qubit id, i.e., its size is the largest qubit id plus one."""
+        size = int(self.qubits.max()) + 1 if self.num_qubits else 0
+        if self.fully_connected:
+            matrix = np.zeros((size, size), dtype=bool)
+            matrix[np.ix_(self.qubits, self.qubits)] = True
+            matrix[self.qubits, self.qubits] = False
+            return matrix
+        matrix = np.zeros((size, size), dtype=bool)
+        if len(self._edges):
+            matrix[self._edges[:, 0], self._edges[:, 1]] = True
+        return matrix
+
+    def qubit_properties(self) -> Dict[Tuple[int], None]:
+        """Returns the instruction properties of single-qubit gates as used by the Qiskit Target."""
+        return dict.fromkeys((qubit,) for qubit in self.qubits.tolist())
+
+    def edge_properties(self) -> Dict[Optional[Tuple[int, int]], None]:
+        """Returns the instruction properties of multi-qubit gates as used by the Qiskit Target.
+
+        Multi-qubit gates of fully-connected backends act on all qubit pairs, hence, they are declared as global
+        instructions, i.e., with None qargs. This avoids adding n * (n - 1) qargs per gate to the Target, and the
+        Target has no coupling map, i.e., circuits are not routed.
+        """
+        if self.fully_connected:
+            return {None: None}
+        return dict.fromkeys(self.edge_list())
+
+
+def _graph_to_edges(graph: Dict[str, List[str]]) -> np.ndarray:
+    qubit_ids: Dict[str, int] = {}
+
+    def to_int(qubit_id: str) -> int:
+        value = qubit_ids.get(qubit_id)
+        if value is None:
+            value = qubit_ids[qubit_id] = int(qubit_id)
+        return value
+
+    edges = [(to_int(qubit), to_int(connected_qubit))
+             for qubit, connections in graph.items() for connected_qubit in connections]
+    return np.array(edges, dtype=np.int64).reshape(-1, 2)
@@ -0,0 +1,2 @@
+from .middleware import MiddlewareEmulator
+from .server import EmulatorServer
@@ -0,0 +1,104 @@
+"""Backend descriptions served by the PlanQK middleware emulator.
+
+The functions return backend dicts in the format of the PlanQK API, i.e., they can be parsed into a BackendDto.
+"""
+from typing import Dict, List, Optional
+
+_IONQ_BRAKET_GATES = ["x", "y", "z", "rx", "ry", "rz", "h", "cnot", "s", "si", "t", "ti", "v", "vi", "xx", "yy",
+                      "zz", "swap"]
+_SV1_GATES = _IONQ_BRAKET_GATES + ["ccnot", "cphaseshift", "cswap", "cy", "cz", "i", "iswap", "phaseshift", "ecr"]
+_RIGETTI_GATES = ["cz", "rx", "rz", "cphaseshift", "iswap", "xy"]
+_IONQ_AZURE_GATES = ["x", "y", "z", "rx", "ry", "rz", "h", "cnot", "s", "si", "t", "ti", "v", "vi", "swap"]
+_QRYD_GATES = ["p", "r", "rx", "ry", "pcz", "pcp", "h", "rz", "u", "x", "y", "z", "sx", "sxdg", "cx", "cy", "cz",
+               "cp", "swap", "iswap"]
+_IBM_GATES = ["id", "sx", "x", "cx", "rz", "ecr"]
+
+
+def _backend(backend_id: str, provider: str, hardware_provider: str, backend_type: str, gates: List[str],
+             num_qubits: int, input_format: str, graph: Optional[Dict[str, List[str]]] = None,
+             instructions: Optional[List[str]] = None, max_shots: int = 100000) -> dict:
+    return {
+        "id": backend_id,
+        "internal_id": backend_id,
+        "provider": provider,
+        "hardware_provider": hardware_provider,
+        "name": backend_id,
+        "documentation": {
+            "description": f"Emulated {backend_id}",
+            "url": "https://platform.planqk.de",
+            "location": "localhost",
+        },
+        "configuration": {
+            "gates": [{"name": gate, "native_gate": True} for gate in gates],
+            "instructions": gates + (instructions or ["measure"]),
+            "qubits": [{"id": str(i)} for i in range(num_qubits)],
+            "qubit_count": num_qubits,
+            "connectivity": {"fully_connected": graph is None, "graph": graph},
+            "supported_input_formats": [input_format],
+            "shots_range": {"min": 1, "max": max_shots},
+            "memory_result_supported": True,
+        },
+        "type": backend_type,
+        "status": "ONLINE",
+        "availability": [{"granularity": "daily", "start": "00:00:00", "end": "23:59:59"}],
+        "costs": [{"granularity": "shot", "currency": "USD", "value": 0.0}],
+        "updated_at": "2024-01-01",
+        "avg_queue_time": 0,
+    }
+
+
+def grid_graph(rows: int, columns: int) -> Dict[str, List[str]]:
+    """Returns the bidirectional connectivity graph of a grid of qubits."""
+    graph = {}
+    for row in range(rows):
+        for column in range(columns):
+            qubit = row * columns + column
+            neighbours = []
+            if column > 0:
+                neighbours.append(qubit - 1)
+            if column < columns - 1:
+                neighbours.append(qubit + 1)
+            if row > 0:
+                neighbours.append(qubit - columns)
+            if row < rows - 1:
+                neighbours.append(qubit + columns)
+            graph[str(qubit)] = [str(neighbour) for neighbour in neighbours]
+    return graph
+
+
+def aws_sv1(num_qubits: int = 34) -> dict:
+    return _backend("aws.sim.sv1", "AWS", "AWS", "SIMULATOR", _SV1_GATES, num_qubits, "BRAKET_OPEN_QASM_V3")
+
+
+def aws_ionq_aria(num_qubits: int = 25) -> dict:
+    return _backend("aws.ionq.aria", "AWS", "IONQ", "QPU", _IONQ_BRAKET_GATES, num_qubits, "BRAKET_OPEN_QASM_V3")
+
+
+def aws_rigetti(rows: int = 6, columns: int = 7) -> dict:
+    return _backend("aws.rigetti.ankaa", "AWS", "RIGETTI", "QPU", _RIGETTI_GATES, rows * columns,
+                    "BRAKET_OPEN_QASM_V3", graph=grid_graph(rows, columns))
+
+
+def azure_ionq_simulator(num_qubits: int = 29) -> dict:
+    return _backend("azure.ionq.simulator", "AZURE", "IONQ", "SIMULATOR", _IONQ_AZURE_GATES, num_qubits,
+                    "IONQ_CIRCUIT_V1")
+
+
+def qryd_emulator(num_qubits: int = 30) -> dict:
+    return _backend("qryd.sim.square", "QRYD", "QRYD", "SIMULATOR", _QRYD_GATES, num_qubits, "QOQO")
+
+
+def ibm_qpu(rows: int = 3, columns: int = 9) -> dict:
+    return _backend("ibm.eagle", "IBM", "IBM", "QPU", _IBM_GATES, rows * columns, "QISKIT",
+                    graph=grid_graph(rows, columns), instructions=["measure", "delay", "reset", "if_else"])
+
+
+def ibm_simulator(num_qubits: int = 32) -> dict:
+    return _backend("ibmq_qasm_simulator", "IBM", "IBM", "SIMULATOR", _IBM_GATES, num_qubits, "QISKIT",
+                    instructions=["measure", "delay", "reset"])
+
+
+def default_backends() -> List[dict]:
+    """Returns a backend of each provider supported by the SDK."""
+    return [aws_sv1(), aws_ionq_aria(), aws_rigetti(), azure_ionq_simulator(), qryd_emulator(), ibm_qpu(),
+            ibm_simulator()]
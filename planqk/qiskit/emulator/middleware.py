@@ -0,0 +1,388 @@
+import logging
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from planqk.exceptions import PlanqkError
+from planqk.qiskit.client.compression import available_encodings, compress, decompress
+from planqk.qiskit.client.job_dtos import JOB_STATUS, INPUT_FORMAT
+from planqk.qiskit.client.payload_formats import JSON, PayloadFormat, payload_format_of
+from planqk.qiskit.client.transport import InProcessTransport
+from planqk.qiskit.emulator.catalog import default_backends
+from planqk.qiskit.emulator.results import synthesize_result
+
+logger = logging.getLogger(__name__)
+
+# Response bodies smaller than this are not compressed
+_MIN_COMPRESSION_SIZE = 1024
+
+_FINAL_STATES = {JOB_STATUS.COMPLETED, JOB_STATUS.FAILED, JOB_STATUS.CANCELLED}
+
+_QASM_INPUT_DECLARATION = re.compile(r"^input float (\w+);$", re.MULTILINE)
+
+_ROUTES = [
+    ("backend_status", re.compile(r".*/backends/(?P<backend_id>[^/]+)/status")),
+    ("backend", re.compile(r".*/backends/(?P<backend_id>[^/]+)")),
+    ("backends", re.compile(r".*/backends")),
+    ("job_result", re.compile(r".*/jobs/(?P<job_id>[^/]+)/result")),
+    ("job", re.compile(r".*/jobs/(?P<job_id>[^/]+)")),
+    ("jobs", re.compile(r".*/jobs")),
+]
+
+Response = Tuple[int, Dict[str, str], bytes]
+
+
+class _HttpError(Exception):
+
+    def __init__(self, status_code: int, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+        self.headers = headers or {}
+
+
+class MiddlewareEmulator(object):
+    """In-memory emulation of the PlanQK quantum middleware for load tests, benchmarks and integration tests.
+
+    The emulator implements the backend and job endpoints used by the SDK. Jobs are queued per backend and processed
+    by a configurable number of workers. Their state is derived from the emulator clock, i.e., no background threads
+    are involved: a job is PENDING until a worker is free, RUNNING for its execution time and COMPLETED (or FAILED)
+    afterwards. Results of jobs in the QISKIT input format are simulated with the BasicSimulator of Qiskit, results of
+    other jobs are sampled randomly.
+
+    Request and response bodies may be encoded as JSON, MessagePack or CBOR and compressed with gzip or zstd, as
+    negotiated by the client.
+
+    Example:
+        emulator = MiddlewareEmulator(latency=0.05, execution_time=1.0, workers=2)
+        _PlanqkClient.set_transport(emulator.transport())
+        # or, to send real HTTP requests: with EmulatorServer(emulator) as server: server.url
+
+    Args:
+        backends: backend dicts in the format of the PlanQK API, defaults to a backend of each provider
+        latency: time in seconds each request is delayed
+        latency_jitter: maximum random time in seconds added to the latency of each request
+        execution_time: time in seconds a job runs once it was dequeued
+        execution_time_per_shot: time in seconds added to the execution time per shot
+        workers: number of jobs each backend processes concurrently
+        error_rate: probability of a request failing with ``error_status_code``
+        error_status_code: HTTP status code of injected request failures
+        job_failure_rate: probability of a job failing instead of completing
+        access_token: token the x-auth-token header must match, by default any token is accepted
+        seed: seed for injected failures and sampled results
+        result_synthesizer: function creating the result of a job from the job dict and a random number generator
+        clock: function returning the current time in seconds, replace it to control job progress in tests
+        sleep: function used to delay requests
+    """
+
+    def __init__(self,
+                 backends: Optional[List[dict]] = None,
+                 latency: float = 0.0,
+                 latency_jitter: float = 0.0,
+                 execution_time: float = 0.0,
+                 execution_time_per_shot: float = 0.0,
+                 workers: int = 1,
+                 error_rate: float = 0.0,
+                 error_status_code: int = 503,
+                 job_failure_rate: float = 0.0,
+                 access_token: Optional[str] = None,
+                 seed: Optional[int] = None,
+                 result_synthesizer: Callable[[dict, random.Random], dict] = synthesize_result,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        if workers < 1:
+            raise ValueError("At least one worker is required")
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.execution_time = execution_time
+        self.execution_time_per_shot = execution_time_per_shot
+        self.workers = workers
+        self.error_rate = error_rate
+        self.error_status_code = error_status_code
+        self.job_failure_rate = job_failure_rate
+        self.access_token = access_token
+        self.result_synthesizer = result_synthesizer
+        self.request_counts = Counter()
+
+        self._backends = {backend["id"]: backend for backend in (backends or default_backends())}
+        self._jobs: Dict[str, dict] = {}
+        self._worker_free_times: Dict[str, List[float]] = {}
+        self._seed = seed
+        self._rng = random.Random(seed)
+        self._clock = clock
+        self._sleep = sleep
+        self._epoch_offset = time.time() - clock()
+        self._lock = threading.RLock()
+
+    def transport(self) -> InProcessTransport:
+        """Returns a transport passing the requests of the PlanQK client directly to this emulator."""
+        return InProcessTransport(self.handle)
+
+    def add_backend(self, backend: dict):
+        with self._lock:
+            self._backends[backend["id"]] = backend
+
+    def handle(self, method: str, url: str, params: Optional[Dict], headers: Dict[str, str],
+               body: Optional[bytes]) -> Response:
+        """Handles a request to the PlanQK API.
+
+        Args:
+            method: HTTP method in upper case
+            url: request URL, only the end of its path is evaluated
+            params: query parameters
+            headers: request headers
+            body: encoded request body
+
+        Returns:
+            tuple of the status code, the response headers and the encoded response body
+        """
+        headers = {name.lower(): value for name, value in (headers or {}).items()}
+        self._delay()
+
+        route, path_params = self._match_route(urlsplit(url).path)
+        with self._lock:
+            self.request_counts[(method, route)] += 1
+            inject_error = self.error_rate > 0 and self._rng.random() < self.error_rate
+
+        try:
+            if route is None:
+                raise _HttpError(404, f"No route for {method} {url}")
+            self._authenticate(headers)
+            if inject_error:
+                raise _HttpError(self.error_status_code, "Injected failure")
+            status_code, response_body = self._dispatch(method, route, path_params, params or {}, headers, body)
+        except _HttpError as e:
+            logger.debug("Emulated request %s %s failed with %s: %s", method, url, e.status_code, e.message)
+            error_body = {"status": str(e.status_code), "error_message": e.message, "error": e.message}
+            return e.status_code, {"content-type": JSON.content_type, **e.headers}, JSON.encode(error_body)
+        except Exception as e:
+            logger.exception("Emulated request %s %s failed", method, url)
+            error_body = {"status": "500", "error_message": str(e), "error": str(e)}
+            return 500, {"content-type": JSON.content_type}, JSON.encode(error_body)
+
+        if response_body is None:
+            return status_code, {}, b""
+        return (status_code,) + self._encode_response(response_body, headers)
+
+    def _delay(self):
+        delay = self.latency
+        if self.latency_jitter > 0:
+            with self._lock:
+                delay += self._rng.uniform(0, self.latency_jitter)
+        if delay > 0:
+            self._sleep(delay)
+
+    @staticmethod
+    def _match_route(path: str) -> Tuple[Optional[str], dict]:
+        path = path.rstrip("/")
+        for route, pattern in _ROUTES:
+            match = pattern.fullmatch(path)
+            if match is not None:
+                return route, match.groupdict()
+        return None, {}
+
+    def _authenticate(self, headers: Dict[str, str]):
+        token = headers.get("x-auth-token")
+        if not token or (self.access_token is not None and token != self.access_token):
+            raise _HttpError(401, "Invalid access token")
+
+    def _dispatch(self, method: str, route: str, path_params: dict, params: dict, headers: Dict[str, str],
+                  body: Optional[bytes]) -> Tuple[int, Optional[object]]:
+        if (method, route) == ("GET", "backends"):
+            return 200, list(self._backends.values())
+        if (method, route) == ("GET", "backend"):
+            return 200, self._get_backend(path_params["backend_id"])
+        if (method, route) == ("GET", "backend_status"):
+            return 200, self._get_backend_state(path_params["backend_id"])
+        if (method, route) == ("GET", "jobs"):
+            with self._lock:
+                return 200, [self._job_view(job, include_input=False) for job in self._jobs.values()]
+        if (method, route) == ("POST", "jobs"):
+            return 201, self._submit_job(self._decode_request(headers, body))
+        if (method, route) == ("GET", "job"):
+            return 200, self._job_view(self._get_job(path_params["job_id"]), include_input=True)
+        if (method, route) == ("DELETE", "job"):
+            self._cancel_job(path_params["job_id"])
+            return 204, None
+        if (method, route) == ("GET", "job_result"):
+            return 200, self._get_job_result(path_params["job_id"])
+        raise _HttpError(405, f"Method {method} is not allowed")
+
+    @staticmethod
+    def _decode_request(headers: Dict[str, str], body: Optional[bytes]):
+        if not body:
+            raise _HttpError(400, "Request body is missing")
+        try:
+            body = decompress(body, headers.get("content-encoding"))
+        except ValueError as e:
+            raise _HttpError(415, str(e), {"accept-encoding": ", ".join(available_encodings() + ["identity"])})
+        try:
+            payload_format = payload_format_of(headers.get("content-type")) or JSON
+        except PlanqkError as e:
+            raise _HttpError(415, e.message)
+        try:
+            return payload_format.decode(body)
+        except Exception as e:
+            raise _HttpError(400, f"Request body cannot be decoded: {e}")
+
+    @staticmethod
+    def _encode_response(obj, headers: Dict[str, str]) -> Tuple[Dict[str, str], bytes]:
+        payload_format = _accepted_payload_format(headers.get("accept"))
+        response_headers = {"content-type": payload_format.content_type}
+        body = payload_format.encode(obj)
+
+        if len(body) >= _MIN_COMPRESSION_SIZE:
+            accepted_encodings = [coding.split(";")[0].strip().lower()
+                                  for coding in headers.get("accept-encoding", "").split(",")]
+            encoding = next((coding for coding in available_encodings() if coding in accepted_encodings), None)
+            if encoding is not None:
+                body = compress(body, encoding)
+                response_headers["content-encoding"] = encoding
+        return response_headers, body
+
+    def _get_backend(self, backend_id: str) -> dict:
+        backend = self._backends.get(backend_id)
+        if backend is None:
+            raise _HttpError(404, f"Backend {backend_id} not found")
+        return backend
+
+    def _get_backend_state(self, backend_id: str) -> dict:
+        backend = self._get_backend(backend_id)
+        now = self._clock()
+        with self._lock:
+            queue_size = sum(1 for job in self._jobs.values()
+                             if job["backend_id"] == backend_id and self._job_status(job, now) == JOB_STATUS.PENDING)
+        return {
+            "status": backend.get("status", "ONLINE"),
+            "queue_avg_time": int(self.execution_time * queue_size / self.workers),
+            "queue_size": queue_size,
+            "provider_token_valid": True,
+        }
+
+    def _submit_job(self, job: dict) -> dict:
+        if not isinstance(job, dict):
+            raise _HttpError(400, "Job must be an object")
+        backend = self._get_backend(job.get("backend_id"))
+        shots = job.get("shots", 1)
+        shots_range = backend["configuration"]["shots_range"]
+        if not shots_range["min"] <= shots <= shots_range["max"]:
+            raise _HttpError(400, f"Shots must be between {shots_range['min']} and {shots_range['max']}")
+        self._validate_inputs(job)
+
+        with self._lock:
+            now = self._clock()
+            free_times = self._worker_free_times.setdefault(backend["id"], [now] * self.workers)
+            worker = min(range(self.workers), key=free_times.__getitem__)
+            begin = max(now, free_times[worker])
+            end = begin + self.execution_time + self.execution_time_per_shot * shots
+            free_times[worker] = end
+
+            job_id = str(uuid.UUID(int=self._rng.getrandbits(128), version=4))
+            record = {
+                **job,
+                "input_params": self._job_params(job),
+                "id": job_id,
+                "shots": shots,
+                "creation_time": self._timestamp(now),
+                "_begin": begin,
+                "_end": end,
+                "_failed": self.job_failure_rate > 0 and self._rng.random() < self.job_failure_rate,
+                "_cancellation_time": None,
+                "_result": None,
+            }
+            self._jobs[job_id] = record
+            return self._job_view(record, include_input=False, now=now)
+
+    @staticmethod
+    def _validate_inputs(job: dict):
+        """Rejects Braket programs declaring inputs without value, as Braket does."""
+        job_input = job.get("input")
+        if job.get("input_format") != INPUT_FORMAT.BRAKET_OPEN_QASM_V3.value or not isinstance(job_input, str):
+            return
+        inputs = (job.get("input_params") or {}).get("inputs") or {}
+        missing = set(_QASM_INPUT_DECLARATION.findall(job_input)).difference(inputs)
+        if missing:
+            raise _HttpError(400, f"Missing input values for {', '.join(sorted(missing))}")
+
+    @staticmethod
+    def _job_params(job: dict) -> Optional[dict]:
+        input_params = job.get("input_params")
+        if job.get("input_format") == INPUT_FORMAT.QISKIT.value:
+            # Like the middleware, return the runtime job parameters the client omitted as they are null
+            return {"session_id": None, "program_id": None, **(input_params or {})}
+        return input_params
+
+    def _get_job(self, job_id: str) -> dict:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise _HttpError(404, f"Job {job_id} not found")
+        return job
+
+    def _cancel_job(self, job_id: str):
+        job = self._get_job(job_id)
+        with self._lock:
+            now = self._clock()
+            # Jobs in a final state are not changed, the worker of a cancelled job is not released earlier
+            if self._job_status(job, now) not in _FINAL_STATES:
+                job["_cancellation_time"] = now
+
+    def _get_job_result(self, job_id: str) -> dict:
+        job = self._get_job(job_id)
+        status = self._job_status(job, self._clock())
+        if status != JOB_STATUS.COMPLETED:
+            raise _HttpError(409, f"Job {job_id} is {status.value}, results are only available for completed jobs")
+
+        with self._lock:
+            if job["_result"] is None:
+                # Each job has its own generator so that results do not depend on the order they are retrieved in
+                job_seed = None if self._seed is None else f"{self._seed}:{job_id}"
+                job["_result"] = self.result_synthesizer(job, random.Random(job_seed))
+            return job["_result"]
+
+    def _job_status(self, job: dict, now: float) -> JOB_STATUS:
+        cancellation_time = job["_cancellation_time"]
+        if cancellation_time is not None and cancellation_time <= now:
+            return JOB_STATUS.CANCELLED
+        if now < job["_begin"]:
+            return JOB_STATUS.PENDING
+        if now < job["_end"]:
+            return JOB_STATUS.RUNNING
+        return JOB_STATUS.FAILED if job["_failed"] else JOB_STATUS.COMPLETED
+
+    def _job_view(self, job: dict, include_input: bool, now: Optional[float] = None) -> dict:
+        now = self._clock() if now is None else now
+        status = self._job_status(job, now)
+        view = {key: value for key, value in job.items()
+                if not key.startswith("_") and (include_input or key != "input")}
+        view["status"] = status.value
+        if status != JOB_STATUS.PENDING and status != JOB_STATUS.CANCELLED:
+            view["begin_execution_time"] = self._timestamp(job["_begin"])
+        if status in {JOB_STATUS.COMPLETED, JOB_STATUS.FAILED}:
+            view["end_execution_time"] = self._timestamp(job["_end"])
+        if status == JOB_STATUS.CANCELLED:
+            view["cancellation_time"] = self._timestamp(job["_cancellation_time"])
+        if status == JOB_STATUS.FAILED:
+            view["error_data"] = {"code": "EMULATED_FAILURE", "message": "Job failure injected by the emulator"}
+        return view
+
+    def _timestamp(self, clock_time: float) -> str:
+        return datetime.fromtimestamp(self._epoch_offset + clock_time, tz=timezone.utc).isoformat()
+
+
+def _accepted_payload_format(accept: Optional[str]) -> PayloadFormat:
+    """Returns the first available payload format listed in an Accept header, or JSON."""
+    for media_range in (accept or "").split(","):
+        try:
+            payload_format = payload_format_of(media_range)
+        except PlanqkError:
+            continue
+        if payload_format is not None:
+            return payload_format
+    return JSON
@@ -0,0 +1,117 @@
+"""Synthesis of job results for the PlanQK middleware emulator."""
+import json
+import random
+import re
+from collections import Counter
+from typing import Optional
+
+from planqk.qiskit.client.job_dtos import INPUT_FORMAT
+
+# Number of distinct outcomes sampled for synthetic results, keeps results of wide circuits small
+_MAX_OUTCOMES = 64
+
+_QASM_BIT_DECLARATION = re.compile(r"^\s*bit\[(\d+)\]", re.MULTILINE)
+_QASM_QUBIT_DECLARATION = re.compile(r"^\s*qubit\[(\d+)\]", re.MULTILINE)
+
+
+def synthesize_result(job: dict, rng: random.Random) -> dict:
+    """Returns the result of a job as returned by the PlanQK API.
+
+    Jobs in the QISKIT input format are executed with the BasicSimulator of Qiskit and their result is returned in the
+    format of the IBM circuit runner. For all other input formats, random counts are sampled for the number of
+    classical bits of the circuit.
+
+    Args:
+        job: the submitted job
+        rng: random number generator used for sampling, seeded by the emulator
+
+    Returns:
+        result dict containing at least the entries "counts" and "memory"
+    """
+    if job.get("input_format") == INPUT_FORMAT.QISKIT.value:
+        return simulate_qiskit_job(job.get("input") or {}, job.get("shots") or 1, rng.randrange(2 ** 31))
+    return sample_counts(num_clbits(job), job.get("shots") or 1, rng)
+
+
+def simulate_qiskit_job(job_input: dict, shots: int, seed: int) -> dict:
+    """Runs the circuits of a job submitted by the IBM backends on the BasicSimulator."""
+    from qiskit.providers.basic_provider import BasicSimulator
+    from qiskit_ibm_runtime import RuntimeDecoder, RuntimeEncoder
+
+    decoded_input = json.loads(json.dumps(job_input), cls=RuntimeDecoder)
+    circuits = decoded_input.get("circuits", decoded_input) if isinstance(decoded_input, dict) else decoded_input
+    if not isinstance(circuits, list):
+        circuits = [circuits]
+    # Circuits transpiled for a QPU span all its qubits, which exceeds the capacity of the BasicSimulator
+    circuits = [_remove_idle_qubits(circuit) for circuit in circuits]
+
+    result = BasicSimulator().run(circuits, shots=decoded_input.get("shots", shots), memory=True,
+                                  seed_simulator=seed).result()
+    result_dict = json.loads(json.dumps(result.to_dict(), cls=RuntimeEncoder))
+    result_dict["counts"] = result.get_counts(0)
+    result_dict["memory"] = result.get_memory(0)
+    return result_dict
+
+
+def _remove_idle_qubits(circuit):
+    from qiskit.circuit import ControlFlowOp, QuantumCircuit, QuantumRegister
+
+    active_qubits = sorted({circuit.find_bit(qubit).index for instruction in circuit.data
+                            for qubit in instruction.qubits})
+    if len(active_qubits) == circuit.num_qubits or any(isinstance(instruction.operation, ControlFlowOp)
+                                                       for instruction in circuit.data):
+        return circuit
+
+    reduced_circuit = QuantumCircuit(QuantumRegister(len(active_qubits), "q"), *circuit.cregs, name=circuit.name,
+                                     global_phase=circuit.global_phase, metadata=circuit.metadata)
+    reduced_circuit.add_bits([clbit for clbit in circuit.clbits if clbit not in set(reduced_circuit.clbits)])
+    qubit_map = {circuit.qubits[index]: reduced_circuit.qubits[i] for i, index in enumerate(active_qubits)}
+    for instruction in circuit.data:
+        reduced_circuit.append(instruction.operation, [qubit_map[qubit] for qubit in instruction.qubits],
+                               instruction.clbits)
+    return reduced_circuit
+
+
+def sample_counts(clbits: int, shots: int, rng: random.Random) -> dict:
+    """Samples random measurement outcomes of a circuit with the given number of classical bits."""
+    clbits = max(clbits, 1)
+    num_outcomes = min(2 ** clbits, _MAX_OUTCOMES)
+    outcomes = [format(rng.getrandbits(clbits), f"0{clbits}b") for _ in range(num_outcomes)]
+    memory = rng.choices(outcomes, k=shots)
+    return {"counts": dict(Counter(memory)), "memory": memory}
+
+
+def num_clbits(job: dict) -> int:
+    """Returns the number of classical bits read out by a job, derived from its input."""
+    job_input = job.get("input")
+    input_format = job.get("input_format")
+
+    if isinstance(job_input, str):
+        declarations = _QASM_BIT_DECLARATION.findall(job_input) or _QASM_QUBIT_DECLARATION.findall(job_input)
+        return sum(int(size) for size in declarations)
+
+    if not isinstance(job_input, dict):
+        return 1
+
+    if input_format == INPUT_FORMAT.IONQ_CIRCUIT_V1.value:
+        return int(job_input.get("qubits", 1))
+
+    if input_format == INPUT_FORMAT.QOQO.value:
+        length = _qoqo_readout_length(job_input)
+        if length is not None:
+            return length
+
+    return 1
+
+
+def _qoqo_readout_length(job_input: dict) -> Optional[int]:
+    try:
+        circuits = job_input["ClassicalRegister"]["measurement"]["circuits"]
+    except (KeyError, TypeError):
+        return None
+    for circuit in circuits:
+        for definition in circuit.get("definitions", []):
+            definition_bit = definition.get("DefinitionBit")
+            if definition_bit is not None and definition_bit.get("is_output"):
+                return int(definition_bit["length"])
+    return None
@@ -0,0 +1,109 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from planqk.qiskit.emulator.middleware import MiddlewareEmulator
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def do_DELETE(self):
+        self._handle()
+
+    def _handle(self):
+        url = f"{self.server.url}{self.path}"
+        params = dict(parse_qsl(urlsplit(self.path).query))
+        status_code, headers, body = self.server.emulator.handle(self.command, url, params, dict(self.headers.items()),
+                                                                 self._read_body())
+        self.send_response(status_code)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _read_body(self) -> Optional[bytes]:
+        if self.headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                if size == 0:
+                    # Skip the trailer section
+                    while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                        pass
+                    return b"".join(chunks)
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+        content_length = int(self.headers.get("content-length", 0))
+        return self.rfile.read(content_length) if content_length > 0 else None
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _EmulatorHttpServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, emulator: MiddlewareEmulator):
+        super().__init__(address, _RequestHandler)
+        self.emulator = emulator
+        host, port = self.server_address[:2]
+        self.url = f"http://{host}:{port}"
+
+
+class EmulatorServer(object):
+    """HTTP server exposing a MiddlewareEmulator on localhost, e.g., for end-to-end tests and benchmarks.
+
+    Point the SDK to the server by setting the environment variable PLANQK_QUANTUM_BASE_URL to its url.
+
+    Example:
+        with EmulatorServer(MiddlewareEmulator(latency=0.05)) as server:
+            os.environ["PLANQK_QUANTUM_BASE_URL"] = server.url
+
+    Args:
+        emulator: the emulator handling the requests, by default an emulator without latency
+        host: host the server binds to
+        port: port the server listens on, by default a free port is chosen
+    """
+
+    def __init__(self, emulator: Optional[MiddlewareEmulator] = None, host: str = "127.0.0.1", port: int = 0):
+        self.emulator = emulator or MiddlewareEmulator()
+        self._address = (host, port)
+        self._server: Optional[_EmulatorHttpServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("Server is not running")
+        return self._server.url
+
+    def start(self) -> "EmulatorServer":
+        if self._server is None:
+            self._server = _EmulatorHttpServer(self._address, self.emulator)
+            self._thread = threading.Thread(target=self._server.serve_forever, name="planqk-emulator", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+            self._thread = None
+
+    def __enter__(self) -> "EmulatorServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,262 @@
+"""Timing instrumentation of the stages of a job submission and result retrieval.
+
+The SDK records timed spans for its stages, e.g., the circuit conversion (``convert_to_job_input``), the payload
+encoding (``encode_payload``), the HTTP requests (``http_request``), the DTO parsing (``parse_dto``) and the result
+construction (``build_result``). Spans are only recorded if a sink is registered. Without sinks, ``span`` returns a
+shared no-op span, i.e., the instrumentation costs a function call and a list check per stage.
+
+Example:
+    with profile() as histogram:
+        backend.run(circuit, shots=100).result()
+    print(histogram.summary())
+
+    add_sink(LoggingSink())
+"""
+import contextvars
+import logging
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_sinks: List["SpanSink"] = []
+_sinks_lock = threading.Lock()
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("planqk_current_span", default=None)
+
+
+class Span(object):
+    """Timed stage of the SDK, e.g., the conversion of a circuit or an HTTP request.
+
+    Attributes:
+        name: name of the stage
+        attributes: details of the stage, e.g., the url and status code of an HTTP request
+        parent: the span this span was started in, if any
+        start: start time in seconds as returned by ``time.perf_counter``
+        end: end time in seconds, None while the span is active
+        error: the exception raised within the span, if any
+    """
+
+    __slots__ = ("name", "attributes", "parent", "start", "end", "error", "_token")
+
+    def __init__(self, name: str, attributes: Optional[Dict[str, Any]] = None, parent: Optional["Span"] = None):
+        self.name = name
+        self.attributes = attributes or {}
+        self.parent = parent
+        self.start = None
+        self.end = None
+        self.error = None
+        self._token = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Duration of the span in seconds."""
+        return None if self.end is None else self.end - self.start
+
+    @property
+    def path(self) -> str:
+        """Names of the enclosing spans and this span separated by slashes, e.g., "run/convert_to_job_input"."""
+        return self.name if self.parent is None else f"{self.parent.path}/{self.name}"
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        for sink in _sinks:
+            try:
+                sink.start(self)
+            except Exception:
+                logger.exception("Span sink %s failed to start span %s", sink, self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.end = time.perf_counter()
+        self.error = exc_val
+        _current_span.reset(self._token)
+        self._token = None
+        for sink in _sinks:
+            try:
+                sink.record(self)
+            except Exception:
+                logger.exception("Span sink %s failed to record span %s", sink, self.name)
+
+    def __repr__(self):
+        return f"Span({self.path!r}, duration={self.duration}, attributes={self.attributes})"
+
+
+class _NoopSpan(object):
+    """Span returned while no sink is registered, it neither measures time nor allocates."""
+
+    __slots__ = ()
+
+    name = None
+    attributes = {}
+    parent = None
+    duration = None
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(name: str, **attributes):
+    """Returns a span timing the enclosed stage.
+
+    Args:
+        name: name of the stage
+        **attributes: details of the stage
+
+    Returns:
+        context manager yielding the span, attributes can be added to it within the block
+    """
+    if not _sinks:
+        return _NOOP_SPAN
+    return Span(name, attributes, _current_span.get())
+
+
+def current_span() -> Optional[Span]:
+    """Returns the innermost active span, or None."""
+    return _current_span.get()
+
+
+def is_enabled() -> bool:
+    """Returns True if spans are recorded, i.e., at least one sink is registered."""
+    return bool(_sinks)
+
+
+class SpanSink(ABC):
+    """Receives the spans once they ended."""
+
+    def start(self, span: Span):
+        """Called when a span starts, e.g., to open a span in a tracing system."""
+        pass
+
+    @abstractmethod
+    def record(self, span: Span):
+        pass
+
+
+class LoggingSink(SpanSink):
+    """Logs each span with its duration and attributes."""
+
+    def __init__(self, logger_: Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        self._logger = logger_ or logger
+        self._level = level
+
+    def record(self, span: Span):
+        if self._logger.isEnabledFor(self._level):
+            self._logger.log(self._level, "%s took %.3f ms %s", span.path, span.duration * 1000, span.attributes)
+
+
+class CallbackSink(SpanSink):
+    """Passes each span to a function, e.g., to forward it to a monitoring system."""
+
+    def __init__(self, callback: Callable[[Span], None]):
+        self._callback = callback
+
+    def record(self, span: Span):
+        self._callback(span)
+
+
+class HistogramSink(SpanSink):
+    """Collects the durations of the spans in memory, grouped by span name.
+
+    Args:
+        keep_spans: whether to keep the spans themselves, e.g., to inspect their attributes
+    """
+
+    def __init__(self, keep_spans: bool = False):
+        self._durations: Dict[str, List[float]] = {}
+        self._spans: List[Span] = []
+        self._keep_spans = keep_spans
+        self._lock = threading.Lock()
+
+    def record(self, span: Span):
+        with self._lock:
+            self._durations.setdefault(span.name, []).append(span.duration)
+            if self._keep_spans:
+                self._spans.append(span)
+
+    @property
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def durations(self, name: str) -> List[float]:
+        """Returns the durations in seconds of the spans with the given name."""
+        with self._lock:
+            return list(self._durations.get(name, []))
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return list(self._durations)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Returns count, total, mean, median, 95th percentile and maximum duration in seconds per span name."""
+        with self._lock:
+            durations = {name: sorted(values) for name, values in self._durations.items()}
+        return {name: {
+            "count": len(values),
+            "total": sum(values),
+            "mean": sum(values) / len(values),
+            "p50": _percentile(values, 0.5),
+            "p95": _percentile(values, 0.95),
+            "max": values[-1],
+        } for name, values in durations.items()}
+
+    def clear(self):
+        with self._lock:
+            self._durations = {}
+            self._spans = []
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    index = max(math.ceil(fraction * len(sorted_values)) - 1, 0)
+    return sorted_values[index]
+
+
+def add_sink(sink: SpanSink) -> SpanSink:
+    """Registers a sink, enabling the recording of spans."""
+    global _sinks
+    with _sinks_lock:
+        # The list is replaced instead of modified so that spans ending concurrently iterate over a consistent list
+        _sinks = _sinks + [sink]
+    return sink
+
+
+def remove_sink(sink: SpanSink):
+    """Unregisters a sink. Spans are no longer recorded once the last sink was removed."""
+    global _sinks
+    with _sinks_lock:
+        _sinks = [registered_sink for registered_sink in _sinks if registered_sink is not sink]
+
+
+@contextmanager
+def profile(sink: Optional[SpanSink] = None) -> Iterator[SpanSink]:
+    """Records the spans of the enclosed code block.
+
+    Args:
+        sink: sink receiving the spans, by default a new HistogramSink keeping the spans
+
+    Returns:
+        context manager yielding the sink
+    """
+    sink = sink or HistogramSink(keep_spans=True)
+    add_sink(sink)
+    try:
+        yield sink
+    finally:
+        remove_sink(sink)
@@ -1,3 +1,4 @@
+import weakref
 from typing import Optional
 
 from qiskit.providers import JobV1, JobStatus, Backend
@@ -5,6 +6,7 @@ from qiskit.qobj import QobjExperimentHeader
 from qiskit.result import Result
 from qiskit.result.models import ExperimentResult, ExperimentResultData
 
+from planqk.qiskit import instrumentation, metrics, tracing
 from planqk.qiskit.client.client import _PlanqkClient
 from planqk.qiskit.client.job_dtos import JobDto
 
@@ -31,6 +33,8 @@ class PlanqkJob(JobV1):
         self._result = None
         self._backend = backend
         self._job_details = job_details
+        self._lifecycle_span = None
+        self._final_state_recorded = False
 
         if job_id is not None and job_details is None:
             self._job_id = job_id
@@ -44,6 +48,11 @@ class PlanqkJob(JobV1):
         job_details_dict = self._job_details.dict()
         super().__init__(backend=backend, job_id=self._job_id, **job_details_dict)
 
+    def __reduce__(self):
+        """Pickles the job as its id, backend and details without the job input, e.g., to pass it to another
+        process."""
+        return type(self), (self._backend, self._job_id, self._job_details.model_copy(update={"input": None}))
+
     def submit(self):
         """
         Submits the job for execution.
@@ -52,8 +61,17 @@ class PlanqkJob(JobV1):
         if self._job_details is None:
             raise RuntimeError("Cannot submit job as no job details are set.")
 
-        self._job_details = _PlanqkClient.submit_job(self._job_details)
-        self._job_id = self._job_details.id
+        with instrumentation.span("submit_job", backend_id=self._job_details.backend_id):
+            self._job_details = _PlanqkClient.submit_job(self._job_details)
+            self._job_id = self._job_details.id
+
+        metrics.record_job_submitted(self._job_details.backend_id)
+        self._lifecycle_span = tracing.start_job_span(self._job_id, self._job_details.backend_id,
+                                                      self._job_details.provider, self._job_details.shots)
+        if self._lifecycle_span is not None:
+            # Exports the span of jobs that are garbage-collected or outlive the process before reaching a final state
+            weakref.finalize(self, self._lifecycle_span.end, "dropped")
+        self._record_status()
 
     def result(self) -> Result:
         """
@@ -62,19 +80,26 @@ class PlanqkJob(JobV1):
         if self._result is not None:
             return self._result
 
-        if not self.in_final_state():
-            self.wait_for_final_state()
+        with instrumentation.span("result", job_id=self._job_id):
+            if not self.in_final_state():
+                self.wait_for_final_state()
 
-        status = JobStatusMap[self._job_details.status]
-        if not status == JobStatus.DONE:
-            raise RuntimeError(
-                f'{"Cannot retrieve results as job execution did not complete successfully. "}'
-                + f"(status: {self.status}."
-                + f"error: {self.error_data})"
-            )
+            status = JobStatusMap[self._job_details.status]
+            if not status == JobStatus.DONE:
+                raise RuntimeError(
+                    f'{"Cannot retrieve results as job execution did not complete successfully. "}'
+                    + f"(status: {self.status}."
+                    + f"error: {self.error_data})"
+                )
 
-        result_data = _PlanqkClient.get_job_result(self._job_id, self.backend().backend_provider)
+            result_data = _PlanqkClient.get_job_result(self._job_id, self.backend().backend_provider)
 
+            with instrumentation.span("build_result"):
+                self._result = self._build_result(result_data, status)
+
+        return self._result
+
+    def _build_result(self, result_data: dict, status: JobStatus) -> Result:
         experiment_result = ExperimentResult(
             shots=self._job_details.shots,
             success=True,
@@ -87,7 +112,7 @@ class PlanqkJob(JobV1):
             header=QobjExperimentHeader(name="circ0")
         )
 
-        self._result = Result(
+        return Result(
             backend_name=self._backend.name,
             backend_version=self._backend.version,
             job_id=self._job_id,
@@ -98,21 +123,33 @@ class PlanqkJob(JobV1):
             date=self._job_details.end_execution_time,
         )
 
-        return self._result
-
     def _refresh(self):
         """
         Refreshes the job details from the server.
         """
         if self.job_id is None:
             raise ValueError("Job Id is not set.")
-        self._job_details = _PlanqkClient.get_job(self._job_id, self.backend().backend_provider)
+        with instrumentation.span("refresh_job", job_id=self._job_id):
+            self._job_details = _PlanqkClient.get_job(self._job_id, self.backend().backend_provider)
+        metrics.record_job_status_poll(self._job_details.backend_id)
+        self._record_status()
+
+    def _record_status(self):
+        """Records the current job status in the lifecycle span and, once final, in the job metrics."""
+        if self._lifecycle_span is not None:
+            self._lifecycle_span.update(self._job_details.status)
+        if not self._final_state_recorded and self._job_details.status in ("COMPLETED", "FAILED", "CANCELLED"):
+            self._final_state_recorded = True
+            metrics.record_job_finished(self._job_details)
 
     def cancel(self):
         """
         Attempt to cancel the job.
         """
-        _PlanqkClient.cancel_job(self._job_id, self.backend().backend_provider)
+        with instrumentation.span("cancel_job", job_id=self._job_id):
+            _PlanqkClient.cancel_job(self._job_id, self.backend().backend_provider)
+        if self._lifecycle_span is not None:
+            self._lifecycle_span.end("cancel_requested")
 
     def status(self) -> JobStatus:
         """
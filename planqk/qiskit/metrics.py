@@ -0,0 +1,369 @@
+"""Metrics of the client and job activity, exportable in the Prometheus text format.
+
+The client and the jobs feed the metrics of the default registry ``REGISTRY``, e.g., the number of HTTP requests per
+endpoint and status, the number of job submissions and status polls, and the queue and execution time of jobs per
+backend. Export them by serving them via HTTP or by writing ``REGISTRY.to_prometheus_text()`` to a file read by the
+node exporter.
+
+Example:
+    server = start_metrics_server(port=9464)
+    ...
+    server.shutdown()
+"""
+import logging
+import math
+import re
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+JOB_TIME_BUCKETS = (1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 600.0, 1800.0, 3600.0, 4 * 3600.0, 24 * 3600.0)
+SIZE_BUCKETS = tuple(float(1024 * 4 ** exponent) for exponent in range(9))  # 1 KiB to 64 MiB
+
+_METRIC_NAME = re.compile(r"[a-zA-Z_:][a-zA-Z0-9_:]*")
+
+
+class _Metric(ABC):
+    type_name: str = None
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        if not _METRIC_NAME.fullmatch(name):
+            raise ValueError(f"Invalid metric name '{name}'")
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, object]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Metric {self.name} requires the labels {', '.join(self.labelnames)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def clear(self):
+        with self._lock:
+            self._values = {}
+
+    @abstractmethod
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        """Returns the samples of the metric as tuples of sample name, labels and value."""
+        pass
+
+
+class Counter(_Metric):
+    """Monotonically increasing value, e.g., the number of requests."""
+    type_name = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        if amount < 0:
+            raise ValueError("Counters can only be increased")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        return [(self.name, dict(zip(self.labelnames, key)), value) for key, value in values.items()]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, e.g., the number of requests in flight."""
+    type_name = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        return [(self.name, dict(zip(self.labelnames, key)), value) for key, value in values.items()]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values, e.g., request durations, counted in cumulative buckets."""
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DURATION_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            bucket_counts = state[0]
+            for i, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    bucket_counts[i] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    def count(self, **labels) -> int:
+        state = self._values.get(self._key(labels))
+        return state[2] if state is not None else 0
+
+    def sum(self, **labels) -> float:
+        state = self._values.get(self._key(labels))
+        return state[1] if state is not None else 0.0
+
+    def samples(self):
+        with self._lock:
+            values = {key: (list(state[0]), state[1], state[2]) for key, state in self._values.items()}
+        samples = []
+        for key, (bucket_counts, total, count) in values.items():
+            labels = dict(zip(self.labelnames, key))
+            cumulative_count = 0
+            for upper_bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative_count += bucket_count
+                samples.append((f"{self.name}_bucket", {**labels, "le": _format_value(upper_bound)},
+                                cumulative_count))
+            samples.append((f"{self.name}_sum", labels, total))
+            samples.append((f"{self.name}_count", labels, count))
+        return samples
+
+
+class MetricsRegistry(object):
+    """Collection of metrics, exported together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric_cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_cls(name, documentation, labelnames, **kwargs)
+            elif type(metric) is not metric_cls or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered with another type or other labels")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DURATION_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def collect(self) -> List[_Metric]:
+        with self._lock:
+            return list(self._metrics.values())
+
+    def clear(self):
+        """Resets the values of all metrics."""
+        for metric in self.collect():
+            metric.clear()
+
+    def to_prometheus_text(self) -> str:
+        """Returns the metrics in the Prometheus text exposition format."""
+        lines = []
+        for metric in self.collect():
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            for sample_name, labels, value in metric.samples():
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    escaped = ('{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+               for name, value in labels.items())
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "planqk_http_requests_total", "HTTP requests sent to PlanQK by method, endpoint and response status",
+    ("method", "endpoint", "status"))
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "planqk_http_request_duration_seconds", "Duration of HTTP requests sent to PlanQK", ("method", "endpoint"))
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    "planqk_http_requests_in_flight", "HTTP requests sent to PlanQK awaiting their response")
+HTTP_RESPONSE_SIZE = REGISTRY.histogram(
+    "planqk_http_response_size_bytes", "Size of the response bodies received from PlanQK, e.g., of job results",
+    ("method", "endpoint"), buckets=SIZE_BUCKETS)
+JOBS_SUBMITTED = REGISTRY.counter(
+    "planqk_jobs_submitted_total", "Jobs submitted by backend", ("backend",))
+JOB_STATUS_POLLS = REGISTRY.counter(
+    "planqk_job_status_polls_total", "Job status requests by backend", ("backend",))
+JOBS_FINISHED = REGISTRY.counter(
+    "planqk_jobs_finished_total", "Jobs observed in a final state by backend and status", ("backend", "status"))
+JOB_QUEUE_TIME = REGISTRY.histogram(
+    "planqk_job_queue_seconds", "Time jobs waited from their creation until their execution began", ("backend",),
+    buckets=JOB_TIME_BUCKETS)
+JOB_EXECUTION_TIME = REGISTRY.histogram(
+    "planqk_job_execution_seconds", "Execution time of jobs", ("backend",), buckets=JOB_TIME_BUCKETS)
+TRANSPILATION_CACHE_LOOKUPS = REGISTRY.counter(
+    "planqk_transpilation_cache_lookups_total", "Lookups of transpiled circuits by backend and result, i.e., "
+    "whether the circuit was found in memory, on disk or not at all", ("backend", "result"))
+
+_enabled = True
+_ID_SEGMENT = re.compile(r"/(backends|jobs)/[^/?]+")
+_ENDPOINT_START = re.compile(r"/(backends|jobs)(/|$)")
+
+
+def set_enabled(enabled: bool):
+    """Enables or disables the collection of the SDK metrics, collection is enabled by default."""
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def endpoint_of(url: str) -> str:
+    """Returns the endpoint of a PlanQK API url with ids replaced by placeholders, e.g., "/jobs/{id}/result"."""
+    path = url.split("?", 1)[0]
+    match = _ENDPOINT_START.search(path)
+    if match is None:
+        return "other"
+    return _ID_SEGMENT.sub(lambda m: f"/{m.group(1)}/{{id}}", path[match.start():]).rstrip("/")
+
+
+def record_http_request(method: str, url: str, status, duration: float, response_size: Optional[int] = None):
+    if not _enabled:
+        return
+    endpoint = endpoint_of(url)
+    method = method.upper()
+    HTTP_REQUESTS.inc(method=method, endpoint=endpoint, status=status)
+    HTTP_REQUEST_DURATION.observe(duration, method=method, endpoint=endpoint)
+    if response_size is not None:
+        HTTP_RESPONSE_SIZE.observe(response_size, method=method, endpoint=endpoint)
+
+
+def record_job_submitted(backend_id: Optional[str]):
+    if _enabled:
+        JOBS_SUBMITTED.inc(backend=backend_id or "unknown")
+
+
+def record_job_status_poll(backend_id: Optional[str]):
+    if _enabled:
+        JOB_STATUS_POLLS.inc(backend=backend_id or "unknown")
+
+
+def record_transpilation_cache_lookup(backend_id: Optional[str], result: str):
+    if _enabled:
+        TRANSPILATION_CACHE_LOOKUPS.inc(backend=backend_id or "unknown", result=result)
+
+
+def record_job_finished(job_details):
+    """Records the final status and the queue and execution time of a job, given as JobDto."""
+    if not _enabled:
+        return
+    backend = job_details.backend_id or "unknown"
+    status = getattr(job_details.status, "value", job_details.status)
+    JOBS_FINISHED.inc(backend=backend, status=status)
+
+    created = _parse_time(job_details.creation_time)
+    began = _parse_time(job_details.begin_execution_time)
+    ended = _parse_time(job_details.end_execution_time)
+    if created is not None and began is not None:
+        JOB_QUEUE_TIME.observe(max((began - created).total_seconds(), 0.0), backend=backend)
+    if began is not None and ended is not None:
+        JOB_EXECUTION_TIME.observe(max((ended - began).total_seconds(), 0.0), backend=backend)
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        # fromisoformat supports the "Z" suffix only as of Python 3.11
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        logger.debug("Cannot parse job timestamp %s", value)
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.server.registry.to_prometheus_text().encode("utf-8")
+        self.send_response(200)
+        self.send_header("content-type", PROMETHEUS_CONTENT_TYPE)
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(port: int = 9464, host: str = "127.0.0.1",
+                         registry: MetricsRegistry = REGISTRY) -> ThreadingHTTPServer:
+    """Serves the metrics in the Prometheus text format under /metrics in a background thread.
+
+    Args:
+        port: port to listen on, 0 selects a free port
+        host: address to bind to
+        registry: registry of the metrics to serve
+
+    Returns:
+        the server, call its ``shutdown`` method to stop it
+    """
+    server = ThreadingHTTPServer((host, port), _MetricsRequestHandler)
+    server.daemon_threads = True
+    server.registry = registry
+    threading.Thread(target=server.serve_forever, name="planqk-metrics", daemon=True).start()
+    return server
+
+
+def write_prometheus_text(path: str, registry: MetricsRegistry = REGISTRY):
+    """Writes the metrics in the Prometheus text format to a file, e.g., for the textfile collector."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(registry.to_prometheus_text())
@@ -1,22 +1,26 @@
 import json
 from datetime import datetime
-from typing import Optional, Type, Any, Callable, Dict, Union, Sequence
+from typing import Optional, Type, Any, Callable, Dict, Union, Sequence, TYPE_CHECKING
 
 from qiskit.providers import Backend, JobStatus
-from qiskit_ibm_runtime import RuntimeJobMaxTimeoutError, RuntimeJobFailureError, RuntimeInvalidStateError
-from qiskit_ibm_runtime.constants import DEFAULT_DECODERS
-from qiskit_ibm_runtime.utils.result_decoder import ResultDecoder
 
-from planqk.qiskit import PlanqkJob
+from planqk.qiskit import PlanqkJob, instrumentation
 from planqk.qiskit.client.client import _PlanqkClient
 from planqk.qiskit.client.job_dtos import JobDto
 from planqk.qiskit.job import JobStatusMap
 
+if TYPE_CHECKING:
+    # qiskit_ibm_runtime is imported once a runtime job is created as importing it takes about a second
+    from qiskit_ibm_runtime.utils.result_decoder import ResultDecoder
+
 
 class PlanqkRuntimeJob(PlanqkJob):
 
     def __init__(self, backend: Optional[Backend], job_id: Optional[str] = None, job_details: Optional[JobDto] = None,
-                 result_decoder: Optional[Union[Type[ResultDecoder], Sequence[Type[ResultDecoder]]]] = None):
+                 result_decoder: Optional[Union[Type["ResultDecoder"], Sequence[Type["ResultDecoder"]]]] = None):
+        from qiskit_ibm_runtime.constants import DEFAULT_DECODERS
+        from qiskit_ibm_runtime.utils.result_decoder import ResultDecoder
+
         super().__init__(backend, job_id, job_details)
         self._session_id = self._job_details.input_params['session_id']
         self._program_id = self._job_details.input_params['program_id']
@@ -27,13 +31,17 @@ class PlanqkRuntimeJob(PlanqkJob):
         else:
             self._interim_result_decoder = self._final_result_decoder = decoder
 
-    def interim_results(self, decoder: Optional[Type[ResultDecoder]] = None) -> Any:
+    def __reduce__(self):
+        cls, args = super().__reduce__()
+        return cls, args + ((self._interim_result_decoder, self._final_result_decoder),)
+
+    def interim_results(self, decoder: Optional[Type["ResultDecoder"]] = None) -> Any:
         raise NotImplementedError("Interim results are not supported for PlanQK runtime jobs.")
 
     def result(  # pylint: disable=arguments-differ
             self,
             timeout: Optional[float] = None,
-            decoder: Optional[Type[ResultDecoder]] = None,
+            decoder: Optional[Type["ResultDecoder"]] = None,
     ) -> Any:
         """Return the results of the job.
 
@@ -49,6 +57,8 @@ class PlanqkRuntimeJob(PlanqkJob):
             RuntimeJobMaxTimeoutError: If the job does not complete within given timeout.
             RuntimeInvalidStateError: If the job was cancelled, and attempting to retrieve result.
         """
+        from qiskit_ibm_runtime import RuntimeJobMaxTimeoutError, RuntimeJobFailureError, RuntimeInvalidStateError
+
         _decoder = decoder or self._final_result_decoder
         if self._result is None or (_decoder != self._final_result_decoder):
             self.wait_for_final_state(timeout=timeout)
@@ -66,11 +76,12 @@ class PlanqkRuntimeJob(PlanqkJob):
 
             result_raw = _PlanqkClient.get_job_result(self._job_id, self.backend().backend_provider)
 
-            self._result = _decoder.decode(json.dumps(result_raw)) if result_raw else None
+            with instrumentation.span("build_result", decoder=_decoder.__name__):
+                self._result = _decoder.decode(json.dumps(result_raw)) if result_raw else None
         return self._result
 
     def stream_results(
-            self, callback: Callable, decoder: Optional[Type[ResultDecoder]] = None
+            self, callback: Callable, decoder: Optional[Type["ResultDecoder"]] = None
     ) -> None:
         raise NotImplementedError("Result streaming is not supported for PlanQK runtime jobs.")
 
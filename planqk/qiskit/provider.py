@@ -1,15 +1,24 @@
+import contextvars
 import json
-from typing import List
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 from qiskit.providers import ProviderV1 as Provider, QiskitBackendNotFoundError
 
 from planqk.credentials import DefaultCredentialsProvider
 from planqk.exceptions import PlanqkClientError
-from planqk.qiskit import PlanqkJob
+from planqk.qiskit import PlanqkJob, instrumentation
 from planqk.qiskit.backend import PlanqkBackend
-from planqk.qiskit.client.backend_dtos import PROVIDER
+from planqk.qiskit.client.backend_dtos import PROVIDER, BackendDto, BackendStateInfosDto
 from planqk.qiskit.client.client import _PlanqkClient
 
+logger = logging.getLogger(__name__)
+
+# Time in seconds warmed-up backends are returned by get_backend before they are validated against PlanQK again
+BACKEND_CACHE_TTL = 60.0
+
 
 class PlanqkQuantumProvider(Provider):
 
@@ -22,6 +31,21 @@ class PlanqkQuantumProvider(Provider):
         """
         _PlanqkClient.set_credentials(DefaultCredentialsProvider(access_token))
         _PlanqkClient.set_organization_id(organization_id)
+        self._organization_id = organization_id
+        # Warmed-up backends by their id, with the ttl and the time they were last validated
+        self._backend_cache: Dict[str, Tuple[PlanqkBackend, float, float]] = {}
+
+    def __getstate__(self):
+        # Credentials are process wide, the client of the unpickling process resolves them from the environment
+        state = self.__dict__.copy()
+        state["_backend_cache"] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # The organization id is process wide as well, but cannot be resolved from the environment if it was passed
+        if self._organization_id is not None:
+            _PlanqkClient.set_organization_id(self._organization_id)
 
     def backends(self, provider: PROVIDER = None, **kwargs):
         """
@@ -40,7 +64,8 @@ class PlanqkQuantumProvider(Provider):
                    :param name:
                    :param provider: the provider of the backend
         """
-        backend_dtos = _PlanqkClient.get_backends()
+        with instrumentation.span("get_backends"):
+            backend_dtos = _PlanqkClient.get_backends()
 
         supported_backend_ids = [
             backend_info.id for backend_info in backend_dtos
@@ -64,21 +89,51 @@ class PlanqkQuantumProvider(Provider):
                 more than one backend matches the filtering criteria.
 
         """
-        try:
-            backend_dto = _PlanqkClient.get_backend(backend_id=name)
-            if provider is not None and backend_dto.provider != provider:
-                raise QiskitBackendNotFoundError(
-                    "No backend matches the criteria. "
-                    "Reason: Required provider {0} does not match with returned backend provider {1}.".format(
-                        provider, backend_dto.provider))
-        except PlanqkClientError as e:
-            if e.response.status_code == 404:
-                error_detail = json.loads(e.response.text)
-                raise QiskitBackendNotFoundError(
-                    "No backend matches the criteria. Reason: " + error_detail['error'])
-            raise e
+        cached_backend, ttl, validated_at = self._backend_cache.get(name, (None, None, None))
+        if kwargs or (cached_backend is not None and provider is not None
+                      and cached_backend.backend_info.provider != provider):
+            cached_backend = None
+        if cached_backend is not None and time.monotonic() - validated_at < ttl:
+            return cached_backend
+
+        with instrumentation.span("get_backend", backend_id=name):
+            try:
+                backend_dto = _PlanqkClient.get_backend(backend_id=name)
+                if provider is not None and backend_dto.provider != provider:
+                    raise QiskitBackendNotFoundError(
+                        "No backend matches the criteria. "
+                        "Reason: Required provider {0} does not match with returned backend provider {1}.".format(
+                            provider, backend_dto.provider))
+            except PlanqkClientError as e:
+                if e.response.status_code == 404:
+                    error_detail = json.loads(e.response.text)
+                    raise QiskitBackendNotFoundError(
+                        "No backend matches the criteria. Reason: " + error_detail['error'])
+                raise e
 
-        backend_state_dto = _PlanqkClient.get_backend_state(backend_id=name)
+            backend_state_dto = _PlanqkClient.get_backend_state(backend_id=name)
+            if cached_backend is not None:
+                return self._revalidate_cached_backend(cached_backend, ttl, backend_dto, backend_state_dto)
+            return self._create_backend(backend_dto, backend_state_dto, **kwargs)
+
+    def _revalidate_cached_backend(self, cached_backend: PlanqkBackend, ttl: float, backend_dto: BackendDto,
+                                   backend_state_dto: Optional[BackendStateInfosDto]) -> PlanqkBackend:
+        """Keeps the expired cached backend if its version is unchanged, refreshing its status. Otherwise, e.g., if the
+        backend was recalibrated, it is replaced by a backend created from the current details."""
+        backend_info = cached_backend.backend_info
+        if backend_dto.updated_at is not None and backend_dto.updated_at == backend_info.updated_at:
+            backend_info.status = backend_state_dto.status if backend_state_dto else backend_dto.status
+            backend = cached_backend
+        else:
+            backend = self._build_backend(backend_dto, backend_state_dto)
+        self._backend_cache[backend_dto.id] = (backend, ttl, time.monotonic())
+        return backend
+
+    def clear_backend_cache(self):
+        """Drops the backends created by ``warm_up``, i.e., later calls of ``get_backend`` fetch the backends again."""
+        self._backend_cache = {}
+
+    def _create_backend(self, backend_dto: BackendDto, backend_state_dto: Optional[BackendStateInfosDto], **kwargs):
         if backend_state_dto:
             backend_dto.status = backend_state_dto.status
 
@@ -96,6 +151,84 @@ class PlanqkQuantumProvider(Provider):
 
         return self._get_backend_object(backend_dto, backend_init_params)
 
+    def warm_up(self, ids: Optional[List[str]] = None, concurrency: int = 8,
+                ttl: float = BACKEND_CACHE_TTL) -> Dict[str, PlanqkBackend]:
+        """Creates the backends up front, e.g., when a worker starts, so that later calls of ``get_backend`` return
+        them without any request.
+
+        The backend details and states are fetched concurrently and the backends, including their targets, are
+        built in parallel. Warming up again refreshes the cached backends. Once ``ttl`` seconds passed,
+        ``get_backend`` fetches the backend details and state again: the status of the cached backend is refreshed
+        and, if the backend was updated, e.g., recalibrated, it is replaced by a new backend. Use
+        ``clear_backend_cache`` to drop the cached backends.
+
+        Args:
+            ids: ids of the backends to create, by default all backends of the catalog supported by the provider
+            concurrency: maximum number of requests and backend builds running at the same time
+            ttl: time in seconds the cached backends are returned without being validated against PlanQK
+
+        Returns:
+            the created backends by their id
+
+        Raises:
+            QiskitBackendNotFoundError: if a backend with one of the given ids does not exist
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+
+        with instrumentation.span("warm_up", concurrency=concurrency) as warm_up_span:
+            backend_dtos: Dict[str, BackendDto] = {}
+            if ids is None:
+                backend_dtos = {backend_dto.id: backend_dto for backend_dto in _PlanqkClient.get_backends()
+                                if backend_dto.provider != PROVIDER.DWAVE}
+                ids = list(backend_dtos)
+
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="planqk-warm-up") as executor:
+                def submit(fn, *args):
+                    # Run each task in a copy of the current context so that its spans are children of warm_up
+                    return executor.submit(contextvars.copy_context().run, fn, *args)
+
+                state_futures = {backend_id: submit(_PlanqkClient.get_backend_state, backend_id)
+                                 for backend_id in ids}
+                dto_futures = {backend_id: submit(self._fetch_backend_dto, backend_id)
+                               for backend_id in ids if backend_id not in backend_dtos}
+                for backend_id, dto_future in dto_futures.items():
+                    backend_dtos[backend_id] = dto_future.result()
+
+                backend_futures = {backend_id: submit(self._build_backend, backend_dtos[backend_id],
+                                                      state_futures[backend_id].result())
+                                   for backend_id in ids}
+                backends = {backend_id: future.result() for backend_id, future in backend_futures.items()}
+
+            warmed_up_backends = {}
+            for backend_id, backend in backends.items():
+                if isinstance(backend, Exception):
+                    logger.info(f"Skipping warm-up of backend {backend_id}: {backend}")
+                    continue
+                warmed_up_backends[backend_id] = backend
+            validated_at = time.monotonic()
+            self._backend_cache.update({backend_id: (backend, ttl, validated_at)
+                                        for backend_id, backend in warmed_up_backends.items()})
+            warm_up_span.set_attribute("backends", len(warmed_up_backends))
+            return warmed_up_backends
+
+    def _build_backend(self, backend_dto: BackendDto, backend_state_dto: Optional[BackendStateInfosDto]):
+        """Creates the backend and builds its target and configuration, which are otherwise built on first use."""
+        backend = self._create_backend(backend_dto, backend_state_dto)
+        if isinstance(backend, PlanqkBackend):
+            backend.target
+            backend.configuration()
+        return backend
+
+    @staticmethod
+    def _fetch_backend_dto(backend_id: str) -> BackendDto:
+        try:
+            return _PlanqkClient.get_backend(backend_id=backend_id)
+        except PlanqkClientError as e:
+            if e.response.status_code == 404:
+                raise QiskitBackendNotFoundError(f"No backend with id '{backend_id}' exists.") from e
+            raise e
+
     def _get_backend_object(self, backend_dto, backend_init_params):
         if backend_dto.provider == PROVIDER.AWS:
             from planqk.qiskit.providers.aws.aws_backend import PlanqkAwsBackend
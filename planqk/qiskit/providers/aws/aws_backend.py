@@ -1,19 +1,16 @@
-from typing import Optional, Dict
-
-from braket.circuits import Circuit, Instruction
-from braket.circuits.circuit_helpers import validate_circuit_and_shots
-from braket.circuits.compiler_directives import StartVerbatimBox
-from braket.circuits.gates import PulseGate
-from braket.circuits.serialization import QubitReferenceType, OpenQASMSerializationProperties, IRType
-from braket.ir.openqasm import Program as OpenQASMProgram
+from typing import FrozenSet, List, Mapping, Optional, Sequence
+
 from qiskit import QuantumCircuit
 from qiskit.circuit import Gate
 from qiskit.providers import Options
-from qiskit_braket_provider.providers.adapter import _GATE_NAME_TO_QISKIT_GATE, to_braket
+from qiskit_braket_provider.providers.adapter import _GATE_NAME_TO_QISKIT_GATE
 
-from planqk.qiskit import PlanqkBackend
+from planqk.qiskit import PlanqkBackend, instrumentation
 from planqk.qiskit.client.job_dtos import INPUT_FORMAT
+from planqk.qiskit.client.serialization import PreEncodedJson
+from planqk.qiskit.job import PlanqkJob
 from planqk.qiskit.options import OptionsV2
+from planqk.qiskit.providers.aws.openqasm import declared_inputs, qiskit_to_braket_openqasm, to_inputs
 
 
 class PlanqkAwsBackend(PlanqkBackend):
@@ -23,7 +20,10 @@ class PlanqkAwsBackend(PlanqkBackend):
 
     @classmethod
     def _default_options(cls):
-        return OptionsV2()
+        # Values of the circuit parameters, bound when the OpenQASM program is executed
+        # disable_qubit_rewiring: whether the qubits of the circuit are executed as the physical qubits of the same
+        # indices instead of being mapped by Braket
+        return OptionsV2(inputs=None, disable_qubit_rewiring=False)
 
     def to_gate(self, name: str) -> Optional[Gate]:
         name = name.lower()
@@ -34,66 +34,92 @@ class PlanqkAwsBackend(PlanqkBackend):
     def get_single_qubit_gate_properties(self) -> dict:
         if self.is_simulator:
             return {None: None}
-        return {(int(qubit.id),): None for qubit in self.backend_info.configuration.qubits}
+        return self.connectivity.qubit_properties()
 
     def get_multi_qubit_gate_properties(self) -> dict:
-        qubits = self.backend_info.configuration.qubits
-        connectivity = self.backend_info.configuration.connectivity
         if self.is_simulator:
             return {None: None}
-        if connectivity.fully_connected:
-            return {(int(qubit1.id), int(qubit2.id)): None for qubit1 in qubits for qubit2 in qubits
-                    if qubit1.id != qubit2.id}
-        else:
-            return {(int(qubit), int(connected_qubit)): None
-                    for qubit, connections in connectivity.graph.items()
-                    for connected_qubit in connections}
+        return self.connectivity.edge_properties()
 
     def convert_to_job_input(self, circuit: QuantumCircuit, options: Options = None):
         shots = options.get("shots", 1)
-        inputs = options.get("inputs", {})
         verbatim = options.get("verbatim", False)
 
         basis_gates = self.operation_names if not verbatim else None
-        braket_circuit = to_braket(circuit, basis_gates, verbatim=verbatim)
+        # Equals converting the circuit with to_braket of qiskit_braket_provider and serializing it to OpenQASM
+        return qiskit_to_braket_openqasm(circuit, basis_gates, verbatim=verbatim,
+                                         disable_qubit_rewiring=options.get("disable_qubit_rewiring", False),
+                                         shots=shots)
 
-        validate_circuit_and_shots(braket_circuit, shots)
+    def _translatable_operation_names(self, options) -> Optional[FrozenSet[str]]:
+        # Unless executed verbatim, circuits are transpiled to the gates of the target when converted to Braket
+        return frozenset() if options.get("verbatim", False) else None
 
-        return self._transform_braket_to_qasm_3_program(braket_circuit, False, inputs)
+    def _uses_physical_qubits(self, options) -> bool:
+        # Braket maps and routes the qubits of circuits unless they are executed verbatim or without qubit rewiring
+        return options.get("verbatim", False) or options.get("disable_qubit_rewiring", False)
 
     def get_job_input_format(self) -> INPUT_FORMAT:
         return INPUT_FORMAT.BRAKET_OPEN_QASM_V3
 
     def convert_to_job_params(self, circuit, options=None) -> dict:
-        return {'disable_qubit_rewiring': False}
-
-    def _transform_braket_to_qasm_3_program(self, braket_circuit: Circuit,
-                                            disable_qubit_rewiring: bool,
-                                            inputs: Dict[str, float]) -> str:
-        """Transforms a Braket input to a QASM 3 program."""
-
-        qubit_reference_type = QubitReferenceType.VIRTUAL
-
-        if (
-                disable_qubit_rewiring
-                or Instruction(StartVerbatimBox()) in braket_circuit.instructions
-                or any(isinstance(instruction.operator, PulseGate) for instruction in braket_circuit.instructions)
-        ):
-            qubit_reference_type = QubitReferenceType.PHYSICAL
-
-        serialization_properties = OpenQASMSerializationProperties(
-            qubit_reference_type=qubit_reference_type
-        )
-
-        openqasm_program = braket_circuit.to_ir(
-            ir_type=IRType.OPENQASM, serialization_properties=serialization_properties
-        )
+        options = options if options is not None else self.options
+        params = {'disable_qubit_rewiring': bool(options.get("disable_qubit_rewiring", False))}
+        inputs = options.get("inputs")
         if inputs:
-            inputs_copy = openqasm_program.inputs.copy() if openqasm_program.inputs is not None else {}
-            inputs_copy.update(inputs)
-            openqasm_program = OpenQASMProgram(
-                source=openqasm_program.source,
-                inputs=inputs_copy,
-            )
-
-        return openqasm_program.source
+            params['inputs'] = to_inputs(inputs)
+        return params
+
+    def run_parameter_sweep(self, circuit: QuantumCircuit, parameter_binds: Sequence[Mapping],
+                            **kwargs) -> List[PlanqkJob]:
+        """Run a parameterized circuit once per parameter bind, binding the parameters when the job is executed.
+
+        The circuit is validated, converted into an OpenQASM program declaring its parameters as inputs and encoded as
+        JSON once, instead of once per parameter bind. Each job of the sweep adds its input values to the shared
+        program.
+
+        As PlanQK has no batch endpoint, each parameter bind is still submitted as a job of its own that contains the
+        complete program, i.e., a sweep of N points uploads the program N times. Only the client-side validation,
+        conversion and encoding are saved.
+
+        Example:
+            theta = Parameter("theta")
+            circuit = QuantumCircuit(1)
+            circuit.rx(theta, 0)
+            circuit.measure_all()
+            jobs = backend.run_parameter_sweep(circuit, [{theta: 0.1}, {theta: 0.2}], shots=100)
+
+        Args:
+            circuit: parameterized circuit to run
+            parameter_binds: values of the parameters for each job, as mappings from the parameters or their names
+                to values
+            **kwargs: additional arguments for the execution, as for run
+
+        Returns:
+            the jobs in the order of the parameter binds
+
+        Raises:
+            ValueError: if a parameter bind does not assign a value to each parameter of the circuit
+        """
+        circuit, shots, options = self._prepare_run(circuit, kwargs)
+
+        with instrumentation.span("run_parameter_sweep", backend=self.name, num_jobs=len(parameter_binds)):
+            if kwargs.get("validate", True):
+                with instrumentation.span("validate", num_instructions=len(circuit.data)):
+                    self.validate_circuit(circuit, shots, options)
+
+            with instrumentation.span("convert_to_job_input", num_qubits=circuit.num_qubits):
+                program = self.convert_to_job_input(circuit, options)
+                names = declared_inputs(program)
+                job_input = PreEncodedJson.encode(program)
+            params = self.convert_to_job_params(circuit, options)
+
+            job_params = []
+            for parameter_values in parameter_binds:
+                inputs = {**params.get('inputs', {}), **to_inputs(parameter_values)}
+                missing = names.difference(inputs)
+                if missing:
+                    raise ValueError(f"No values given for the parameters {', '.join(sorted(missing))}")
+                job_params.append({**params, 'inputs': inputs})
+
+            return [self._create_job(job_input, input_params, shots) for input_params in job_params]
@@ -0,0 +1,278 @@
+"""Direct conversion of Qiskit circuits to the OpenQASM 3 programs executed by Braket.
+
+The programs equal the ones of converting the circuit with `to_braket` and serializing the Braket circuit with
+`Circuit.to_ir`, but they are written line by line without building the Braket circuit. The gates are mapped as by
+`qiskit_braket_provider`, see `_GATE_NAME_TO_BRAKET_GATE`. Rarely used cases, i.e., gates without entry in the
+tables below or symbolic parameters of gates transforming their parameters, are serialized by the Braket gates.
+"""
+import re
+import threading
+import warnings
+from collections import OrderedDict
+from math import pi
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from braket.circuits import FreeParameter, FreeParameterExpression, Instruction
+from braket.circuits.serialization import IRType, OpenQASMSerializationProperties, QubitReferenceType
+from qiskit import QuantumCircuit, transpile
+from qiskit.circuit import ControlledGate, ParameterExpression
+from qiskit_braket_provider.providers.adapter import (
+    _EPS,
+    _GATE_NAME_TO_BRAKET_GATE,
+    _GPHASE_GATE_NAME,
+    _QISKIT_CONTROLLED_GATE_NAMES_TO_BRAKET_GATES,
+    _TRANSLATABLE_QISKIT_GATE_NAMES,
+    _validate_name_conflicts,
+)
+
+from planqk.qiskit.transpilation import circuit_fingerprint
+
+# Maximum number of memoized programs of transpiled circuits
+_MAX_PROGRAMS = 64
+
+_programs: "OrderedDict[tuple, Tuple[str, bool]]" = OrderedDict()
+_programs_lock = threading.Lock()
+
+_INPUT_DECLARATION = re.compile(r"^input float (\w+);$", re.MULTILINE)
+
+# Qiskit gate name -> OpenQASM name of the Braket gate and the transformation of the parameters, if any
+_GATES: Dict[str, Tuple[str, Optional[Callable]]] = {
+    "u": ("U", None),
+    "u3": ("U", None),
+    "u2": ("U", lambda phi, lam: (pi / 2, phi, lam)),
+    "u1": ("U", lambda lam: (0, 0, lam)),
+    "p": ("phaseshift", None),
+    "cp": ("cphaseshift", None),
+    "cx": ("cnot", None),
+    "x": ("x", None),
+    "y": ("y", None),
+    "z": ("z", None),
+    "t": ("t", None),
+    "tdg": ("ti", None),
+    "s": ("s", None),
+    "sdg": ("si", None),
+    "sx": ("v", None),
+    "sxdg": ("vi", None),
+    "swap": ("swap", None),
+    "rx": ("rx", None),
+    "ry": ("ry", None),
+    "rz": ("rz", None),
+    "rzz": ("zz", None),
+    "id": ("i", None),
+    "h": ("h", None),
+    "cy": ("cy", None),
+    "cz": ("cz", None),
+    "ccx": ("ccnot", None),
+    "cswap": ("cswap", None),
+    "rxx": ("xx", None),
+    "ryy": ("yy", None),
+    "ecr": ("ecr", None),
+    "iswap": ("iswap", None),
+    # IonQ gates, their parameters are given in turns
+    "gpi": ("gpi", lambda turns: (2 * pi * turns,)),
+    "gpi2": ("gpi2", lambda turns: (2 * pi * turns,)),
+    "ms": ("ms", lambda turns_1, turns_2, turns_3: (2 * pi * turns_1, 2 * pi * turns_2, 2 * pi * turns_3)),
+    "zz": ("zz", lambda turns: (2 * pi * turns,)),
+    _GPHASE_GATE_NAME: ("gphase", None),
+}
+
+# Qiskit controlled gate name -> OpenQASM name and number of qubits of the Braket gate the controls are applied to
+_CONTROLLED_GATES: Dict[str, Tuple[str, int]] = {
+    "ch": ("h", 1),
+    "cs": ("s", 1),
+    "csdg": ("si", 1),
+    "csx": ("v", 1),
+    "crx": ("rx", 1),
+    "cry": ("ry", 1),
+    "crz": ("rz", 1),
+    "ccz": ("cz", 2),
+    "c3sx": ("v", 1),
+    "mcx": ("cnot", 2),
+}
+
+
+def qiskit_to_braket_openqasm(circuit: QuantumCircuit, basis_gates: Optional[Iterable[str]] = None,
+                              verbatim: bool = False, disable_qubit_rewiring: bool = False,
+                              shots: Optional[int] = None) -> str:
+    """Converts a Qiskit circuit to the OpenQASM 3 program executed by Braket.
+
+    Args:
+        circuit: circuit to convert
+        basis_gates: gates the circuit is transpiled to if it contains other gates, all gates supported by Braket if
+            None
+        verbatim: whether the circuit is executed without modification, i.e., in a verbatim box on physical qubits
+        disable_qubit_rewiring: whether the program refers to physical qubits
+        shots: number of shots the circuit is validated for as by `validate_circuit_and_shots`, not validated if None
+
+    Returns:
+        the source of the OpenQASM program, memoized per circuit fingerprint and options if the circuit is transpiled
+    """
+    basis_gates = set(basis_gates or _TRANSLATABLE_QISKIT_GATE_NAMES)
+    if verbatim or {instruction.operation.name for instruction in circuit.data}.issubset(basis_gates):
+        program, measured = _emit(circuit, basis_gates, verbatim, disable_qubit_rewiring)
+    else:
+        # Transpiling dominates the conversion, hence, the programs of transpiled circuits are memoized. Circuits
+        # already consisting of basis gates are not, computing their fingerprint costs as much as emitting them.
+        key = (circuit_fingerprint(circuit), frozenset(basis_gates), disable_qubit_rewiring)
+        with _programs_lock:
+            cached = _programs.get(key)
+            if cached is not None:
+                _programs.move_to_end(key)
+        if cached is None:
+            transpiled_circuit = transpile(circuit, basis_gates=basis_gates, optimization_level=0)
+            cached = _emit(transpiled_circuit, basis_gates, verbatim, disable_qubit_rewiring)
+            with _programs_lock:
+                _programs[key] = cached
+                while len(_programs) > _MAX_PROGRAMS:
+                    _programs.popitem(last=False)
+        program, measured = cached
+
+    if shots is not None and not shots and not measured:
+        raise ValueError("No result types specified for circuit and shots=0. See `braket.circuits.result_types`")
+    return program
+
+
+def _emit(circuit: QuantumCircuit, basis_gates: Set[str], verbatim: bool,
+          disable_qubit_rewiring: bool) -> Tuple[str, bool]:
+    """Returns the program of a circuit consisting of basis gates and whether the program samples any qubits."""
+    _validate_name_conflicts(circuit.parameters)
+
+    physical = verbatim or disable_qubit_rewiring
+    serialization_properties = OpenQASMSerializationProperties(
+        qubit_reference_type=QubitReferenceType.PHYSICAL if physical else QubitReferenceType.VIRTUAL)
+    targets = [f"${index}" if physical else f"q[{index}]" for index in range(circuit.num_qubits)]
+    qubit_indices = {qubit: index for index, qubit in enumerate(circuit.qubits)}
+
+    body: List[str] = []
+    parameter_names = set()
+    # Ordered by first use, as the qubits of Braket circuits before sorting
+    used_qubits: Dict[int, None] = {}
+    sampled_qubits: Dict[int, None] = {}
+    has_targeted_gate = False
+
+    for circuit_instruction in circuit.data:
+        operation = circuit_instruction.operation
+        name = operation.name
+        indices = [qubit_indices[qubit] for qubit in circuit_instruction.qubits]
+
+        if name == "measure":
+            sampled_qubits[indices[0]] = None
+            continue
+        if name == "barrier":
+            warnings.warn("The Qiskit circuit contains barrier instructions that are ignored.")
+            continue
+        if name == "reset":
+            raise NotImplementedError("reset operation not supported by qiskit to braket adapter")
+        if isinstance(operation, ControlledGate) and operation.ctrl_state != 2 ** operation.num_ctrl_qubits - 1:
+            raise ValueError("Negative control is not supported")
+
+        has_targeted_gate = has_targeted_gate or bool(indices)
+        controlled_gate = _CONTROLLED_GATES.get(name)
+        if controlled_gate is not None:
+            # The target qubits of controlled Braket gates precede their control qubits
+            target_count = controlled_gate[1]
+            used_qubits.update(dict.fromkeys(indices[-target_count:] + indices[:-target_count]))
+        else:
+            used_qubits.update(dict.fromkeys(indices))
+        params = operation.params
+        symbolic = any(isinstance(param, ParameterExpression) and param.parameters for param in params)
+        if symbolic:
+            for param in params:
+                if isinstance(param, ParameterExpression):
+                    parameter_names.update(_rename(parameter) for parameter in param.parameters)
+
+        gate = _GATES.get(name)
+        if gate is not None and not (symbolic and gate[1] is not None):
+            qasm_name, transform = gate
+            if transform is not None:
+                params = transform(*params)
+            body.append(_gate_line(qasm_name, params, [targets[index] for index in indices]))
+        elif controlled_gate is not None:
+            qasm_name, target_count = controlled_gate
+            num_controls = len(indices) - target_count
+            modifier = "ctrl @ " if num_controls == 1 else f"ctrl({num_controls}) @ "
+            body.append(modifier + _gate_line(qasm_name, params, [targets[index] for index in indices]))
+        else:
+            body.extend(_braket_gate_lines(operation, indices, serialization_properties))
+
+    global_phase = circuit.global_phase
+    if abs(global_phase) > _EPS:
+        if _GPHASE_GATE_NAME in basis_gates:
+            body.append(_gate_line("gphase", [global_phase], []))
+        else:
+            warnings.warn(f"Device does not support global phase; "
+                          f"global phase of {global_phase} will not be included in Braket circuit")
+
+    if not has_targeted_gate:
+        raise ValueError("Circuit must have at least one non-zero-qubit gate to run on a device")
+
+    lines = ["OPENQASM 3.0;"]
+    lines.extend(f"input float {name};" for name in sorted(parameter_names))
+    if not sampled_qubits:
+        lines.append(f"bit[{len(used_qubits)}] b;")
+    if not physical:
+        lines.append(f"qubit[{max(list(used_qubits) + list(sampled_qubits)) + 1}] q;")
+    if verbatim:
+        lines.append("#pragma braket verbatim")
+        lines.append("box{")
+        lines.extend(body)
+        lines.append("}")
+    else:
+        lines.extend(body)
+
+    if sampled_qubits:
+        lines.extend(f"#pragma braket result sample z({targets[index]})" for index in sampled_qubits)
+    else:
+        # Only the qubits of circuits with verbatim boxes are not sorted by Braket
+        measured_qubits = used_qubits if verbatim else sorted(used_qubits)
+        lines.extend(f"b[{bit}] = measure {targets[index]};" for bit, index in enumerate(measured_qubits))
+    return "\n".join(lines), bool(sampled_qubits)
+
+
+def _gate_line(qasm_name: str, params, qubit_targets: List[str]) -> str:
+    line = f"{qasm_name}({', '.join(map(_format_parameter, params))})" if params else qasm_name
+    return f"{line} {', '.join(qubit_targets)};" if qubit_targets else f"{line};"
+
+
+def _format_parameter(param) -> str:
+    if isinstance(param, ParameterExpression):
+        if not param.parameters:
+            return str(float(param))
+        return str(_free_parameter(param))
+    return str(float(param))
+
+
+def _rename(parameter) -> str:
+    """Renames ParameterVector elements from v[i] to v_i, as done by `to_braket`."""
+    return str(parameter).replace("[", "_").replace("]", "")
+
+
+def declared_inputs(program: str) -> Set[str]:
+    """Returns the names of the inputs declared by an OpenQASM program."""
+    return set(_INPUT_DECLARATION.findall(program))
+
+
+def to_inputs(parameter_values: Mapping) -> Dict[str, float]:
+    """Converts a mapping of Qiskit parameters, or their names, to values into the inputs of the OpenQASM program."""
+    return {_rename(parameter): float(value) for parameter, value in parameter_values.items()}
+
+
+def _free_parameter(param):
+    if isinstance(param, ParameterExpression) and param.parameters:
+        if len(param.parameters) == 1 and str(param) == str(next(iter(param.parameters))):
+            return FreeParameter(_rename(param))
+        return FreeParameterExpression(_rename(param))
+    return param
+
+
+def _braket_gate_lines(operation, indices: List[int], serialization_properties) -> List[str]:
+    params = [_free_parameter(param) for param in operation.params]
+    if operation.name in _QISKIT_CONTROLLED_GATE_NAMES_TO_BRAKET_GATES:
+        gates = _QISKIT_CONTROLLED_GATE_NAMES_TO_BRAKET_GATES[operation.name](*params)
+        instructions = [Instruction(operator=gate, target=indices[-gate.qubit_count:],
+                                    control=indices[:-gate.qubit_count]) for gate in gates]
+    else:
+        gates = _GATE_NAME_TO_BRAKET_GATE[operation.name](*params)
+        instructions = [Instruction(operator=gate, target=indices) for gate in gates]
+    return [instruction.to_ir(ir_type=IRType.OPENQASM, serialization_properties=serialization_properties)
+            for instruction in instructions]
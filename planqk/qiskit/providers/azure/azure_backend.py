@@ -1,7 +1,7 @@
-from typing import Optional
+from typing import FrozenSet, Optional
 
 from qiskit.circuit import Gate
-from qiskit_ionq.helpers import qiskit_circ_to_ionq_circ
+from qiskit_ionq.helpers import GATESET_MAP, qiskit_circ_to_ionq_circ
 
 from planqk.qiskit import PlanqkBackend
 from planqk.qiskit.client.job_dtos import INPUT_FORMAT
@@ -31,5 +31,9 @@ class PlanqkAzureBackend(PlanqkBackend):
             "circuit": ionq_circ,
         }
 
+    def _translatable_operation_names(self, options) -> Optional[FrozenSet[str]]:
+        # The target lists the IonQ gate names, the conversion maps the Qiskit gates to them
+        return frozenset(GATESET_MAP.get(options.get("gateset", "qis"), ()))
+
     def get_job_input_format(self) -> INPUT_FORMAT:
         return INPUT_FORMAT.IONQ_CIRCUIT_V1
@@ -6,7 +6,6 @@ from qiskit.circuit import IfElseOp, WhileLoopOp, ForLoopOp, SwitchCaseOp, Instr
 from qiskit.circuit import Parameter, Reset
 from qiskit.circuit.library import IGate, SXGate, XGate, CXGate, RZGate, ECRGate, CZGate
 from qiskit.qobj.utils import MeasLevel, MeasReturnType
-from qiskit_ibm_runtime import RuntimeEncoder
 
 from planqk.qiskit import PlanqkBackend
 from planqk.qiskit.client.job_dtos import INPUT_FORMAT
@@ -58,14 +57,10 @@ class PlanqkIbmBackend(PlanqkBackend):
         return ibm_name_mapping.get(name, None) or Gate(name, 0, [])
 
     def get_single_qubit_gate_properties(self) -> dict:
-        qubits = self.backend_info.configuration.qubits
-        return {None: None} if self.is_simulator else {(int(qubit.id),): None for qubit in qubits}
+        return {None: None} if self.is_simulator else self.connectivity.qubit_properties()
 
     def get_multi_qubit_gate_properties(self) -> dict:
-        connectivity = self.backend_info.configuration.connectivity
-        return {None: None} if self.is_simulator else {(int(qubit), int(connected_qubit)): None
-                                                       for qubit, connections in connectivity.graph.items()
-                                                       for connected_qubit in connections}
+        return {None: None} if self.is_simulator else self.connectivity.edge_properties()
 
     def to_non_gate_instruction(self, name: str) -> Optional[Instruction]:
         if name in qiskit_control_flow_mapping:
@@ -76,6 +71,8 @@ class PlanqkIbmBackend(PlanqkBackend):
         return super().to_non_gate_instruction(name)
 
     def convert_to_job_input(self, circuit, options=None) -> Tuple[INPUT_FORMAT, dict]:
+        from qiskit_ibm_runtime import RuntimeEncoder
+
         # Transforms circuit to base64 encoded byte stream
         input_json_str = json.dumps(circuit, cls=RuntimeEncoder)
         # Transform back to json but with the circuit property base64 encoded
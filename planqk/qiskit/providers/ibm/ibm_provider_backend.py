@@ -1,8 +1,8 @@
 import json
-from typing import Dict
+from typing import Dict, TYPE_CHECKING
 from typing import Optional, List
 
-from planqk.qiskit import PlanqkJob
+from planqk.qiskit import PlanqkJob, instrumentation
 from planqk.qiskit.client.backend_dtos import STATUS
 from planqk.qiskit.client.client import _PlanqkClient
 from planqk.qiskit.client.job_dtos import JobDto, INPUT_FORMAT, RuntimeJobParamsDto
@@ -10,12 +10,14 @@ from planqk.qiskit.planqk_runtime_job import PlanqkRuntimeJob
 from planqk.qiskit.providers.ibm.ibm_backend import PlanqkIbmBackend
 from qiskit import QuantumCircuit
 from qiskit.providers.models import BackendStatus
-from qiskit_ibm_provider import IBMBackend
-from qiskit_ibm_provider.job import IBMCircuitJob
-from qiskit_ibm_provider.utils import RuntimeEncoder
+
+if TYPE_CHECKING:
+    # qiskit_ibm_provider is imported once a backend is created as importing it takes about a second
+    from qiskit_ibm_provider.job import IBMCircuitJob
 
 
 def _encode_circuit_base64(circuit: QuantumCircuit):
+    from qiskit_ibm_provider.utils import RuntimeEncoder
     # Transforms circuit to base64 encoded byte stream
     input_json_str = json.dumps(circuit, cls=RuntimeEncoder)
     # Transform back to json but with the base64 encoded byte stream
@@ -26,15 +28,31 @@ class PlanqkIbmProviderBackend(PlanqkIbmBackend):
 
     def __init__(self, **kwargs):
         PlanqkIbmBackend.__init__(self, **kwargs)
-        self.ibm_backend = IBMBackend(configuration=self.configuration(),
-                                      provider=kwargs.get('provider'),
-                                      api_client=None)
-        self.ibm_backend._runtime_run = self._submit_job
-        self.ibm_backend.properties = self._backend_properties
-        self.ibm_backend.status = self.status
+        self._ibm_backend = None
+
+    @property
+    def ibm_backend(self):
+        """IBM backend wrapped to transpile and run circuits, created on first access as it requires the
+        configuration."""
+        ibm_backend = self._ibm_backend
+        if ibm_backend is None:
+            with self._lazy_init_lock:
+                if self._ibm_backend is None:
+                    from qiskit_ibm_provider import IBMBackend
+
+                    ibm_backend = IBMBackend(configuration=self.configuration(),
+                                             provider=self._provider,
+                                             api_client=None)
+                    ibm_backend._runtime_run = self._submit_job
+                    ibm_backend.properties = self._backend_properties
+                    ibm_backend.status = self.status
+                    self._ibm_backend = ibm_backend
+                ibm_backend = self._ibm_backend
+        return ibm_backend
 
     def run(self, circuit, **kwargs) -> PlanqkRuntimeJob:
-        return IBMBackend.run(self.ibm_backend, circuit, **kwargs)
+        with instrumentation.span("run", backend=self.name):
+            return type(self.ibm_backend).run(self.ibm_backend, circuit, **kwargs)
 
     def status(self):
         operational = self.backend_info.status == STATUS.ONLINE
@@ -54,8 +72,9 @@ class PlanqkIbmProviderBackend(PlanqkIbmBackend):
             backend_name: str,
             job_tags: Optional[List[str]] = None,
             image: Optional[str] = None,
-    ) -> IBMCircuitJob:
-        encoded_input = _encode_circuit_base64(circuit=inputs)
+    ) -> "IBMCircuitJob":
+        with instrumentation.span("convert_to_job_input"):
+            encoded_input = _encode_circuit_base64(circuit=inputs)
         hgp_name = 'ibm-q/open/main'
 
         runtime_job_params = RuntimeJobParamsDto(
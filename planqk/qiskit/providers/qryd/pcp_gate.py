@@ -78,7 +78,7 @@ class PCPGate(Gate):
             [1, 0, 0, 0],
             [0, exp(1j * theta), 0, 0],
             [0, 0, exp(1j * theta), 0],
-            [0, 0, 0, exp(2j * self._theta + 1j * lam)],
+            [0, 0, 0, exp(2j * theta + 1j * lam)],
         ]
 
     def to_kraus(self) -> "qiskit.circuit.Instruction":
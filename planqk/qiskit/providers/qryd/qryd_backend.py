@@ -7,10 +7,12 @@ from qiskit.circuit.library import PhaseGate, RGate, RXGate, RYGate, HGate, RZGa
 
 from planqk.qiskit import PlanqkBackend
 from planqk.qiskit.client.job_dtos import INPUT_FORMAT
+from planqk.qiskit.connectivity import Connectivity
 from planqk.qiskit.options import OptionsV2
 from planqk.qiskit.providers.qryd.pcp_gate import PCPGate
 from planqk.qiskit.providers.qryd.pcz_gate import PCZGate
-from planqk.qiskit.providers.qryd.qryd_converter_utils import convert_to_wire_format
+from planqk.qiskit.providers.qryd.qryd_converter_utils import convert_to_wire_format, stream_wire_format
+from planqk.qiskit.providers.qryd.qryd_optimizer import optimize_circuit
 
 qryd_gate_name_mapping = {
     "p": PhaseGate(Parameter("lambda")),
@@ -35,6 +37,9 @@ qryd_gate_name_mapping = {
     "iswap": iSwapGate()
 }
 
+# Circuits with more instructions are encoded while the job is sent, bounding the memory used by the job input
+STREAMING_MIN_INSTRUCTIONS = 10000
+
 
 class PlanqkQrydBackend(PlanqkBackend):
 
@@ -54,23 +59,29 @@ class PlanqkQrydBackend(PlanqkBackend):
             extended_set_size=5,
             extended_set_weight=0.5,
             reverse_traversal_iterations=3,
+            # Whether circuits are optimized before their conversion to reduce the number of qoqo operations
+            peephole_optimization=False,
         )
 
     def to_gate(self, name: str) -> Optional[Gate]:
         name = name.lower()
         return qryd_gate_name_mapping.get(name, None) or Gate(name, 0, [])
 
+    def _create_connectivity(self) -> Connectivity:
+        # QRyd backend emulators are fully connected
+        return Connectivity.all_to_all(int(qubit.id) for qubit in self.backend_info.configuration.qubits)
+
     def get_single_qubit_gate_properties(self) -> dict:
-        qubits = self.backend_info.configuration.qubits
-        return {(int(qubit.id),): None for qubit in qubits}
+        return self.connectivity.qubit_properties()
 
     def get_multi_qubit_gate_properties(self) -> dict:
-        # QRyd backend emulators are fully connected
-        qubits = self.backend_info.configuration.qubits
-        return {(int(qubit1.id), int(qubit2.id)): None for qubit1 in qubits for qubit2 in qubits
-                if qubit1.id != qubit2.id}
+        return self.connectivity.edge_properties()
 
     def convert_to_job_input(self, circuit, options=None) -> Tuple[INPUT_FORMAT, dict]:
+        if options.peephole_optimization:
+            circuit = optimize_circuit(circuit)
+        if len(circuit.data) >= STREAMING_MIN_INSTRUCTIONS:
+            return stream_wire_format(circuit=circuit, options=options)
         return convert_to_wire_format(circuit=circuit, options=options)
 
     def convert_to_job_params(self, circuit: QuantumCircuit = None, options=None) -> dict:
@@ -1,19 +1,102 @@
 from math import pi
-from typing import Any
-from typing import Dict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from qiskit import QuantumCircuit
 from qiskit.providers import Options
 
+from planqk.qiskit.client.serialization import StreamedJson, dumps
 from planqk.qiskit.providers.qryd.pcp_gate import PCPGate
 from planqk.qiskit.providers.qryd.pcz_gate import PCZGate
 
+# Appends the qoqo operations of an instruction, given by its qubit indices and parameters, to the operations
+OperationConverter = Callable[[List[dict], Sequence[int], Sequence[Any]], None]
+
+# Qiskit instruction name -> number of qubits, number of parameters and converter of the instruction
+_CONVERTERS: Dict[str, Tuple[int, int, OperationConverter]] = {}
+
+
+def register_operation_converter(name: str, num_qubits: int, num_params: int, converter: OperationConverter):
+    """Registers the conversion of a Qiskit instruction into qoqo operations.
+
+    Args:
+        name: name of the Qiskit instruction
+        num_qubits: number of qubits the instruction acts on
+        num_params: number of parameters of the instruction
+        converter: function appending the qoqo operations of the instruction to the list of operations, called with
+            the list, the qubit indices and the parameters of the instruction
+    """
+    _CONVERTERS[name] = (num_qubits, num_params, converter)
+
+
+def _single_qubit_gate(qoqo_name: str) -> OperationConverter:
+    def convert(operations, qubits, params):
+        operations.append({qoqo_name: {"qubit": qubits[0]}})
+
+    return convert
+
+
+def _rotation_gate(qoqo_name: str) -> OperationConverter:
+    def convert(operations, qubits, params):
+        operations.append({qoqo_name: {"qubit": qubits[0], "theta": float(params[0])}})
+
+    return convert
+
+
+def _two_qubit_gate(qoqo_name: str) -> OperationConverter:
+    def convert(operations, qubits, params):
+        operations.append({qoqo_name: {"control": qubits[0], "target": qubits[1]}})
+
+    return convert
+
+
+def _convert_r(operations, qubits, params):
+    operations.append({"RotateXY": {"qubit": qubits[0], "theta": float(params[0]), "phi": float(params[1])}})
+
+
+def _convert_pcz(operations, qubits, params):
+    operations.append({"PhaseShiftedControlledZ": {"control": qubits[0], "target": qubits[1],
+                                                   "phi": float(PCZGate.get_theta())}})
+
+
+def _convert_pcp(operations, qubits, params):
+    theta = float(params[0])
+    operations.append({"PhaseShiftedControlledPhase": {"control": qubits[0], "target": qubits[1], "theta": theta,
+                                                       "phi": float(PCPGate.get_theta(theta))}})
+
+
+def _convert_cp(operations, qubits, params):
+    operations.append({"ControlledPhaseShift": {"control": qubits[0], "target": qubits[1],
+                                                "theta": float(params[0])}})
+
+
+def _convert_u(operations, qubits, params):
+    qubit = qubits[0]
+    operations.append({"RotateZ": {"qubit": qubit, "theta": float(params[2]) - pi / 2}})
+    operations.append({"RotateX": {"qubit": qubit, "theta": float(params[0])}})
+    operations.append({"RotateZ": {"qubit": qubit, "theta": float(params[1]) + pi / 2}})
+
+
+for _name, _qoqo_name in [("p", "PhaseShiftState1"), ("rx", "RotateX"), ("ry", "RotateY"), ("rz", "RotateZ")]:
+    register_operation_converter(_name, 1, 1, _rotation_gate(_qoqo_name))
+for _name, _qoqo_name in [("h", "Hadamard"), ("x", "PauliX"), ("y", "PauliY"), ("z", "PauliZ"), ("sx", "SqrtPauliX"),
+                          ("sxdg", "InvSqrtPauliX")]:
+    register_operation_converter(_name, 1, 0, _single_qubit_gate(_qoqo_name))
+for _name, _qoqo_name in [("cx", "CNOT"), ("cy", "ControlledPauliY"), ("cz", "ControlledPauliZ"), ("swap", "SWAP"),
+                          ("iswap", "ISwap")]:
+    register_operation_converter(_name, 2, 0, _two_qubit_gate(_qoqo_name))
+register_operation_converter("r", 1, 2, _convert_r)
+register_operation_converter("u", 1, 3, _convert_u)
+register_operation_converter("pcz", 2, 0, _convert_pcz)
+register_operation_converter("pcp", 2, 1, _convert_pcp)
+register_operation_converter("cp", 2, 1, _convert_cp)
+
 
 def convert_to_wire_format(circuit: QuantumCircuit, options: Options) -> dict:
     """Convert a circuit to a dictionary.
 
     The method converts a circuit to a Json-serializable dictionary for submitting
-    it to the API of QRydDemo's emulator.
+    it to the API of QRydDemo's emulator. The instructions are converted by the
+    converters registered by `register_operation_converter`.
 
     Args:
         circuit: The QuantumCircuit to be converted.
@@ -29,7 +112,56 @@ def convert_to_wire_format(circuit: QuantumCircuit, options: Options) -> dict:
         Json-serializable dictionary describing the simulation job.
 
     """
-    circuit_dict = {
+    operations: List[dict] = []
+    for batch in _convert_operations(circuit, options):
+        operations.extend(batch)
+    return _wire_format(circuit, operations)
+
+
+# Number of operations encoded at once by stream_wire_format
+_OPERATIONS_PER_CHUNK = 2048
+
+_OPERATIONS_PLACEHOLDER = "__operations__"
+
+
+def stream_wire_format(circuit: QuantumCircuit, options: Options) -> StreamedJson:
+    """Convert a circuit to JSON written while it is sent.
+
+    The JSON equals the encoding of `convert_to_wire_format`, but the operations are
+    converted and encoded in chunks while the request body is sent. Hence, the memory
+    used does not depend on the number of operations of the circuit.
+
+    Args:
+        circuit: The QuantumCircuit to be converted.
+        options: The Options object of the backend.
+
+    Raises:
+        RuntimeError: If the `circuit` contains a quantum gate or operation that
+            is not supported.
+        AssertionError: If the `circuit` contains definitions that are inconsistent
+            with definitions used by the web API.
+
+    Returns:
+        JSON describing the simulation job, encoded when it is iterated.
+
+    """
+    # Raised before the request is sent rather than while the body is streamed
+    _check_instructions(circuit)
+
+    def chunks():
+        prefix, suffix = dumps(_wire_format(circuit, _OPERATIONS_PLACEHOLDER)).split(dumps(_OPERATIONS_PLACEHOLDER))
+        yield prefix + b"["
+        separator = b""
+        for batch in _convert_operations(circuit, options, _OPERATIONS_PER_CHUNK):
+            yield separator + dumps(batch)[1:-1]
+            separator = b","
+        yield b"]" + suffix
+
+    return StreamedJson(chunks)
+
+
+def _wire_format(circuit: QuantumCircuit, operations) -> dict:
+    return {
         "ClassicalRegister": {
             "measurement": {
                 "circuits": [
@@ -43,7 +175,7 @@ def convert_to_wire_format(circuit: QuantumCircuit, options: Options) -> dict:
                                 }
                             }
                         ],
-                        "operations": [],
+                        "operations": operations,
                         "_roqoqo_version": {
                             "major_version": 1,
                             "minor_version": 0,
@@ -52,323 +184,67 @@ def convert_to_wire_format(circuit: QuantumCircuit, options: Options) -> dict:
                 ],
             },
         },
-    }  # type: Dict[str, Any]
-    qubits_map = {bit: n for n, bit in enumerate(circuit.qubits)}
-    clbits_map = {bit: n for n, bit in enumerate(circuit.clbits)}
+    }
+
+
+def _check_instructions(circuit: QuantumCircuit):
     for instruction in circuit.data:
-        inst = instruction[0]
-        params = inst.params
-        qubits = [qubits_map[bit] for bit in instruction[1]]
-        clbits = [clbits_map[bit] for bit in instruction[2]]
+        name = instruction.operation.name
+        converter = _CONVERTERS.get(name)
+        if converter is not None:
+            if len(instruction.qubits) != converter[0] or len(instruction.operation.params) != converter[1]:
+                raise AssertionError("Wrong number of arguments.")
+        elif name == "measure":
+            if len(instruction.qubits) != len(instruction.clbits):
+                raise AssertionError(
+                    "Number of qubits and classical bits must be same."
+                )
+        elif name != "barrier":
+            raise RuntimeError("Operation '%s' not supported." % name)
 
-        if inst.label:
-            print(inst.label)  # TODO
 
-        if inst.name == "barrier":
-            continue
-        elif inst.name == "measure":
+def _convert_operations(circuit: QuantumCircuit, options: Options,
+                        batch_size: Optional[int] = None) -> Iterator[List[dict]]:
+    """Yields the qoqo operations of the circuit in batches of at least batch_size operations, in a single batch if
+    batch_size is None."""
+    operations: List[dict] = []
+    qubit_index = {bit: n for n, bit in enumerate(circuit.qubits)}.__getitem__
+    clbit_index = {bit: n for n, bit in enumerate(circuit.clbits)}.__getitem__
+    converters = _CONVERTERS
+
+    for instruction in circuit.data:
+        inst = instruction.operation
+        name = inst.name
+        qubits = list(map(qubit_index, instruction.qubits))
+
+        converter = converters.get(name)
+        if converter is not None:
+            num_qubits, num_params, convert = converter
+            params = inst.params
+            if len(qubits) != num_qubits or len(params) != num_params:
+                raise AssertionError("Wrong number of arguments.")
+            convert(operations, qubits, params)
+        elif name == "measure":
+            clbits = list(map(clbit_index, instruction.clbits))
             if len(qubits) != len(clbits):
                 raise AssertionError(
                     "Number of qubits and classical bits must be same."
                 )
             for qubit, clbit in zip(qubits, clbits):
-                circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                    "operations"
-                ] += [
-                    {
-                        "MeasureQubit": {
-                            "readout": "ro",
-                            "qubit": qubit,
-                            "readout_index": clbit,
-                        }
-                    }
-                ]
-        elif inst.name == "p":
-            if len(qubits) != 1 or len(params) != 1:
-                raise AssertionError("Wrong number of arguments.")
-            circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                "operations"
-            ] += [
-                {
-                    "PhaseShiftState1": {
-                        "qubit": qubits[0],
-                        "theta": float(params[0]),
-                    }
-                }
-            ]
-        elif inst.name == "r":
-            if len(qubits) != 1 or len(params) != 2:
-                raise AssertionError("Wrong number of arguments.")
-            circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                "operations"
-            ] += [
-                {
-                    "RotateXY": {
-                        "qubit": qubits[0],
-                        "theta": float(params[0]),
-                        "phi": float(params[1]),
-                    }
-                }
-            ]
-        elif inst.name == "rx":
-            if len(qubits) != 1 or len(params) != 1:
-                raise AssertionError("Wrong number of arguments.")
-            circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                "operations"
-            ] += [
-                {
-                    "RotateX": {
-                        "qubit": qubits[0],
-                        "theta": float(params[0]),
-                    }
-                }
-            ]
-        elif inst.name == "ry":
-            if len(qubits) != 1 or len(params) != 1:
-                raise AssertionError("Wrong number of arguments.")
-            circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                "operations"
-            ] += [
-                {
-                    "RotateY": {
-                        "qubit": qubits[0],
-                        "theta": float(params[0]),
-                    }
-                }
-            ]
-        elif inst.name == "pcz":
-            if len(qubits) != 2 or len(params) != 0:
-                raise AssertionError("Wrong number of arguments.")
-            circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                "operations"
-            ] += [
-                {
-                    "PhaseShiftedControlledZ": {
-                        "control": qubits[0],
-                        "target": qubits[1],
-                        "phi": float(PCZGate.get_theta()),
-                    }
-                }
-            ]
-        elif inst.name == "pcp":
-            if len(qubits) != 2 or len(params) != 1:
-                raise AssertionError("Wrong number of arguments.")
-            circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                "operations"
-            ] += [
-                {
-                    "PhaseShiftedControlledPhase": {
-                        "control": qubits[0],
-                        "target": qubits[1],
-                        "theta": float(params[0]),
-                        "phi": float(PCPGate.get_theta(float(params[0]))),
-                    }
-                }
-            ]
-        elif inst.name == "h":
-            if len(qubits) != 1 or len(params) != 0:
-                raise AssertionError("Wrong number of arguments.")
-            circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                "operations"
-            ] += [
-                {
-                    "Hadamard": {
-                        "qubit": qubits[0],
-                    }
-                }
-            ]
-        elif inst.name == "rz":
-            if len(qubits) != 1 or len(params) != 1:
-                raise AssertionError("Wrong number of arguments.")
-            circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                "operations"
-            ] += [
-                {
-                    "RotateZ": {
-                        "qubit": qubits[0],
-                        "theta": float(params[0]),
-                    }
-                }
-            ]
-        elif inst.name == "u":
-            if len(qubits) != 1 or len(params) != 3:
-                raise AssertionError("Wrong number of arguments.")
-            theta = float(params[0])
-            phi = float(params[1])
-            lam = float(params[2])
-            circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                "operations"
-            ] += [
-                {
-                    "RotateZ": {
-                        "qubit": qubits[0],
-                        "theta": lam - pi / 2,
-                    }
-                },
-                {
-                    "RotateX": {
-                        "qubit": qubits[0],
-                        "theta": theta,
-                    }
-                },
-                {
-                    "RotateZ": {
-                        "qubit": qubits[0],
-                        "theta": phi + pi / 2,
-                    }
-                },
-            ]
-        elif inst.name == "x":
-            if len(qubits) != 1 or len(params) != 0:
-                raise AssertionError("Wrong number of arguments.")
-            circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                "operations"
-            ] += [
-                {
-                    "PauliX": {
-                        "qubit": qubits[0],
-                    }
-                }
-            ]
-        elif inst.name == "y":
-            if len(qubits) != 1 or len(params) != 0:
-                raise AssertionError("Wrong number of arguments.")
-            circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                "operations"
-            ] += [
-                {
-                    "PauliY": {
-                        "qubit": qubits[0],
-                    }
-                }
-            ]
-        elif inst.name == "z":
-            if len(qubits) != 1 or len(params) != 0:
-                raise AssertionError("Wrong number of arguments.")
-            circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                "operations"
-            ] += [
-                {
-                    "PauliZ": {
-                        "qubit": qubits[0],
-                    }
-                }
-            ]
-        elif inst.name == "sx":
-            if len(qubits) != 1 or len(params) != 0:
-                raise AssertionError("Wrong number of arguments.")
-            circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                "operations"
-            ] += [
-                {
-                    "SqrtPauliX": {
-                        "qubit": qubits[0],
-                    }
-                }
-            ]
-        elif inst.name == "sxdg":
-            if len(qubits) != 1 or len(params) != 0:
-                raise AssertionError("Wrong number of arguments.")
-            circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                "operations"
-            ] += [
-                {
-                    "InvSqrtPauliX": {
-                        "qubit": qubits[0],
-                    }
-                }
-            ]
-        elif inst.name == "cx":
-            if len(qubits) != 2 or len(params) != 0:
-                raise AssertionError("Wrong number of arguments.")
-            circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                "operations"
-            ] += [
-                {
-                    "CNOT": {
-                        "control": qubits[0],
-                        "target": qubits[1],
-                    }
-                }
-            ]
-        elif inst.name == "cy":
-            if len(qubits) != 2 or len(params) != 0:
-                raise AssertionError("Wrong number of arguments.")
-            circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                "operations"
-            ] += [
-                {
-                    "ControlledPauliY": {
-                        "control": qubits[0],
-                        "target": qubits[1],
-                    }
-                }
-            ]
-        elif inst.name == "cz":
-            if len(qubits) != 2 or len(params) != 0:
-                raise AssertionError("Wrong number of arguments.")
-            circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                "operations"
-            ] += [
-                {
-                    "ControlledPauliZ": {
-                        "control": qubits[0],
-                        "target": qubits[1],
-                    }
-                }
-            ]
-        elif inst.name == "cp":
-            if len(qubits) != 2 or len(params) != 1:
-                raise AssertionError("Wrong number of arguments.")
-            circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                "operations"
-            ] += [
-                {
-                    "ControlledPhaseShift": {
-                        "control": qubits[0],
-                        "target": qubits[1],
-                        "theta": float(params[0]),
-                    }
-                }
-            ]
-        elif inst.name == "swap":
-            if len(qubits) != 2 or len(params) != 0:
-                raise AssertionError("Wrong number of arguments.")
-            circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                "operations"
-            ] += [
-                {
-                    "SWAP": {
-                        "control": qubits[0],
-                        "target": qubits[1],
-                    }
-                }
-            ]
-        elif inst.name == "iswap":
-            if len(qubits) != 2 or len(params) != 0:
-                raise AssertionError("Wrong number of arguments.")
-            circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-                "operations"
-            ] += [
-                {
-                    "ISwap": {
-                        "control": qubits[0],
-                        "target": qubits[1],
-                    }
-                }
-            ]
-        else:
-            raise RuntimeError("Operation '%s' not supported." % inst.name)
-
-    circuit_dict["ClassicalRegister"]["measurement"]["circuits"][0][
-        "operations"
-    ] += [
+                operations.append({"MeasureQubit": {"readout": "ro", "qubit": qubit, "readout_index": clbit}})
+        elif name != "barrier":
+            raise RuntimeError("Operation '%s' not supported." % name)
+
+        if batch_size is not None and len(operations) >= batch_size:
+            yield operations
+            operations = []
+
+    operations.append(
         {
             "PragmaSetNumberOfMeasurements": {
                 "readout": "ro",
                 "number_measurements": options.shots,
             }
         }
-    ]
-
-    return circuit_dict
+    )
+    yield operations
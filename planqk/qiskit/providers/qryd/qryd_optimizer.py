@@ -0,0 +1,256 @@
+"""Peephole optimization of circuits before their conversion to qoqo operations.
+
+The size of QRyd jobs and the runtime of the emulator scale with the number of qoqo operations. Hence, the optimizer
+rewrites short sequences of gates into equivalent sequences emitting fewer operations:
+
+- consecutive single-qubit gates are fused and, if this emits fewer operations, replaced by at most a phase gate
+  followed by an ``r`` gate, dropping the identities
+- adjacent self-inverse two-qubit gates cancel out and adjacent ``cp`` gates are merged
+- ``cz`` and ``cp`` gates are exchanged with the ``pcz`` and ``pcp`` gates if they absorb adjacent phase gates, and
+  vice versa
+
+The optimized circuit equals the circuit up to the global phase, which is tracked as qoqo ignores it.
+"""
+from math import isclose, tau
+from typing import Dict, List, Optional
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import CircuitInstruction, ParameterExpression
+from qiskit.circuit.library import CPhaseGate, CZGate, PhaseGate, RGate
+from qiskit.synthesis import OneQubitEulerDecomposer
+
+from planqk.qiskit.providers.qryd.pcp_gate import PCPGate
+from planqk.qiskit.providers.qryd.pcz_gate import PCZGate
+
+# Number of qoqo operations emitted by the single-qubit gates that are fused
+_SINGLE_QUBIT_GATE_COSTS = {"p": 1, "r": 1, "rx": 1, "ry": 1, "rz": 1, "u": 3, "h": 1, "x": 1, "y": 1, "z": 1,
+                            "sx": 1, "sxdg": 1}
+
+# Two-qubit gates canceling out if applied twice to the same qubits, mapped to whether they are symmetric
+_SELF_INVERSE_GATES = {"cx": False, "cy": False, "cz": True, "swap": True}
+
+_ATOL = 1e-10
+
+_decomposer = OneQubitEulerDecomposer("ZXZ")
+
+
+class _Node(object):
+    """Instruction of the optimized circuit, linked to the previous and next instructions acting on its qubits."""
+
+    def __init__(self, instruction: Optional[CircuitInstruction], qubits: tuple, fixed: bool = False):
+        self.instruction = instruction
+        self.qubits = qubits
+        # Whether the instruction must be kept as it is
+        self.fixed = fixed
+        self.prev: Dict = {}
+        self.next: Dict = {}
+        self.removed = False
+
+
+class _Run(_Node):
+    """Consecutive single-qubit gates on a qubit, replaced by their fused unitary if this emits fewer operations."""
+
+    def __init__(self, qubits: tuple):
+        super().__init__(None, qubits)
+        self.instructions = []
+        self.cost = 0
+        self.matrix = np.eye(2, dtype=complex)
+
+    def add(self, instruction: CircuitInstruction):
+        self.instructions.append(instruction)
+        self.cost += _SINGLE_QUBIT_GATE_COSTS[instruction.operation.name]
+        self.matrix = instruction.operation.to_matrix() @ self.matrix
+
+    def is_diagonal(self) -> bool:
+        return abs(self.matrix[0, 1]) < _ATOL and abs(self.matrix[1, 0]) < _ATOL
+
+    def phase(self) -> float:
+        """Returns the angle of the phase gate equal to the run up to the global phase, if the run is diagonal."""
+        return float(np.angle(self.matrix[1, 1] / self.matrix[0, 0]))
+
+    def add_phase(self, angle: float):
+        self.matrix = np.diag([1, np.exp(1j * angle)]) @ self.matrix
+        # The gates are replaced by the fused unitary
+        self.cost = float("inf")
+
+
+def optimize_circuit(circuit: QuantumCircuit) -> QuantumCircuit:
+    """Returns a circuit equal to the circuit up to the global phase, emitting fewer qoqo operations.
+
+    Instructions that are not QRyd gates, conditioned or parameterized by unbound parameters are kept as they are and
+    nothing is moved across them.
+
+    Args:
+        circuit: circuit consisting of the gates supported by QRyd backends
+
+    Returns:
+        the optimized circuit
+    """
+    nodes = _fuse(circuit)
+    _exchange_phase_shifted_gates(nodes)
+
+    optimized = circuit.copy_empty_like()
+    for node in nodes:
+        if isinstance(node, _Run):
+            _emit_run(optimized, node)
+        else:
+            optimized._append(node.instruction)
+    return optimized
+
+
+def _fuse(circuit: QuantumCircuit) -> List[_Node]:
+    """Fuses the single-qubit gates and cancels or merges the two-qubit gates, returning the remaining instructions in
+    order."""
+    nodes: List[_Node] = []
+    last: Dict = {}
+
+    def append(node: _Node):
+        for qubit in node.qubits:
+            node.prev[qubit] = last.get(qubit)
+            last[qubit] = node
+        nodes.append(node)
+
+    def remove(node: _Node):
+        node.removed = True
+        for qubit in node.qubits:
+            last[qubit] = node.prev[qubit]
+
+    for instruction in circuit.data:
+        operation = instruction.operation
+        name = operation.name
+        qubits = instruction.qubits
+        if getattr(operation, "condition", None) is not None or any(
+                isinstance(param, ParameterExpression) and param.parameters for param in operation.params):
+            append(_Node(instruction, qubits, fixed=True))
+        elif name in _SINGLE_QUBIT_GATE_COSTS:
+            run = last.get(qubits[0])
+            if not isinstance(run, _Run):
+                run = _Run(qubits)
+                append(run)
+            run.add(instruction)
+        elif name in _SELF_INVERSE_GATES or name == "cp":
+            previous = last.get(qubits[0])
+            if (previous is not None and last.get(qubits[1]) is previous and not isinstance(previous, _Run)
+                    and not previous.fixed and previous.instruction.operation.name == name
+                    and (previous.qubits == qubits or _is_symmetric(name) and previous.qubits == qubits[::-1])):
+                if name == "cp":
+                    angle = float(previous.instruction.operation.params[0]) + float(operation.params[0])
+                    if _is_zero_angle(angle):
+                        remove(previous)
+                    else:
+                        previous.instruction = previous.instruction.replace(operation=CPhaseGate(angle))
+                else:
+                    remove(previous)
+            elif name != "cp" or not _is_zero_angle(float(operation.params[0])):
+                append(_Node(instruction, qubits))
+        else:
+            append(_Node(instruction, qubits))
+
+    live_nodes = [node for node in nodes if not node.removed]
+    last = {}
+    for node in reversed(live_nodes):
+        for qubit in node.qubits:
+            node.next[qubit] = last.get(qubit)
+            last[qubit] = node
+    return live_nodes
+
+
+def _is_symmetric(name: str) -> bool:
+    return name == "cp" or _SELF_INVERSE_GATES[name]
+
+
+def _is_zero_angle(angle: float) -> bool:
+    return isclose(angle % tau, 0, abs_tol=_ATOL) or isclose(angle % tau, tau, abs_tol=_ATOL)
+
+
+def _phase_shift(operation) -> Optional[float]:
+    """Returns the phase shift of a controlled phase gate, i.e., the angle of the phase gates applied to both qubits
+    after the controlled-Z or controlled-phase gate."""
+    name = operation.name
+    if name == "cz":
+        return 0.0
+    if name == "pcz":
+        return float(PCZGate.get_theta())
+    if name == "cp":
+        return 0.0
+    if name == "pcp":
+        return _pcp_phase_shift(float(operation.params[0]))
+    return None
+
+
+def _pcp_phase_shift(lam: float) -> Optional[float]:
+    try:
+        theta = PCPGate.get_theta(lam)
+    except (TypeError, ValueError):
+        return None
+    return theta if np.isfinite(theta) else None
+
+
+def _exchange_phase_shifted_gates(nodes: List[_Node]):
+    """Exchanges cz and cp gates with their phase-shifted variants, and vice versa, if fewer phases remain on the
+    diagonal single-qubit runs adjacent to the gates.
+
+    Diagonal gates commute, hence, the phases can be moved from either side of the gate.
+    """
+    for node in nodes:
+        if isinstance(node, _Run) or node.fixed:
+            continue
+        operation = node.instruction.operation
+        shift = _phase_shift(operation)
+        if shift is None:
+            continue
+
+        if operation.name in ("cz", "pcz"):
+            alternative = PCZGate() if operation.name == "cz" else CZGate()
+        else:
+            lam = float(operation.params[0])
+            alternative = PCPGate(lam) if operation.name == "cp" else CPhaseGate(lam)
+        alternative_shift = _phase_shift(alternative)
+        if alternative_shift is None:
+            continue
+        # The gate equals the alternative followed by phase gates of this angle on both qubits
+        angle = shift - alternative_shift
+
+        runs = [_adjacent_diagonal_run(node, qubit) for qubit in node.qubits]
+        if any(run is None for run in runs):
+            continue
+        remaining = sum(not _is_zero_angle(run.phase()) for run in runs)
+        alternative_remaining = sum(not _is_zero_angle(run.phase() + angle) for run in runs)
+        if alternative_remaining < remaining:
+            for run in runs:
+                run.add_phase(angle)
+            node.instruction = node.instruction.replace(operation=alternative)
+
+
+def _adjacent_diagonal_run(node: _Node, qubit) -> Optional[_Run]:
+    for run in (node.prev[qubit], node.next[qubit]):
+        if isinstance(run, _Run) and run.is_diagonal():
+            return run
+    return None
+
+
+def _emit_run(circuit: QuantumCircuit, run: _Run):
+    """Appends the gates of the run or their fused unitary, whichever emits fewer operations."""
+    qubits = run.qubits
+    if run.is_diagonal():
+        if _is_zero_angle(run.phase()):
+            circuit.global_phase += float(np.angle(run.matrix[0, 0]))
+            return
+        if run.cost > 1:
+            circuit.global_phase += float(np.angle(run.matrix[0, 0]))
+            circuit._append(CircuitInstruction(PhaseGate(run.phase()), qubits))
+            return
+    else:
+        theta, phi, lam, phase = _decomposer.angles_and_phase(run.matrix)
+        # Rz(phi) Rx(theta) Rz(lam) = R(theta, phi) Rz(phi + lam), and Rz(angle) = exp(-i angle / 2) P(angle)
+        num_gates = 1 if _is_zero_angle(phi + lam) else 2
+        if num_gates < run.cost:
+            circuit.global_phase += phase - (phi + lam) / 2
+            if num_gates == 2:
+                circuit._append(CircuitInstruction(PhaseGate(phi + lam), qubits))
+            circuit._append(CircuitInstruction(RGate(theta, phi), qubits))
+            return
+
+    for instruction in run.instructions:
+        circuit._append(instruction)
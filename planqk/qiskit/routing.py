@@ -0,0 +1,85 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+import rustworkx as rx
+from qiskit.transpiler import CouplingMap, Target
+
+
+class RoutingData(object):
+    """Coupling map, its edges as array, all-pairs qubit distances and connected components of a target, computed
+    once."""
+    __slots__ = ("coupling_map", "edges", "distance_matrix", "connected_components")
+
+    def __init__(self, coupling_map: Optional[CouplingMap]):
+        self.coupling_map = coupling_map
+        self.edges: Optional[np.ndarray] = None
+        self.distance_matrix: Optional[np.ndarray] = None
+        self.connected_components: List[List[int]] = []
+        if coupling_map is not None:
+            self.edges = np.array(coupling_map.get_edges(), dtype=np.int64).reshape(-1, 2)
+            self.distance_matrix = coupling_map.distance_matrix
+            # Shared by the coupling maps of all transpilations, hence, it must not be modified
+            self.distance_matrix.setflags(write=False)
+            self.connected_components = sorted(sorted(component)
+                                               for component in rx.weakly_connected_components(coupling_map.graph))
+
+    def copy_coupling_map(self) -> Optional[CouplingMap]:
+        """Returns a copy of the coupling map that can be modified, its distance matrix is already computed."""
+        if self.coupling_map is None:
+            return None
+        coupling_map = CouplingMap(description=self.coupling_map.description)
+        coupling_map.graph = self.coupling_map.graph.copy()
+        coupling_map._dist_matrix = self.distance_matrix
+        return coupling_map
+
+
+class PlanqkTarget(Target):
+    """Target of a PlanQK backend precomputing the data required for routing.
+
+    Qiskit builds the coupling map of the target and computes its distance matrix for each transpilation. As the
+    targets of PlanQK backends are shared by all backends of the same version, both are computed once instead.
+    """
+    __slots__ = ("_routing_data", "_qargs_arrays")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._routing_data: Optional[RoutingData] = None
+        self._qargs_arrays: Dict[str, Optional[np.ndarray]] = {}
+
+    @property
+    def routing_data(self) -> RoutingData:
+        # Concurrent threads may compute the routing data more than once, but the results are equivalent
+        routing_data = self._routing_data
+        if routing_data is None:
+            routing_data = self._routing_data = RoutingData(super().build_coupling_map())
+        return routing_data
+
+    def qargs_array(self, operation_name: str) -> Optional[np.ndarray]:
+        """Returns the qubits the operation is supported on as array of shape (number of qargs, number of qubits), or
+        None if the operation is supported on all qubits."""
+        try:
+            return self._qargs_arrays[operation_name]
+        except KeyError:
+            pass
+        qargs = self.qargs_for_operation_name(operation_name)
+        if qargs is not None:
+            qargs = np.array(list(qargs), dtype=np.int64)
+            if qargs.ndim != 2:
+                qargs = qargs.reshape(len(qargs), -1) if len(qargs) else np.empty((0, 0), dtype=np.int64)
+        self._qargs_arrays[operation_name] = qargs
+        return qargs
+
+    def build_coupling_map(self, two_q_gate=None, filter_idle_qubits=False):
+        if two_q_gate is not None or filter_idle_qubits:
+            return super().build_coupling_map(two_q_gate, filter_idle_qubits)
+        return self.routing_data.copy_coupling_map()
+
+    def add_instruction(self, instruction, properties=None, name=None):
+        super().add_instruction(instruction, properties, name)
+        self._routing_data = None
+        self._qargs_arrays = {}
+
+    def update_instruction_properties(self, instruction, qargs, properties):
+        super().update_instruction_properties(instruction, qargs, properties)
+        self._routing_data = None
+        self._qargs_arrays = {}
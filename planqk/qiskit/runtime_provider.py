@@ -1,11 +1,8 @@
 import logging
 from datetime import datetime
-from typing import Optional, Union, Callable, Type, Sequence, Dict, List, Any
+from typing import Optional, Union, Callable, Type, Sequence, Dict, List, Any, TYPE_CHECKING
 
 from qiskit.providers import QiskitBackendNotFoundError
-from qiskit_ibm_runtime import RuntimeOptions, ibm_backend
-from qiskit_ibm_runtime.accounts import ChannelType
-from qiskit_ibm_runtime.utils.result_decoder import ResultDecoder
 
 from planqk.qiskit import PlanqkQuantumProvider
 from planqk.qiskit.client.backend_dtos import PROVIDER
@@ -13,6 +10,12 @@ from planqk.qiskit.client.client import _PlanqkClient
 from planqk.qiskit.client.job_dtos import RuntimeJobParamsDto, JobDto
 from planqk.qiskit.planqk_runtime_job import PlanqkRuntimeJob
 
+if TYPE_CHECKING:
+    # qiskit_ibm_runtime is imported once a program is run as importing it takes about a second
+    from qiskit_ibm_runtime import RuntimeOptions, ibm_backend
+    from qiskit_ibm_runtime.accounts import ChannelType
+    from qiskit_ibm_runtime.utils.result_decoder import ResultDecoder
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,7 +23,7 @@ class PlanqkQiskitRuntimeService(PlanqkQuantumProvider):
 
     def __init__(self, access_token: Optional[str] = None,
                  organization_id: Optional[str] = None,
-                 channel: Optional[ChannelType] = None,
+                 channel: Optional["ChannelType"] = None,
                  channel_strategy=None):
         super().__init__(access_token, organization_id)
 
@@ -29,6 +32,15 @@ class PlanqkQiskitRuntimeService(PlanqkQuantumProvider):
         # Mock close_session method of API client as it is called by the session object after a program has run
         self._api_client = type('Mock_API_Client', (), {'close_session': lambda self: None})
 
+    def __getstate__(self):
+        state = super().__getstate__()
+        del state["_api_client"]
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._api_client = type('Mock_API_Client', (), {'close_session': lambda self: None})
+
     def backend(
             self,
             name: str = None,
@@ -68,12 +80,14 @@ class PlanqkQiskitRuntimeService(PlanqkQuantumProvider):
     def run(self,
             program_id: str,
             inputs: Dict,
-            options: Optional[Union[RuntimeOptions, Dict]] = None,
+            options: Optional[Union["RuntimeOptions", Dict]] = None,
             callback: Optional[Callable] = None,
-            result_decoder: Optional[Union[Type[ResultDecoder], Sequence[Type[ResultDecoder]]]] = None,
+            result_decoder: Optional[Union[Type["ResultDecoder"], Sequence[Type["ResultDecoder"]]]] = None,
             session_id: Optional[str] = None,
             start_session: Optional[bool] = False, ):  # TODO return planqkjob
 
+        from qiskit_ibm_runtime import RuntimeOptions
+
         qrt_options: RuntimeOptions = options
         if options is None:
             qrt_options = RuntimeOptions()
@@ -121,7 +135,7 @@ class PlanqkQiskitRuntimeService(PlanqkQuantumProvider):
     def delete_account(
             filename: Optional[str] = None,
             name: Optional[str] = None,
-            channel: Optional[ChannelType] = None,
+            channel: Optional["ChannelType"] = None,
     ) -> bool:
         raise NotImplementedError("Deleting an account is not supported.")
 
@@ -130,7 +144,7 @@ class PlanqkQiskitRuntimeService(PlanqkQuantumProvider):
             token: Optional[str] = None,
             url: Optional[str] = None,
             instance: Optional[str] = None,
-            channel: Optional[ChannelType] = None,
+            channel: Optional["ChannelType"] = None,
             filename: Optional[str] = None,
             name: Optional[str] = None,
             proxies: Optional[dict] = None,
@@ -142,7 +156,7 @@ class PlanqkQiskitRuntimeService(PlanqkQuantumProvider):
     @staticmethod
     def saved_accounts(
             default: Optional[bool] = None,
-            channel: Optional[ChannelType] = None,
+            channel: Optional["ChannelType"] = None,
             filename: Optional[str] = None,
             name: Optional[str] = None,
     ) -> dict:
@@ -200,7 +214,7 @@ class PlanqkQiskitRuntimeService(PlanqkQuantumProvider):
             instance: Optional[str] = None,
             filters: Optional[Callable[[List["ibm_backend.IBMBackend"]], bool]] = None,
             **kwargs: Any,
-    ) -> ibm_backend.IBMBackend:
+    ) -> "ibm_backend.IBMBackend":
         raise NotImplementedError("Retrieving the least busy backend is not supported.")
 
     @property
@@ -0,0 +1,193 @@
+"""Optional OpenTelemetry tracing of the SDK.
+
+Once enabled, the spans of the instrumentation (see ``planqk.qiskit.instrumentation``), e.g., backend runs, HTTP
+requests and result construction, are recorded as OpenTelemetry spans in the active trace. The trace context of
+requests sent to PlanQK is derived from the active span, i.e., the middleware continues the trace of the caller.
+The lifecycle of each job, from its submission until it reaches a final state, is recorded as a span of its own with
+an event per status change.
+
+Requires the ``opentelemetry-api`` package (``pip install planqk-quantum[tracing]``).
+
+Example:
+    enable_tracing()
+    with tracer.start_as_current_span("vqe-iteration"):
+        backend.run(circuit, shots=100).result()
+"""
+import logging
+import threading
+from typing import Dict, Optional
+
+from planqk.exceptions import PlanqkError
+from planqk.qiskit import instrumentation
+
+logger = logging.getLogger(__name__)
+
+HEADER_CLOUD_TRACE_CTX = "x-cloud-trace-context"
+
+_TRACER_NAME = "planqk.qiskit"
+
+# Span events recorded for the job states
+_JOB_STATUS_EVENTS = {
+    "PENDING": "queued",
+    "RUNNING": "running",
+    "COMPLETED": "completed",
+    "FAILED": "failed",
+    "CANCELLING": "cancelling",
+    "CANCELLED": "cancelled",
+}
+_FINAL_JOB_STATES = {"COMPLETED", "FAILED", "CANCELLED"}
+
+_sink: Optional["OpenTelemetrySink"] = None
+_lock = threading.Lock()
+
+
+def _opentelemetry():
+    try:
+        from opentelemetry import context, propagate, trace
+        return context, propagate, trace
+    except ImportError as e:
+        raise PlanqkError("Tracing requires OpenTelemetry. Install it with 'pip install opentelemetry-api'.") from e
+
+
+class OpenTelemetrySink(instrumentation.SpanSink):
+    """Records the instrumentation spans as OpenTelemetry spans, making them the active span while they run."""
+
+    def __init__(self, tracer_provider=None):
+        self._context, _, self._trace = _opentelemetry()
+        self.tracer = self._trace.get_tracer(_TRACER_NAME, tracer_provider=tracer_provider)
+        self._active = {}
+
+    def start(self, span: instrumentation.Span):
+        otel_span = self.tracer.start_span(f"planqk.{span.name}", attributes=_otel_attributes(span.attributes))
+        token = self._context.attach(self._trace.set_span_in_context(otel_span))
+        self._active[span] = (otel_span, token)
+
+    def record(self, span: instrumentation.Span):
+        active = self._active.pop(span, None)
+        if active is None:
+            return
+        otel_span, token = active
+        otel_span.set_attributes(_otel_attributes(span.attributes))
+        if span.error is not None:
+            otel_span.record_exception(span.error)
+            otel_span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(span.error)))
+        otel_span.end()
+        self._context.detach(token)
+
+
+def _otel_attributes(attributes: Dict) -> Dict:
+    # OpenTelemetry supports primitive attribute values only
+    return {f"planqk.{key}": value if isinstance(value, (str, bool, int, float)) else str(value)
+            for key, value in attributes.items() if value is not None}
+
+
+def enable_tracing(tracer_provider=None) -> OpenTelemetrySink:
+    """Records the operations of the SDK as OpenTelemetry spans.
+
+    Args:
+        tracer_provider: provider of the tracer, by default the global tracer provider
+
+    Raises:
+        PlanqkError: if OpenTelemetry is not installed
+    """
+    global _sink
+    with _lock:
+        if _sink is not None:
+            instrumentation.remove_sink(_sink)
+        _sink = OpenTelemetrySink(tracer_provider)
+        instrumentation.add_sink(_sink)
+        return _sink
+
+
+def disable_tracing():
+    global _sink
+    with _lock:
+        if _sink is not None:
+            instrumentation.remove_sink(_sink)
+            _sink = None
+
+
+def is_tracing_enabled() -> bool:
+    return _sink is not None
+
+
+def inject_trace_context(headers: Dict[str, str]) -> Dict[str, str]:
+    """Adds the trace context of the active OpenTelemetry span to the request headers.
+
+    The x-cloud-trace-context header is set to the trace and span id of the active span. The headers of the globally
+    configured propagator, by default the W3C traceparent header, are added as well. Headers are returned unchanged if
+    tracing is disabled or no span is active.
+    """
+    if _sink is None:
+        return headers
+    context, propagate, trace = _opentelemetry()
+    span_context = trace.get_current_span().get_span_context()
+    if not span_context.is_valid:
+        return headers
+
+    sampled = 1 if span_context.trace_flags.sampled else 0
+    headers = {**headers, HEADER_CLOUD_TRACE_CTX: f"{span_context.trace_id:032x}/{span_context.span_id};o={sampled}"}
+    propagate.inject(headers)
+    return headers
+
+
+class JobLifecycleSpan(object):
+    """Span covering a job from its submission until it reached a final state.
+
+    Each observed status change is recorded as a span event, e.g., "queued", "running" and "completed". Jobs whose
+    final state is never observed end the span when they are cancelled or no longer referenced, see ``end``.
+    """
+
+    def __init__(self, otel_span, trace_module):
+        self._span = otel_span
+        self._trace = trace_module
+        self._status = None
+        self._ended = False
+        self._lock = threading.Lock()
+
+    @property
+    def ended(self) -> bool:
+        return self._ended
+
+    def update(self, status: Optional[str]):
+        """Records the current status of the job, ending the span once it is final."""
+        status = getattr(status, "value", status)
+        with self._lock:
+            if status is None or status == self._status or self._ended:
+                return
+            self._status = status
+            self._span.add_event(_JOB_STATUS_EVENTS.get(status, status.lower()), {"planqk.job.status": status})
+            if status == "FAILED":
+                self._span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, "Job failed"))
+            if status in _FINAL_JOB_STATES:
+                self._end()
+
+    def end(self, event: str):
+        """Ends the span before a final state of the job was observed, recording the reason as span event, e.g.,
+        "cancel_requested" or "dropped" if the job object was garbage-collected."""
+        with self._lock:
+            if self._ended:
+                return
+            self._span.add_event(event, {"planqk.job.status": self._status} if self._status is not None else None)
+            self._end()
+
+    def _end(self):
+        self._ended = True
+        self._span.end()
+
+
+def start_job_span(job_id: str, backend_id: Optional[str], provider: Optional[str],
+                   shots: Optional[int] = None) -> Optional[JobLifecycleSpan]:
+    """Starts the lifecycle span of a submitted job as child of the active span.
+
+    Returns:
+        the lifecycle span, or None if tracing is disabled
+    """
+    sink = _sink
+    if sink is None:
+        return None
+    _, _, trace = _opentelemetry()
+    attributes = _otel_attributes({"job.id": job_id, "backend.id": backend_id, "provider": provider, "shots": shots})
+    otel_span = sink.tracer.start_span("planqk.job", attributes=attributes)
+    otel_span.add_event("submitted")
+    return JobLifecycleSpan(otel_span, trace)
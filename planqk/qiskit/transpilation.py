@@ -0,0 +1,338 @@
+"""Caching of transpiled circuits.
+
+Transpiled circuits are cached by the fingerprint of the input circuit, the id and version of the backend and the
+transpiler options, in memory and on disk. Hence, circuits submitted repeatedly, also by different processes, are
+transpiled once per backend version.
+"""
+import copy
+import hashlib
+import logging
+import os
+import platform
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import qiskit
+from qiskit import QuantumCircuit, qpy, transpile
+from qiskit.circuit import ParameterExpression
+from qiskit.circuit.library import get_standard_gate_name_mapping
+
+from . import instrumentation, metrics
+
+logger = logging.getLogger(__name__)
+
+_TRANSPILATION_CACHE_DIR = "PLANQK_TRANSPILATION_CACHE_DIR"
+
+# Options not affecting the transpiled circuits
+_IGNORED_OPTIONS = frozenset({"num_processes"})
+
+_standard_gates: Optional[Dict[str, Any]] = None
+
+
+def get_cache_dir() -> str:
+    cache_dir = os.environ.get(_TRANSPILATION_CACHE_DIR, None)
+    if not cache_dir:
+        if platform.system() == 'Windows':
+            cache_dir = os.path.join(os.getenv('LOCALAPPDATA'), 'planqk', 'transpilation')
+        else:
+            cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'planqk', 'transpilation')
+    return cache_dir
+
+
+def circuit_fingerprint(circuit: QuantumCircuit) -> str:
+    """Returns a hash of the registers, global phase and instructions of the circuit.
+
+    Parameters are identified by their name, i.e., circuits built equally with new parameter objects have the same
+    fingerprint. The definitions of custom gates are part of the fingerprint, the name and metadata of the circuit
+    are not.
+    """
+    digest = hashlib.sha256()
+    _update_fingerprint(digest, circuit)
+    return digest.hexdigest()
+
+
+def _update_fingerprint(digest, circuit: QuantumCircuit):
+    global _standard_gates
+    if _standard_gates is None:
+        _standard_gates = get_standard_gate_name_mapping()
+
+    qubit_indices = {qubit: index for index, qubit in enumerate(circuit.qubits)}
+    clbit_indices = {clbit: index for index, clbit in enumerate(circuit.clbits)}
+    digest.update(repr((circuit.num_qubits, circuit.num_clbits,
+                        [(register.name, register.size) for register in circuit.qregs],
+                        [(register.name, register.size) for register in circuit.cregs],
+                        _parameter_key(circuit.global_phase))).encode())
+
+    for instruction in circuit.data:
+        operation = instruction.operation
+        condition = getattr(operation, "condition", None)
+        if condition is not None:
+            target, value = condition
+            condition = (getattr(target, "name", None) or clbit_indices.get(target), value)
+        digest.update(repr((operation.name, operation.num_qubits, operation.num_clbits,
+                            [_parameter_key(param, digest) for param in operation.params],
+                            [qubit_indices[qubit] for qubit in instruction.qubits],
+                            [clbit_indices[clbit] for clbit in instruction.clbits],
+                            condition)).encode())
+
+        standard_gate = _standard_gates.get(operation.name)
+        if standard_gate is None or type(standard_gate) is not type(operation):
+            definition = getattr(operation, "definition", None)
+            if definition is not None:
+                _update_fingerprint(digest, definition)
+
+
+def _parameter_key(param, digest=None):
+    if isinstance(param, ParameterExpression):
+        return str(param)
+    if isinstance(param, QuantumCircuit):
+        # Blocks of control flow operations
+        _update_fingerprint(digest, param)
+        return "block"
+    if isinstance(param, np.ndarray):
+        return param.shape, hashlib.sha256(np.ascontiguousarray(param).tobytes()).hexdigest()
+    return repr(param)
+
+
+def _option_key(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_option_key(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((repr(key), _option_key(item)) for key, item in value.items()))
+    # E.g., layouts, their representation identifies them
+    return repr(value)
+
+
+class TranspilationCache(object):
+    """Bounded cache of transpiled circuits in memory and, optionally, on disk.
+
+    The least recently used circuits are evicted from memory, the least recently written or read circuits from disk.
+    Circuits are stored on disk in the QPY format, reading or writing them fails silently, i.e., results in a cache
+    miss.
+    """
+
+    def __init__(self, max_entries: int = 256, directory: Optional[str] = None, max_disk_entries: int = 4096):
+        """
+        Args:
+            max_entries: maximum number of circuits kept in memory
+            directory: directory the circuits are stored in, None to cache in memory only
+            max_disk_entries: maximum number of circuits stored on disk
+        """
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_disk_entries = max_disk_entries
+        self._entries: "OrderedDict[str, QuantumCircuit]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[QuantumCircuit]:
+        circuit, _ = self._lookup(key)
+        return circuit
+
+    def _lookup(self, key: str):
+        with self._lock:
+            circuit = self._entries.get(key)
+            if circuit is not None:
+                self._entries.move_to_end(key)
+                return circuit, "memory"
+        circuit = self._read(key)
+        if circuit is not None:
+            self._remember(key, circuit)
+            return circuit, "disk"
+        return None, "miss"
+
+    def put(self, key: str, circuit: QuantumCircuit):
+        self._remember(key, circuit)
+        self._write(key, circuit)
+
+    def clear(self):
+        """Removes all circuits from memory and disk."""
+        with self._lock:
+            self._entries.clear()
+        for path in self._disk_entries():
+            _remove(path)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remember(self, key: str, circuit: QuantumCircuit):
+        with self._lock:
+            self._entries[key] = circuit
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.qpy")
+
+    def _read(self, key: str) -> Optional[QuantumCircuit]:
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                circuit = qpy.load(file)[0]
+            os.utime(path)
+            return circuit
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Cannot read transpiled circuit %s: %s", path, e)
+            return None
+
+    def _write(self, key: str, circuit: QuantumCircuit):
+        if self.directory is None:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Written to a temporary file first, hence, concurrent readers never read partially written circuits
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    qpy.dump(circuit, file)
+                os.replace(temp_path, self._path(key))
+            except BaseException:
+                _remove(temp_path)
+                raise
+        except Exception as e:
+            logger.debug("Cannot write transpiled circuit to %s: %s", self.directory, e)
+            return
+        self._evict_from_disk()
+
+    def _disk_entries(self) -> List[str]:
+        if self.directory is None or not os.path.isdir(self.directory):
+            return []
+        return [entry.path for entry in os.scandir(self.directory) if entry.name.endswith(".qpy")]
+
+    def _evict_from_disk(self):
+        paths = self._disk_entries()
+        if len(paths) <= self.max_disk_entries:
+            return
+        mtimes = {}
+        for path in paths:
+            try:
+                mtimes[path] = os.path.getmtime(path)
+            except OSError:
+                pass
+        for path in sorted(mtimes, key=mtimes.get)[:len(mtimes) - self.max_disk_entries]:
+            _remove(path)
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+_default_cache: Optional[TranspilationCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def default_transpilation_cache() -> TranspilationCache:
+    """Returns the cache used by the backends by default, storing circuits in the directory returned by
+    get_cache_dir()."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = TranspilationCache(directory=get_cache_dir())
+        return _default_cache
+
+
+def set_default_transpilation_cache(cache: TranspilationCache):
+    global _default_cache
+    with _default_cache_lock:
+        _default_cache = cache
+
+
+def cache_key(circuit: QuantumCircuit, backend, transpile_options: Mapping[str, Any]) -> str:
+    """Returns the key of the transpiled circuit for the given backend and transpiler options."""
+    backend_info = backend.backend_info
+    options = tuple(sorted((name, _option_key(value)) for name, value in transpile_options.items()
+                           if name not in _IGNORED_OPTIONS))
+    key = repr((circuit_fingerprint(circuit), backend_info.id, backend_info.updated_at, options, qiskit.__version__))
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def transpile_cached(circuits: Union[QuantumCircuit, Sequence[QuantumCircuit]], backend,
+                     cache: Optional[TranspilationCache] = None,
+                     parameter_binds: Optional[Union[Mapping, Sequence[Mapping]]] = None,
+                     **transpile_options) -> Union[QuantumCircuit, List[QuantumCircuit]]:
+    """Transpiles the circuits for the backend, reusing the circuits transpiled before.
+
+    The circuits not cached are transpiled by a single transpile call, i.e., Qiskit transpiles them in parallel.
+    Backends without version might have changed, hence, circuits transpiled for them are not cached.
+
+    Args:
+        circuits: circuit or circuits to transpile
+        backend: PlanQK backend to transpile for
+        cache: cache of the transpiled circuits, the default cache if None
+        parameter_binds: parameter values, as mapping or list of mappings from parameters to values. If set, the
+            circuits are transpiled with their parameters unbound and the transpiled circuits are bound to each of
+            the mappings afterward, e.g., an ansatz is transpiled once for all parameter values.
+        **transpile_options: options passed to qiskit.transpile
+
+    Returns:
+        the transpiled circuit if a single circuit without parameter binds is given, otherwise the list of transpiled
+        circuits, for parameter binds ordered by circuit and then by parameter bind
+    """
+    if cache is None:
+        cache = default_transpilation_cache()
+    single_circuit = isinstance(circuits, QuantumCircuit)
+    circuits = [circuits] if single_circuit else list(circuits)
+    backend_id = backend.backend_info.id
+    cacheable = backend.backend_info.updated_at is not None
+
+    with instrumentation.span("transpile_cached", backend=backend.name, num_circuits=len(circuits)) as span:
+        keys = [cache_key(circuit, backend, transpile_options) for circuit in circuits]
+        transpiled: Dict[str, QuantumCircuit] = {}
+        misses: Dict[str, QuantumCircuit] = {}
+        for key, circuit in zip(keys, circuits):
+            if key in transpiled or key in misses:
+                continue
+            if not cacheable:
+                misses[key] = circuit
+                continue
+            cached_circuit, result = cache._lookup(key)
+            metrics.record_transpilation_cache_lookup(backend_id, result)
+            if cached_circuit is None:
+                misses[key] = circuit
+            else:
+                transpiled[key] = cached_circuit
+        span.set_attribute("cache_misses", len(misses))
+
+        if misses:
+            with instrumentation.span("transpile", num_circuits=len(misses)):
+                transpiled_misses = transpile(list(misses.values()), backend, **transpile_options)
+            for key, transpiled_circuit in zip(misses, transpiled_misses):
+                if cacheable:
+                    cache.put(key, transpiled_circuit)
+                transpiled[key] = transpiled_circuit
+
+        # Copies, hence, the cached circuits are not modified by the caller
+        results = [_with_attributes_of(transpiled[key].copy(), circuit) for key, circuit in zip(keys, circuits)]
+
+    if parameter_binds is None:
+        return results[0] if single_circuit else results
+    if isinstance(parameter_binds, Mapping):
+        parameter_binds = [parameter_binds]
+    return [circuit.assign_parameters(values, strict=False) for circuit in results for values in parameter_binds]
+
+
+def _with_attributes_of(transpiled_circuit: QuantumCircuit, circuit: QuantumCircuit) -> QuantumCircuit:
+    """Replaces the name, the metadata and the parameters of a cached circuit by the name, the metadata and the
+    equally named parameters of the given circuit, which is equal to the cached circuit apart from these."""
+    transpiled_circuit.name = circuit.name
+    transpiled_circuit.metadata = copy.deepcopy(circuit.metadata)
+    if not transpiled_circuit.parameters:
+        return transpiled_circuit
+    parameters = {parameter.name: parameter for parameter in circuit.parameters}
+    replacements = {parameter: parameters[parameter.name] for parameter in transpiled_circuit.parameters
+                    if parameters.get(parameter.name, parameter) is not parameter}
+    if replacements:
+        transpiled_circuit.assign_parameters(replacements, inplace=True)
+    return transpiled_circuit
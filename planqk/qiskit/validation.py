@@ -0,0 +1,92 @@
+"""Validation of circuits against the target of a backend before they are converted and submitted."""
+from collections import defaultdict
+from typing import AbstractSet, Dict, List, Optional
+
+import numpy as np
+from qiskit import QuantumCircuit
+
+from .client.backend_dtos import ShotsRangeDto
+from .routing import PlanqkTarget
+
+# Instructions supported by all backends, the conversions skip them
+_ALWAYS_SUPPORTED = frozenset({"barrier"})
+
+# Number of unsupported qubit tuples listed per instruction
+_MAX_REPORTED_QARGS = 5
+
+
+def validate_circuit(circuit: QuantumCircuit, target: PlanqkTarget, shots: Optional[int] = None,
+                     shots_range: Optional[ShotsRangeDto] = None,
+                     translatable_names: Optional[AbstractSet[str]] = frozenset(),
+                     physical_qubits: bool = True) -> List[str]:
+    """Checks the number of qubits, the instructions and the qubits they act on and the number of shots.
+
+    The qubits of the instructions are collected in a single pass over the circuit. The distinct qubit tuples of each
+    instruction are compared with the qubits supported by the target as integer arrays. Instructions not part of the
+    target but translated by the conversion of the backend must act on coupled qubits if they act on two qubits.
+
+    Args:
+        circuit: circuit to validate
+        target: target of the backend
+        shots: number of shots, not validated if None
+        shots_range: range of the supported number of shots
+        translatable_names: names of the instructions the conversion translates into instructions of the target, None
+            if it translates any instruction
+        physical_qubits: whether the circuit is executed on the physical qubits of its qubit indices. If False, the
+            qubits are mapped and routed by the provider, hence, the qubits of the instructions are not checked.
+
+    Returns:
+        descriptions of all violations, empty if the circuit is valid
+    """
+    violations = []
+    if shots is not None and shots_range is not None and not shots_range.min <= shots <= shots_range.max:
+        violations.append(f"{shots} shots are outside of the supported range [{shots_range.min}, {shots_range.max}]")
+    if target.num_qubits is not None and circuit.num_qubits > target.num_qubits:
+        violations.append(f"circuit has {circuit.num_qubits} qubits, the backend supports {target.num_qubits}")
+
+    qubits_by_name: Dict[str, list] = defaultdict(list)
+    for instruction in circuit.data:
+        qubits_by_name[instruction.operation.name].append(instruction.qubits)
+
+    qubit_indices = {qubit: index for index, qubit in enumerate(circuit.qubits)}
+    operation_names = target.operation_names
+    base = max(circuit.num_qubits, target.num_qubits or 0, 1)
+    for name, qubits in qubits_by_name.items():
+        if name in _ALWAYS_SUPPORTED:
+            continue
+        qargs = [[qubit_indices[qubit] for qubit in qarg] for qarg in set(qubits)]
+        if name in operation_names:
+            supported_qargs = target.qargs_array(name)
+        elif translatable_names is None or name in translatable_names:
+            # Translated instructions on two qubits result in instructions on the same, hence, coupled qubits
+            supported_qargs = target.routing_data.edges if len(qargs[0]) == 2 else None
+        else:
+            violations.append(f"instruction {name} is not supported ({len(qubits)} occurrences)")
+            continue
+        if supported_qargs is None or not physical_qubits:
+            continue
+        unsupported_qargs = _unsupported_qargs(qargs, supported_qargs, base)
+        if unsupported_qargs:
+            listed = ", ".join(str(tuple(qarg)) for qarg in unsupported_qargs[:_MAX_REPORTED_QARGS])
+            if len(unsupported_qargs) > _MAX_REPORTED_QARGS:
+                listed += f" and {len(unsupported_qargs) - _MAX_REPORTED_QARGS} more"
+            violations.append(f"instruction {name} is not supported on qubits {listed}")
+    return violations
+
+
+def _unsupported_qargs(qargs: List[List[int]], supported_qargs: np.ndarray, base: int) -> List[List[int]]:
+    lengths = {len(qarg) for qarg in qargs}
+    if len(lengths) > 1 or base ** max(lengths) >= 2 ** 62:
+        # Variadic instructions or instructions on many qubits are rare and checked individually
+        supported = {tuple(qarg) for qarg in supported_qargs.tolist()}
+        return sorted({tuple(qarg) for qarg in qargs if tuple(qarg) not in supported})
+
+    qargs = np.array(qargs, dtype=np.int64).reshape(len(qargs), -1)
+    if supported_qargs.shape[1:] != qargs.shape[1:]:
+        return np.unique(qargs, axis=0).tolist()
+    # Each tuple of qubits is encoded as single integer, i.e., as number with the qubit indices as digits
+    weights = base ** np.arange(qargs.shape[1], dtype=np.int64)
+    unsupported = ~np.isin(qargs @ weights, supported_qargs @ weights)
+    if not unsupported.any():
+        return []
+    return np.unique(qargs[unsupported], axis=0).tolist()
@@ -23,4 +23,12 @@ setup(
         'Operating System :: OS Independent',
     ],
     install_requires=requirements,
+    extras_require={
+        'http2': ['httpx[http2]'],
+        'zstd': ['zstandard'],
+        'orjson': ['orjson'],
+        'msgpack': ['msgpack'],
+        'cbor': ['cbor2'],
+        'tracing': ['opentelemetry-api'],
+    },
 )
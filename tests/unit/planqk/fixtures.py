@@ -0,0 +1,47 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from planqk.qiskit.client.client import _PlanqkClient, HEADER_CLOUD_TRACE_CTX
+from planqk.qiskit.client.transport import RequestsTransport
+from planqk.qiskit.emulator import MiddlewareEmulator
+
+
+class FakeClock(object):
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class PlanqkClientTestCase(unittest.TestCase):
+    """Test case sending requests with fixed default headers and resetting the transport after each test."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._default_headers_patch = patch.object(_PlanqkClient, "_get_default_headers", MagicMock(
+            return_value={"x-auth-token": "test_token", HEADER_CLOUD_TRACE_CTX: "test_trace"}))
+        cls._default_headers_patch.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._default_headers_patch.stop()
+        super().tearDownClass()
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(_PlanqkClient.set_transport, RequestsTransport())
+
+
+class EmulatorTestCase(PlanqkClientTestCase):
+    """Test case sending the requests of the client to a middleware emulator."""
+
+    def setUp(self):
+        super().setUp()
+        self.emulator = self.create_emulator()
+        _PlanqkClient.set_transport(self.emulator.transport())
+
+    def create_emulator(self) -> MiddlewareEmulator:
+        return MiddlewareEmulator(seed=42)
@@ -0,0 +1,87 @@
+from unittest.mock import patch
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter, ParameterVector
+
+from planqk.exceptions import PlanqkClientError
+from planqk.qiskit import PlanqkQuantumProvider
+from planqk.qiskit.providers.aws import aws_backend
+from tests.unit.planqk.fixtures import EmulatorTestCase
+
+
+def _parameterized_circuit() -> QuantumCircuit:
+    theta = Parameter("theta")
+    phi = ParameterVector("phi", 2)
+    circuit = QuantumCircuit(2)
+    circuit.rx(theta, 0)
+    circuit.ry(phi[0], 1)
+    circuit.cx(0, 1)
+    circuit.rz(2 * theta + phi[1], 1)
+    circuit.measure_all()
+    return circuit
+
+
+class ParameterSweepTestSuite(EmulatorTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.provider = PlanqkQuantumProvider(access_token="test_token")
+        self.backend = self.provider.get_backend("aws.sim.sv1")
+
+    def _submitted_jobs(self):
+        return list(self.emulator._jobs.values())
+
+    def test_sweep_shares_program(self):
+        # Given
+        circuit = _parameterized_circuit()
+        theta, phi = circuit.parameters[2], circuit.parameters[0].vector
+        parameter_binds = [{theta: value, phi[0]: 0.5, phi[1]: -value} for value in [0.1, 0.2, 0.3]]
+
+        # When
+        with patch.object(aws_backend, "qiskit_to_braket_openqasm",
+                          side_effect=aws_backend.qiskit_to_braket_openqasm) as convert:
+            jobs = self.backend.run_parameter_sweep(circuit, parameter_binds, shots=100)
+
+        # Then
+        self.assertEqual(1, convert.call_count)
+        self.assertEqual(3, len(jobs))
+        submitted_jobs = self._submitted_jobs()
+        self.assertEqual([job.id for job in jobs], [job["id"] for job in submitted_jobs])
+        self.assertEqual(1, len({job["input"] for job in submitted_jobs}))
+        self.assertIn("input float theta;", submitted_jobs[0]["input"])
+        self.assertEqual([{"theta": value, "phi_0": 0.5, "phi_1": -value} for value in [0.1, 0.2, 0.3]],
+                         [job["input_params"]["inputs"] for job in submitted_jobs])
+        for job in jobs:
+            self.assertEqual(100, sum(job.result().get_counts().values()))
+
+    def test_sweep_with_parameter_names(self):
+        # When
+        self.backend.run_parameter_sweep(_parameterized_circuit(),
+                                         [{"theta": 1, "phi[0]": 2, "phi_1": 3}], shots=10, inputs={"theta": 0})
+
+        # Then
+        self.assertEqual({"theta": 1.0, "phi_0": 2.0, "phi_1": 3.0},
+                         self._submitted_jobs()[0]["input_params"]["inputs"])
+
+    def test_sweep_with_unbound_parameter(self):
+        # When
+        with self.assertRaises(ValueError) as context:
+            self.backend.run_parameter_sweep(_parameterized_circuit(), [{"theta": 0.1, "phi_0": 0.2},
+                                                                        {"theta": 0.1}])
+
+        # Then
+        self.assertIn("phi_1", str(context.exception))
+        self.assertEqual([], self._submitted_jobs())
+
+    def test_run_with_inputs(self):
+        # Given
+        circuit = _parameterized_circuit()
+
+        # When
+        self.backend.run(circuit, shots=10, inputs={"theta": 0.1, "phi[0]": 0.2, "phi[1]": 0.3})
+
+        # Then
+        self.assertEqual({"disable_qubit_rewiring": False, "inputs": {"theta": 0.1, "phi_0": 0.2, "phi_1": 0.3}},
+                         self._submitted_jobs()[0]["input_params"])
+        with self.assertRaises(PlanqkClientError):
+            self.backend.run(circuit, shots=10)
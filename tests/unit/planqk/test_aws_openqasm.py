@@ -0,0 +1,170 @@
+import unittest
+import warnings
+from unittest.mock import patch
+
+import qiskit.circuit.library as qiskit_gates
+from braket.circuits.circuit_helpers import validate_circuit_and_shots
+from braket.circuits.compiler_directives import StartVerbatimBox
+from braket.circuits.gates import PulseGate
+from braket.circuits.serialization import IRType, OpenQASMSerializationProperties, QubitReferenceType
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter, ParameterVector
+from qiskit.circuit.random import random_circuit
+from qiskit_braket_provider.providers.adapter import (
+    _GATE_NAME_TO_BRAKET_GATE,
+    _QISKIT_CONTROLLED_GATE_NAMES_TO_BRAKET_GATES,
+    to_braket,
+)
+from qiskit_ionq import ionq_gates
+
+from planqk.qiskit.providers.aws import openqasm
+from planqk.qiskit.providers.aws.openqasm import qiskit_to_braket_openqasm
+
+
+def _braket_openqasm(circuit: QuantumCircuit, basis_gates=None, verbatim=False, disable_qubit_rewiring=False,
+                     shots=None) -> str:
+    """Converts the circuit as done before the direct conversion, i.e., by building and serializing the Braket
+    circuit."""
+    braket_circuit = to_braket(circuit.copy(), basis_gates, verbatim=verbatim)
+    if shots is not None:
+        validate_circuit_and_shots(braket_circuit, shots)
+    physical = disable_qubit_rewiring or any(isinstance(instruction.operator, (StartVerbatimBox, PulseGate))
+                                             for instruction in braket_circuit.instructions)
+    properties = OpenQASMSerializationProperties(
+        qubit_reference_type=QubitReferenceType.PHYSICAL if physical else QubitReferenceType.VIRTUAL)
+    return braket_circuit.to_ir(ir_type=IRType.OPENQASM, serialization_properties=properties).source
+
+
+def _normalized(program: str):
+    # Braket declares the inputs in the order of a set
+    lines = program.split("\n")
+    return sorted(line for line in lines if line.startswith("input")), [line for line in lines
+                                                                        if not line.startswith("input")]
+
+
+def _parameterized_circuit() -> QuantumCircuit:
+    theta = Parameter("theta")
+    v = ParameterVector("v", 2)
+    circuit = QuantumCircuit(3)
+    circuit.rx(theta, 0)
+    circuit.rz(2 * theta + v[0], 1)
+    circuit.append(qiskit_gates.U1Gate(v[1]), [2])
+    circuit.cp(theta, 0, 1)
+    circuit.crx(v[0], 1, 2)
+    circuit.append(ionq_gates.GPIGate(theta), [2])
+    circuit.measure_all()
+    return circuit
+
+
+def _all_gates_circuit() -> QuantumCircuit:
+    circuit = QuantumCircuit(5, 2)
+    circuit.u(0.1, 0.2, 0.3, 0)
+    circuit.append(qiskit_gates.U1Gate(0.4), [0])
+    circuit.append(qiskit_gates.U2Gate(0.1, 0.2), [1])
+    circuit.append(qiskit_gates.U3Gate(0.1, 0.2, 0.3), [1])
+    circuit.append(qiskit_gates.GlobalPhaseGate(0.7), [])
+    circuit.append(ionq_gates.GPIGate(0.1), [0])
+    circuit.append(ionq_gates.GPI2Gate(0.2), [0])
+    circuit.append(ionq_gates.MSGate(0.1, 0.2, 0.25), [0, 1])
+    circuit.append(ionq_gates.ZZGate(0.3), [0, 1])
+    circuit.ccx(0, 1, 2)
+    circuit.cswap(0, 1, 2)
+    circuit.id(0)
+    circuit.iswap(0, 1)
+    circuit.ecr(0, 1)
+    circuit.rxx(0.1, 0, 1)
+    circuit.ryy(0.2, 0, 1)
+    circuit.rzz(0.3, 0, 1)
+    circuit.cs(0, 1)
+    circuit.csdg(0, 1)
+    circuit.csx(0, 1)
+    circuit.cry(0.1, 0, 1)
+    circuit.ccz(0, 1, 2)
+    circuit.append(qiskit_gates.C3SXGate(), [0, 1, 2, 3])
+    circuit.mcx([0, 1, 2], 4)
+    circuit.rx(1, 3)
+    circuit.global_phase = 0.5
+    circuit.measure([4, 0], [0, 1])
+    return circuit
+
+
+class BraketOpenQasmTestSuite(unittest.TestCase):
+
+    def setUp(self):
+        warnings.simplefilter("ignore")
+
+    def tearDown(self):
+        warnings.resetwarnings()
+
+    def assertEquivalent(self, circuit: QuantumCircuit, **kwargs):
+        try:
+            expected = _braket_openqasm(circuit, **kwargs)
+        except Exception as e:
+            # E.g., gates not supported by Braket in verbatim circuits
+            with self.assertRaises(type(e)):
+                qiskit_to_braket_openqasm(circuit, **kwargs)
+            return
+        self.assertEqual(_normalized(expected), _normalized(qiskit_to_braket_openqasm(circuit, **kwargs)))
+
+    def test_gate_tables_cover_braket_provider_gates(self):
+        self.assertEqual(set(_GATE_NAME_TO_BRAKET_GATE), set(openqasm._GATES))
+        self.assertEqual(set(_QISKIT_CONTROLLED_GATE_NAMES_TO_BRAKET_GATES), set(openqasm._CONTROLLED_GATES))
+
+    def test_random_circuits(self):
+        for seed in range(25):
+            circuit = random_circuit(6, 8, max_operands=3, measure=seed % 2 == 0, seed=seed)
+            for kwargs in [{}, {"verbatim": True}, {"disable_qubit_rewiring": True},
+                           {"basis_gates": ["rx", "rz", "cz", "measure"]}]:
+                with self.subTest(seed=seed, **kwargs):
+                    self.assertEquivalent(circuit, **kwargs)
+
+    def test_all_gates(self):
+        for kwargs in [{}, {"verbatim": True}, {"basis_gates": ["rx", "rz", "cz", "measure"]}]:
+            with self.subTest(**kwargs):
+                self.assertEquivalent(_all_gates_circuit(), **kwargs)
+
+    def test_parameterized_circuit(self):
+        for kwargs in [{}, {"verbatim": True}]:
+            with self.subTest(**kwargs):
+                self.assertEquivalent(_parameterized_circuit(), **kwargs)
+
+        program = qiskit_to_braket_openqasm(_parameterized_circuit())
+        self.assertIn("input float theta;\ninput float v_0;\ninput float v_1;\n", program)
+
+    def test_unsupported_circuits(self):
+        reset_circuit = QuantumCircuit(1)
+        reset_circuit.reset(0)
+        negative_control_circuit = QuantumCircuit(2)
+        negative_control_circuit.cx(0, 1, ctrl_state=0)
+        empty_circuit = QuantumCircuit(2)
+        empty_circuit.measure_all()
+        unmeasured_circuit = QuantumCircuit(2)
+        unmeasured_circuit.h(0)
+
+        for circuit, shots, error in [(reset_circuit, None, NotImplementedError),
+                                      (negative_control_circuit, None, ValueError),
+                                      (empty_circuit, 10, ValueError),
+                                      (unmeasured_circuit, 0, ValueError)]:
+            with self.subTest(error=error, shots=shots):
+                with self.assertRaises(error):
+                    _braket_openqasm(circuit, verbatim=True, shots=shots)
+                with self.assertRaises(error):
+                    qiskit_to_braket_openqasm(circuit, verbatim=True, shots=shots)
+
+    def test_programs_of_transpiled_circuits_are_memoized(self):
+        # Given
+        circuit = random_circuit(5, 10, measure=True, seed=100)
+        basis_gates = ["rx", "rz", "cz", "measure"]
+
+        # When
+        with patch.object(openqasm, "transpile", side_effect=openqasm.transpile) as transpile:
+            program = qiskit_to_braket_openqasm(circuit, basis_gates)
+            memoized_program = qiskit_to_braket_openqasm(circuit.copy(), basis_gates)
+            physical_program = qiskit_to_braket_openqasm(circuit, basis_gates, disable_qubit_rewiring=True)
+
+        # Then
+        self.assertEqual(2, transpile.call_count)
+        self.assertEqual(program, memoized_program)
+        self.assertNotEqual(program, physical_program)
+        self.assertEqual(_normalized(_braket_openqasm(circuit, basis_gates)), _normalized(memoized_program))
+
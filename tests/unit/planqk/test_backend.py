@@ -0,0 +1,185 @@
+import gc
+import threading
+from unittest.mock import patch
+
+import numpy as np
+from qiskit import QuantumCircuit, transpile
+from qiskit.transpiler import CouplingMap
+
+from planqk.qiskit import PlanqkQuantumProvider, backend as backend_module
+from planqk.qiskit.emulator import catalog
+from planqk.qiskit.providers.aws.aws_backend import PlanqkAwsBackend
+from tests.unit.planqk.fixtures import EmulatorTestCase
+
+
+class BackendStructuresTestSuite(EmulatorTestCase):
+
+    def setUp(self):
+        # Collects the backends of previous tests so that no structures are shared with them
+        gc.collect()
+        super().setUp()
+        self.provider = PlanqkQuantumProvider(access_token="test_token")
+
+    def test_target_is_built_on_first_access(self):
+        # Given
+        backend = self.provider.get_backend("aws.rigetti.ankaa")
+
+        # When
+        self.assertEqual(1, backend.min_shots)
+        self.assertEqual("aws.rigetti.ankaa", backend.backend_info.id)
+
+        # Then
+        self.assertIsNone(backend._target)
+        self.assertIsNone(backend._configuration)
+        self.assertEqual(42, backend.coupling_map.size())
+        self.assertIsNotNone(backend._target)
+        self.assertIsNone(backend._configuration)
+        self.assertEqual(42, backend.configuration().n_qubits)
+
+    def test_target_is_built_once_by_concurrent_threads(self):
+        # Given
+        backend = self.provider.get_backend("aws.rigetti.ankaa")
+        barrier = threading.Barrier(8)
+        targets = []
+
+        def access_target():
+            barrier.wait()
+            targets.append(backend.target)
+
+        # When
+        with patch.object(PlanqkAwsBackend, "_planqk_backend_to_target", autospec=True,
+                          side_effect=PlanqkAwsBackend._planqk_backend_to_target) as build_target:
+            threads = [threading.Thread(target=access_target) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+
+        # Then
+        self.assertEqual(1, build_target.call_count)
+        self.assertEqual(8, len(targets))
+        self.assertTrue(all(target is targets[0] for target in targets))
+
+    def test_ibm_backend_is_created_on_first_access(self):
+        # Given
+        backend = self.provider.get_backend("ibm.eagle")
+
+        # Then
+        self.assertIsNone(backend._ibm_backend)
+        self.assertIs(backend.ibm_backend, backend.ibm_backend)
+        self.assertEqual(backend.configuration(), backend.ibm_backend.configuration())
+
+    def test_structures_are_shared_by_backends_of_same_version(self):
+        # Given
+        backend = self.provider.get_backend("aws.rigetti.ankaa")
+        other_backend = self.provider.get_backend("aws.rigetti.ankaa")
+
+        # Then
+        self.assertIsNot(backend, other_backend)
+        self.assertIs(backend.target, other_backend.target)
+        self.assertIs(backend.configuration(), other_backend.configuration())
+
+    def test_structures_are_not_shared_by_backends_of_other_versions(self):
+        # Given
+        backend = self.provider.get_backend("aws.rigetti.ankaa")
+        updated_backend = catalog.aws_rigetti()
+        updated_backend["updated_at"] = "2024-02-01"
+        self.emulator.add_backend(updated_backend)
+
+        # When
+        other_backend = self.provider.get_backend("aws.rigetti.ankaa")
+
+        # Then
+        self.assertIsNot(backend.target, other_backend.target)
+
+    def test_shared_structures_are_collected(self):
+        # Given
+        backend = self.provider.get_backend("aws.rigetti.ankaa")
+        key = backend._shared_structures_key()
+        self.assertIsNotNone(backend.target)
+
+        # When
+        del backend
+        gc.collect()
+
+        # Then
+        self.assertNotIn(key, backend_module._shared_structures)
+
+
+class BackendRoutingDataTestSuite(EmulatorTestCase):
+
+    def setUp(self):
+        # Collects the backends of previous tests so that no routing data is shared with them
+        gc.collect()
+        super().setUp()
+        self.provider = PlanqkQuantumProvider(access_token="test_token")
+
+    def test_coupling_map_with_precomputed_distances(self):
+        # Given
+        backend = self.provider.get_backend("aws.rigetti.ankaa")
+        edges = backend.connectivity.edge_list()
+
+        # When
+        coupling_map = backend.coupling_map
+
+        # Then
+        expected_coupling_map = CouplingMap(edges)
+        self.assertEqual(set(expected_coupling_map.get_edges()), set(coupling_map.get_edges()))
+        self.assertIs(backend.distance_matrix, coupling_map._dist_matrix)
+        np.testing.assert_array_equal(expected_coupling_map.distance_matrix, backend.distance_matrix)
+        self.assertFalse(backend.distance_matrix.flags.writeable)
+        self.assertEqual([list(range(42))], backend.connected_components)
+
+    def test_routing_data_is_computed_once_per_backend_version(self):
+        # Given
+        backend = self.provider.get_backend("aws.rigetti.ankaa")
+        other_backend = self.provider.get_backend("aws.rigetti.ankaa")
+        circuit = QuantumCircuit(3)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.cx(0, 2)
+        circuit.measure_all()
+
+        # When
+        with patch.object(CouplingMap, "compute_distance_matrix", autospec=True,
+                          side_effect=CouplingMap.compute_distance_matrix) as compute_distance_matrix:
+            transpiled_circuits = [transpile(circuit, b, seed_transpiler=42) for b in [backend, other_backend]]
+
+        # Then
+        self.assertEqual(1, compute_distance_matrix.call_count)
+        self.assertIs(backend.distance_matrix, other_backend.distance_matrix)
+        self.assertEqual(transpiled_circuits[0], transpiled_circuits[1])
+
+    def test_modified_coupling_map_is_not_shared(self):
+        # Given
+        backend = self.provider.get_backend("aws.rigetti.ankaa")
+
+        # When
+        backend.target.build_coupling_map().add_edge(0, 41)
+
+        # Then
+        self.assertNotIn((0, 41), backend.target.build_coupling_map().get_edges())
+
+    def test_simulator_without_coupling_map(self):
+        # Given
+        backend = self.provider.get_backend("aws.sim.sv1")
+
+        # Then
+        self.assertIsNone(backend.coupling_map)
+        self.assertIsNone(backend.distance_matrix)
+        self.assertEqual([], backend.connected_components)
+
+    def test_fully_connected_backend_without_coupling_map(self):
+        # Given
+        backend = self.provider.get_backend("aws.ionq.aria")
+        circuit = QuantumCircuit(backend.num_qubits)
+        circuit.cx(0, backend.num_qubits - 1)
+
+        # When
+        transpiled_circuit = transpile(circuit, backend, optimization_level=0)
+
+        # Then
+        self.assertIsNone(backend.coupling_map)
+        self.assertIsNone(backend.target.qargs_for_operation_name("cx"))
+        self.assertEqual(backend.num_qubits, len(backend.target.qargs_for_operation_name("measure")))
+        self.assertEqual({"cx": 1}, dict(transpiled_circuit.count_ops()))
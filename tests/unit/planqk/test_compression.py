@@ -0,0 +1,118 @@
+import gzip
+import json
+
+from planqk.qiskit.client.client import _PlanqkClient
+from planqk.qiskit.client.compression import compress, decompress, available_encodings, RequestCompression, GZIP, \
+    ZSTD, compress_chunks
+from planqk.qiskit.client.job_dtos import JobDto, INPUT_FORMAT
+from planqk.qiskit.client.serialization import StreamedJson, dumps
+from planqk.qiskit.client.transport import InProcessTransport
+from tests.unit.planqk.fixtures import PlanqkClientTestCase
+
+
+def _deep_qoqo_input(depth: int) -> dict:
+    operations = []
+    for i in range(depth):
+        operations.append({"RotateX": {"qubit": i % 10, "theta": 0.1 * (i % 7)}})
+        operations.append({"CNOT": {"control": i % 10, "target": (i + 1) % 10}})
+    return {"ClassicalRegister": {"measurement": {"circuits": [{"operations": operations}]}}}
+
+
+class CompressionTestSuite(PlanqkClientTestCase):
+
+    def tearDown(self):
+        _PlanqkClient.set_request_compression(None)
+
+    def test_compress_round_trip(self):
+        data = json.dumps(_deep_qoqo_input(1000)).encode()
+
+        for encoding in available_encodings():
+            compressed = compress(data, encoding)
+            self.assertLess(len(compressed) * 5, len(data))
+            self.assertEqual(data, decompress(compressed, encoding))
+
+    def test_compress_chunks_round_trip(self):
+        data = json.dumps(_deep_qoqo_input(1000)).encode()
+        chunks = [data[i:i + 4096] for i in range(0, len(data), 4096)]
+
+        for encoding in available_encodings():
+            compressed = b"".join(compress_chunks(chunks, encoding))
+            self.assertLess(len(compressed) * 5, len(data))
+            self.assertEqual(data, decompress(compressed, encoding))
+
+    def test_small_bodies_are_not_compressed(self):
+        compression = RequestCompression(GZIP, min_size=1024)
+
+        body, encoding = compression.compress(b"{}")
+
+        self.assertEqual(b"{}", body)
+        self.assertIsNone(encoding)
+
+    def test_submit_job_sends_compressed_body(self):
+        # Given
+        received = {}
+
+        def handler(method, url, params, headers, body):
+            received["headers"] = headers
+            received["body"] = body
+            response = json.dumps({"id": "123", "provider": "QRYD"}).encode()
+            return 201, {"content-type": "application/json", "content-encoding": "gzip"}, gzip.compress(response)
+
+        _PlanqkClient.set_transport(InProcessTransport(handler))
+        _PlanqkClient.set_request_compression(GZIP)
+        job_input = _deep_qoqo_input(1000)
+
+        # When
+        job = _PlanqkClient.submit_job(JobDto(provider="QRYD", input=job_input, input_format=INPUT_FORMAT.QOQO))
+
+        # Then
+        self.assertEqual("123", job.id)
+        self.assertEqual("gzip", received["headers"]["content-encoding"])
+        uncompressed_body = decompress(received["body"], GZIP)
+        self.assertEqual(job_input, json.loads(uncompressed_body)["input"])
+        self.assertLess(len(received["body"]) * 5, len(uncompressed_body))
+
+    def test_submit_job_streams_compressed_body(self):
+        # Given
+        received = {}
+
+        def handler(method, url, params, headers, body):
+            received["headers"] = headers
+            received["body"] = body
+            return 201, {"content-type": "application/json"}, json.dumps({"id": "123", "provider": "QRYD"}).encode()
+
+        _PlanqkClient.set_transport(InProcessTransport(handler))
+        _PlanqkClient.set_request_compression(GZIP)
+        job_input = _deep_qoqo_input(1000)
+        encoded_input = dumps(job_input)
+        streamed_input = StreamedJson(lambda: (encoded_input[i:i + 1024] for i in range(0, len(encoded_input), 1024)))
+
+        # When
+        _PlanqkClient.submit_job(JobDto(provider="QRYD", input=streamed_input, input_format=INPUT_FORMAT.QOQO))
+
+        # Then
+        self.assertEqual("chunked", received["headers"]["transfer-encoding"])
+        self.assertEqual("gzip", received["headers"]["content-encoding"])
+        self.assertEqual(job_input, json.loads(decompress(received["body"], GZIP))["input"])
+
+    def test_unsupported_encoding_is_renegotiated(self):
+        # Given
+        received_encodings = []
+
+        def handler(method, url, params, headers, body):
+            received_encodings.append(headers.get("content-encoding"))
+            if "content-encoding" in headers:
+                return 415, {"accept-encoding": "identity"}, b""
+            return 201, {"content-type": "application/json"}, json.dumps({"id": "123", "provider": "QRYD"}).encode()
+
+        _PlanqkClient.set_transport(InProcessTransport(handler))
+        encoding = ZSTD if ZSTD in available_encodings() else GZIP
+        _PlanqkClient.set_request_compression(encoding)
+        job = JobDto(provider="QRYD", input=_deep_qoqo_input(100), input_format=INPUT_FORMAT.QOQO)
+
+        # When
+        _PlanqkClient.submit_job(job)
+        _PlanqkClient.submit_job(job)
+
+        # Then
+        self.assertEqual([encoding, None, None], received_encodings)
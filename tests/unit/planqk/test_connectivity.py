@@ -0,0 +1,80 @@
+import unittest
+
+import numpy as np
+
+from planqk.qiskit.client.backend_dtos import BackendDto
+from planqk.qiskit.connectivity import Connectivity
+from planqk.qiskit.emulator import catalog
+
+
+class ConnectivityTestSuite(unittest.TestCase):
+
+    def test_graph_connectivity(self):
+        # Given
+        configuration = BackendDto(**catalog.aws_rigetti(rows=2, columns=3)).configuration
+        graph = configuration.connectivity.graph
+
+        # When
+        connectivity = Connectivity.from_configuration(configuration)
+
+        # Then
+        expected_edges = {(int(qubit), int(connected_qubit))
+                          for qubit, connections in graph.items() for connected_qubit in connections}
+        self.assertFalse(connectivity.fully_connected)
+        self.assertEqual(6, connectivity.num_qubits)
+        self.assertEqual(len(expected_edges), connectivity.num_edges)
+        self.assertEqual(expected_edges, set(connectivity.edge_properties()))
+        self.assertEqual({(qubit,) for qubit in range(6)}, set(connectivity.qubit_properties()))
+
+        matrix = connectivity.adjacency_matrix()
+        self.assertEqual(expected_edges, {(int(i), int(j)) for i, j in zip(*np.nonzero(matrix))})
+
+    def test_fully_connected_connectivity(self):
+        # Given
+        configuration = BackendDto(**catalog.aws_ionq_aria()).configuration
+        qubits = configuration.qubits
+
+        # When
+        connectivity = Connectivity.from_configuration(configuration)
+
+        # Then
+        expected_edges = [(int(qubit1.id), int(qubit2.id)) for qubit1 in qubits for qubit2 in qubits
+                          if qubit1.id != qubit2.id]
+        self.assertTrue(connectivity.fully_connected)
+        self.assertEqual(len(expected_edges), connectivity.num_edges)
+        self.assertEqual(expected_edges, connectivity.edge_list())
+
+        matrix = connectivity.adjacency_matrix()
+        self.assertEqual(len(expected_edges), int(matrix.sum()))
+        self.assertFalse(matrix.diagonal().any())
+
+    def test_fully_connected_gates_are_global(self):
+        # Given
+        connectivity = Connectivity.from_configuration(BackendDto(**catalog.aws_ionq_aria()).configuration)
+
+        # When
+        edge_properties = connectivity.edge_properties()
+
+        # Then
+        self.assertEqual({None: None}, edge_properties)
+        self.assertEqual(25, len(connectivity.qubit_properties()))
+
+    def test_configuration_without_graph_is_fully_connected(self):
+        # Given
+        backend = catalog.aws_rigetti(rows=2, columns=2)
+        backend["configuration"]["connectivity"] = {"fully_connected": False, "graph": None}
+
+        # When
+        connectivity = Connectivity.from_configuration(BackendDto(**backend).configuration)
+
+        # Then
+        self.assertTrue(connectivity.fully_connected)
+        self.assertEqual(12, connectivity.num_edges)
+
+    def test_sparse_qubit_ids(self):
+        # When
+        connectivity = Connectivity.all_to_all([0, 2, 5])
+
+        # Then
+        self.assertEqual([(0, 2), (0, 5), (2, 0), (2, 5), (5, 0), (5, 2)], connectivity.edge_list())
+        self.assertEqual((6, 6), connectivity.adjacency_matrix().shape)
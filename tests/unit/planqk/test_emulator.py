@@ -0,0 +1,149 @@
+import os
+from unittest.mock import patch
+
+from qiskit import QuantumCircuit, transpile
+from qiskit.providers import JobStatus
+
+from planqk.exceptions import PlanqkClientError
+from planqk.qiskit import PlanqkQuantumProvider
+from planqk.qiskit.client.client import _PlanqkClient
+from planqk.qiskit.client.job_dtos import JobDto, INPUT_FORMAT
+from planqk.qiskit.client.transport import RequestsTransport
+from planqk.qiskit.emulator import MiddlewareEmulator, EmulatorServer
+from tests.unit.planqk.fixtures import FakeClock, EmulatorTestCase
+
+
+def _bell_circuit() -> QuantumCircuit:
+    circuit = QuantumCircuit(2, 2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.measure([0, 1], [0, 1])
+    return circuit
+
+
+class EmulatorTestSuite(EmulatorTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.provider = PlanqkQuantumProvider(access_token="test_token")
+
+    def create_emulator(self) -> MiddlewareEmulator:
+        self.clock = FakeClock(1000.0)
+        return MiddlewareEmulator(seed=42, clock=self.clock)
+
+    def tearDown(self):
+        _PlanqkClient.set_payload_format(None)
+
+    def test_run_circuit_on_aws_backend(self):
+        # Given
+        backend = self.provider.get_backend("aws.sim.sv1")
+
+        # When
+        result = backend.run(_bell_circuit(), shots=100).result()
+
+        # Then
+        counts = result.get_counts()
+        self.assertEqual(100, sum(counts.values()))
+        self.assertTrue(all(len(bitstring) == 2 for bitstring in counts))
+
+    def test_run_circuit_on_ibm_backend_is_simulated(self):
+        # Given
+        backend = self.provider.get_backend("ibm.eagle")
+
+        # When
+        result = backend.run(transpile(_bell_circuit(), backend), shots=200).result()
+
+        # Then
+        counts = result.get_counts()
+        self.assertEqual(200, sum(counts.values()))
+        self.assertTrue(set(counts.keys()) <= {"00", "11"})
+
+    def test_jobs_are_queued(self):
+        # Given
+        self.emulator.execution_time = 10
+        job = JobDto(provider="QRYD", backend_id="qryd.sim.square", input_format=INPUT_FORMAT.QOQO, input={})
+
+        # When
+        first_job = _PlanqkClient.submit_job(job)
+        second_job = _PlanqkClient.submit_job(job)
+
+        # Then
+        self.assertEqual("RUNNING", _PlanqkClient.get_job(first_job.id).status)
+        self.assertEqual("PENDING", _PlanqkClient.get_job(second_job.id).status)
+        self.assertEqual(1, _PlanqkClient.get_backend_state("qryd.sim.square").queue_size)
+
+        self.clock.now += 10
+        self.assertEqual("COMPLETED", _PlanqkClient.get_job(first_job.id).status)
+        self.assertEqual("RUNNING", _PlanqkClient.get_job(second_job.id).status)
+
+        self.clock.now += 10
+        self.assertEqual("COMPLETED", _PlanqkClient.get_job(second_job.id).status)
+
+    def test_cancel_job(self):
+        # Given
+        self.emulator.execution_time = 10
+        backend = self.provider.get_backend("azure.ionq.simulator")
+        job = backend.run(_bell_circuit(), shots=10)
+
+        # When
+        job.cancel()
+
+        # Then
+        self.assertEqual(JobStatus.CANCELLED, job.status())
+
+    def test_injected_request_failures(self):
+        # Given
+        self.emulator.error_rate = 1.0
+
+        # When
+        with self.assertRaises(PlanqkClientError) as context:
+            _PlanqkClient.get_backend("aws.sim.sv1")
+
+        # Then
+        self.assertEqual(503, context.exception.response.status_code)
+
+    def test_injected_job_failures(self):
+        # Given
+        self.emulator.job_failure_rate = 1.0
+        backend = self.provider.get_backend("aws.ionq.aria")
+
+        # When
+        job = backend.run(_bell_circuit(), shots=10)
+
+        # Then
+        self.assertEqual(JobStatus.ERROR, job.status())
+
+    def test_unknown_backend(self):
+        with self.assertRaises(Exception) as context:
+            self.provider.get_backend("unknown")
+
+        self.assertIn("Backend unknown not found", str(context.exception))
+
+    def test_binary_payloads(self):
+        # Given
+        try:
+            _PlanqkClient.set_payload_format("msgpack")
+        except Exception:
+            self.skipTest("msgpack is not installed")
+        backend = self.provider.get_backend("qryd.sim.square")
+
+        # When
+        counts = backend.run(_bell_circuit(), shots=50).result().get_counts()
+
+        # Then
+        self.assertEqual(50, sum(counts.values()))
+        self.assertEqual(1, self.emulator.request_counts[("POST", "jobs")])
+
+    def test_http_server(self):
+        with EmulatorServer(self.emulator) as server, \
+                patch.dict(os.environ, {"PLANQK_QUANTUM_BASE_URL": server.url}):
+            # Given
+            _PlanqkClient.set_transport(RequestsTransport())
+            backend = self.provider.get_backend("aws.rigetti.ankaa")
+
+            # When
+            counts = backend.run(_bell_circuit(), shots=20).result().get_counts()
+
+        # Then
+        self.assertEqual(20, sum(counts.values()))
+        self.assertEqual(1, self.emulator.request_counts[("GET", "job_result")])
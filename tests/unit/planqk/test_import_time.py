@@ -0,0 +1,62 @@
+import subprocess
+import sys
+import unittest
+from typing import Dict
+
+
+def _import_times(statement: str) -> Dict[str, int]:
+    """Runs the import statement in a fresh interpreter and returns the cumulative import time in µs per module."""
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                             capture_output=True, text=True, check=True)
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        import_times[module.strip()] = int(cumulative)
+    return import_times
+
+
+class ImportTimeTestSuite(unittest.TestCase):
+    """Guards against eager imports of heavy dependencies, budgets are generous to not fail on slow machines."""
+
+    def test_import_planqk_qiskit(self):
+        # When
+        import_times = _import_times("import planqk.qiskit")
+
+        # Then
+        self.assertNotIn("qiskit", import_times)
+        self.assertLess(import_times["planqk.qiskit"], 100_000)
+
+    def test_import_runtime_provider_defers_ibm_packages(self):
+        # When
+        import_times = _import_times("import planqk.qiskit.runtime_provider")
+
+        # Then
+        self.assertNotIn("qiskit_ibm_runtime", import_times)
+        self.assertNotIn("qiskit_ibm_provider", import_times)
+
+    def test_import_ibm_provider_backend_defers_ibm_packages(self):
+        # When
+        import_times = _import_times("import planqk.qiskit.providers.ibm.ibm_provider_backend")
+
+        # Then
+        self.assertNotIn("qiskit_ibm_runtime", import_times)
+        self.assertNotIn("qiskit_ibm_provider", import_times)
+
+    def test_import_planqk_dwave_defers_samplers(self):
+        # When
+        import_times = _import_times("import planqk.dwave")
+
+        # Then
+        self.assertFalse([module for module in import_times if module.startswith("dwave")])
+        self.assertLess(import_times["planqk.dwave"], 1_000_000)
+
+    def test_lazy_attributes(self):
+        import planqk.qiskit
+        from planqk.qiskit.provider import PlanqkQuantumProvider
+
+        self.assertIs(PlanqkQuantumProvider, planqk.qiskit.PlanqkQuantumProvider)
+        self.assertIn("PlanqkBackend", dir(planqk.qiskit))
+        with self.assertRaises(AttributeError):
+            getattr(planqk.qiskit, "Unknown")
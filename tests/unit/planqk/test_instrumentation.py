@@ -0,0 +1,95 @@
+from unittest.mock import MagicMock
+
+from qiskit import QuantumCircuit
+
+from planqk.qiskit import PlanqkQuantumProvider
+from planqk.qiskit.client.client import _PlanqkClient
+from planqk.qiskit.emulator import MiddlewareEmulator
+from planqk.qiskit.instrumentation import span, profile, add_sink, remove_sink, CallbackSink, HistogramSink, \
+    is_enabled, Span
+from tests.unit.planqk.fixtures import PlanqkClientTestCase
+
+
+class InstrumentationTestSuite(PlanqkClientTestCase):
+
+    def test_spans_are_not_recorded_without_sinks(self):
+        self.assertFalse(is_enabled())
+        with span("first") as first, span("second") as second:
+            first.set_attribute("key", "value")
+
+        self.assertIs(first, second)
+        self.assertIsNone(first.duration)
+
+    def test_nested_spans(self):
+        # When
+        with profile() as sink:
+            with span("outer", backend="sim"):
+                with span("inner") as inner:
+                    inner.set_attribute("size", 3)
+
+        # Then
+        self.assertFalse(is_enabled())
+        inner_span, outer_span = sink.spans
+        self.assertEqual("outer/inner", inner_span.path)
+        self.assertEqual({"size": 3}, inner_span.attributes)
+        self.assertEqual({"backend": "sim"}, outer_span.attributes)
+        self.assertLessEqual(inner_span.duration, outer_span.duration)
+        self.assertEqual(1, sink.summary()["inner"]["count"])
+
+    def test_callback_sink_receives_errors(self):
+        # Given
+        recorded = []
+        sink = add_sink(CallbackSink(recorded.append))
+        failing_sink = add_sink(CallbackSink(MagicMock(side_effect=RuntimeError("sink failed"))))
+
+        # When
+        try:
+            with self.assertRaises(ValueError):
+                with span("failing"):
+                    raise ValueError("stage failed")
+        finally:
+            remove_sink(sink)
+            remove_sink(failing_sink)
+
+        # Then
+        self.assertEqual(1, len(recorded))
+        self.assertIsInstance(recorded[0].error, ValueError)
+
+    def test_histogram_summary(self):
+        sink = HistogramSink()
+        for duration in [0.1, 0.2, 0.3, 0.4]:
+            recorded_span = Span("stage")
+            recorded_span.start, recorded_span.end = 1.0, 1.0 + duration
+            sink.record(recorded_span)
+
+        summary = sink.summary()["stage"]
+
+        self.assertEqual(4, summary["count"])
+        self.assertAlmostEqual(0.25, summary["mean"])
+        self.assertAlmostEqual(0.2, summary["p50"])
+        self.assertAlmostEqual(0.4, summary["max"])
+
+    def test_stages_of_a_run(self):
+        # Given
+        _PlanqkClient.set_transport(MiddlewareEmulator(seed=42).transport())
+        backend = PlanqkQuantumProvider(access_token="test_token").get_backend("qryd.sim.square")
+        circuit = QuantumCircuit(2, 2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.measure([0, 1], [0, 1])
+
+        # When
+        with profile() as sink:
+            backend.run(circuit, shots=10).result()
+
+        # Then
+        paths = [recorded_span.path for recorded_span in sink.spans]
+        for path in ["run/convert_to_job_input", "run/convert_to_job_params", "run/submit_job/encode_payload",
+                     "run/submit_job/http_request", "run/submit_job/decode_response", "run/submit_job/parse_dto",
+                     "result/refresh_job/http_request", "result/build_result"]:
+            self.assertIn(path, paths)
+        request_span = next(recorded_span for recorded_span in sink.spans
+                            if recorded_span.path == "run/submit_job/http_request")
+        self.assertEqual("POST", request_span.attributes["method"])
+        self.assertEqual(201, request_span.attributes["status_code"])
+        self.assertGreater(request_span.attributes["bytes_sent"], 0)
@@ -0,0 +1,138 @@
+import unittest
+import urllib.request
+
+from qiskit import QuantumCircuit
+
+from planqk.qiskit import PlanqkQuantumProvider, metrics
+from planqk.qiskit.emulator import MiddlewareEmulator
+from planqk.qiskit.metrics import MetricsRegistry, endpoint_of, start_metrics_server
+from tests.unit.planqk.fixtures import FakeClock, EmulatorTestCase
+
+
+class MetricsRegistryTestSuite(unittest.TestCase):
+
+    def test_prometheus_text_format(self):
+        # Given
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Requests", ("endpoint",))
+        durations = registry.histogram("duration_seconds", "Durations", buckets=(0.1, 1.0))
+        requests.inc(endpoint='/jobs/{id}')
+        requests.inc(2, endpoint='/jobs/{id}')
+        durations.observe(0.05)
+        durations.observe(0.5)
+
+        # When
+        text = registry.to_prometheus_text()
+
+        # Then
+        self.assertEqual("# HELP requests_total Requests\n"
+                         "# TYPE requests_total counter\n"
+                         'requests_total{endpoint="/jobs/{id}"} 3\n'
+                         "# HELP duration_seconds Durations\n"
+                         "# TYPE duration_seconds histogram\n"
+                         'duration_seconds_bucket{le="0.1"} 1\n'
+                         'duration_seconds_bucket{le="1"} 2\n'
+                         'duration_seconds_bucket{le="+Inf"} 2\n'
+                         "duration_seconds_sum 0.55\n"
+                         "duration_seconds_count 2\n", text)
+
+    def test_labels_are_validated(self):
+        # Given
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Requests", ("endpoint",))
+
+        # When / Then
+        with self.assertRaises(ValueError):
+            counter.inc(status=200)
+        with self.assertRaises(ValueError):
+            registry.gauge("requests_total", "Requests", ("endpoint",))
+        self.assertIs(counter, registry.counter("requests_total", "Requests", ("endpoint",)))
+
+    def test_endpoint_of(self):
+        self.assertEqual("/jobs", endpoint_of("https://platform.planqk.de/qiskit/jobs"))
+        self.assertEqual("/jobs/{id}/result", endpoint_of("https://platform.planqk.de/qiskit/jobs/123/result"))
+        self.assertEqual("/backends/{id}/status", endpoint_of("http://localhost/backends/aws.sim.sv1/status"))
+        self.assertEqual("other", endpoint_of("http://localhost/health"))
+
+
+class MetricsTestSuite(EmulatorTestCase):
+
+    def setUp(self):
+        metrics.REGISTRY.clear()
+        super().setUp()
+        self.backend = PlanqkQuantumProvider(access_token="test_token").get_backend("aws.sim.sv1")
+        self.circuit = QuantumCircuit(1, 1)
+        self.circuit.h(0)
+        self.circuit.measure(0, 0)
+
+    def create_emulator(self) -> MiddlewareEmulator:
+        self.clock = FakeClock()
+        return MiddlewareEmulator(seed=42, clock=self.clock, execution_time=10)
+
+    def tearDown(self):
+        metrics.set_enabled(True)
+        metrics.REGISTRY.clear()
+
+    def test_job_lifecycle_is_recorded(self):
+        # Given
+        job = self.backend.run(self.circuit, shots=10)
+        job.status()
+        self.clock.now += 10
+
+        # When
+        job.result()
+        job.status()
+
+        # Then
+        self.assertEqual(1, metrics.JOBS_SUBMITTED.value(backend="aws.sim.sv1"))
+        self.assertEqual(3, metrics.JOB_STATUS_POLLS.value(backend="aws.sim.sv1"))
+        self.assertEqual(1, metrics.JOBS_FINISHED.value(backend="aws.sim.sv1", status="COMPLETED"))
+        self.assertEqual(1, metrics.JOB_EXECUTION_TIME.count(backend="aws.sim.sv1"))
+        self.assertAlmostEqual(10, metrics.JOB_EXECUTION_TIME.sum(backend="aws.sim.sv1"), places=2)
+        self.assertEqual(1, metrics.JOB_QUEUE_TIME.count(backend="aws.sim.sv1"))
+
+        self.assertEqual(1, metrics.HTTP_REQUESTS.value(method="POST", endpoint="/jobs", status=201))
+        self.assertEqual(1, metrics.HTTP_RESPONSE_SIZE.count(method="GET", endpoint="/jobs/{id}/result"))
+        self.assertEqual(0, metrics.HTTP_REQUESTS_IN_FLIGHT.value())
+
+    def test_errors_are_recorded_by_endpoint(self):
+        # Given
+        self.emulator.error_rate = 1.0
+
+        # When
+        with self.assertRaises(Exception):
+            self.backend.run(self.circuit, shots=10)
+
+        # Then
+        self.assertEqual(1, metrics.HTTP_REQUESTS.value(method="POST", endpoint="/jobs", status=503))
+        self.assertEqual(0, metrics.JOBS_SUBMITTED.value(backend="aws.sim.sv1"))
+
+    def test_metrics_can_be_disabled(self):
+        # Given
+        metrics.set_enabled(False)
+
+        # When
+        self.backend.run(self.circuit, shots=10)
+
+        # Then
+        self.assertEqual(0, metrics.JOBS_SUBMITTED.value(backend="aws.sim.sv1"))
+        self.assertEqual(0, metrics.HTTP_REQUESTS.value(method="POST", endpoint="/jobs", status=201))
+
+    def test_metrics_server(self):
+        # Given
+        self.backend.run(self.circuit, shots=10)
+        server = start_metrics_server(port=0)
+
+        # When
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/metrics") as response:
+                content_type = response.headers["content-type"]
+                text = response.read().decode("utf-8")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # Then
+        self.assertEqual(metrics.PROMETHEUS_CONTENT_TYPE, content_type)
+        self.assertIn('planqk_jobs_submitted_total{backend="aws.sim.sv1"} 1', text)
+        self.assertIn('planqk_http_requests_total{method="POST",endpoint="/jobs",status="201"} 1', text)
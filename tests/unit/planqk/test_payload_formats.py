@@ -0,0 +1,152 @@
+import json
+import unittest
+
+from planqk.exceptions import PlanqkClientError
+from planqk.qiskit.client.backend_dtos import BackendDto, BackendStateInfosDto, STATUS
+from planqk.qiskit.client.client import _PlanqkClient
+from planqk.qiskit.client.compression import GZIP, decompress
+from planqk.qiskit.client.job_dtos import JobDto, RuntimeJobParamsDto, INPUT_FORMAT
+from planqk.qiskit.client.payload_formats import get_payload_format
+from planqk.qiskit.client.transport import InProcessTransport
+from tests.unit.planqk.client_mocks import rigetti_mock, oqc_lucy_mock, job_mock, job_result_mock
+from tests.unit.planqk.fixtures import PlanqkClientTestCase
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+FORMATS = ["json"] + (["msgpack"] if msgpack else []) + (["cbor"] if cbor2 else [])
+
+DTOS = [
+    BackendDto(**rigetti_mock),
+    BackendDto(**oqc_lucy_mock),
+    BackendStateInfosDto(status=STATUS.ONLINE, queue_avg_time=10, queue_size=3, provider_token_valid=True),
+    JobDto(**job_mock),
+    JobDto(provider="QRYD", input={"ClassicalRegister": {"operations": [{"RotateX": {"qubit": 0, "theta": 0.5}}]}},
+           input_format=INPUT_FORMAT.QOQO),
+    RuntimeJobParamsDto(program_id="sampler", hgp="ibm-q/open/main", max_execution_time=300),
+]
+
+
+class PayloadFormatsTestSuite(PlanqkClientTestCase):
+
+    def tearDown(self):
+        _PlanqkClient.set_payload_format(None)
+        _PlanqkClient.set_request_compression(None)
+
+    def test_dtos_round_trip(self):
+        for format_name in FORMATS:
+            payload_format = get_payload_format(format_name)
+            for dto in DTOS:
+                with self.subTest(format=format_name, dto=dto.__class__.__name__):
+                    decoded = payload_format.decode(payload_format.encode(dto.model_dump(exclude_none=True)))
+                    self.assertEqual(dto, dto.__class__(**decoded))
+
+    @unittest.skipIf(msgpack is None, "msgpack is not installed")
+    def test_submit_job_and_get_result_with_msgpack(self):
+        # Given
+        received = []
+
+        def handler(method, url, params, headers, body):
+            received.append(headers)
+            if method == "POST":
+                job = msgpack.unpackb(body)
+                return 201, {"content-type": "application/msgpack"}, msgpack.packb({"id": "123", **job})
+            return 200, {"content-type": "application/msgpack"}, msgpack.packb(job_result_mock)
+
+        _PlanqkClient.set_transport(InProcessTransport(handler))
+        _PlanqkClient.set_payload_format("msgpack")
+        job_input = {"operations": [{"RotateX": {"qubit": 0, "theta": 0.5}}]}
+
+        # When
+        job = _PlanqkClient.submit_job(JobDto(provider="QRYD", input=job_input, input_format=INPUT_FORMAT.QOQO))
+        result = _PlanqkClient.get_job_result(job.id)
+
+        # Then
+        self.assertEqual("123", job.id)
+        self.assertEqual(job_input, job.input)
+        self.assertEqual(job_result_mock, result)
+        self.assertEqual("application/msgpack", received[0]["content-type"])
+        self.assertTrue(received[1]["accept"].startswith("application/msgpack"))
+
+    @unittest.skipIf(msgpack is None, "msgpack is not installed")
+    def test_fallback_to_json(self):
+        # Given
+        received_content_types = []
+
+        def handler(method, url, params, headers, body):
+            received_content_types.append(headers["content-type"])
+            if headers["content-type"] != "application/json":
+                return 415, {}, b""
+            return 201, {"content-type": "application/json"}, json.dumps({"id": "123", **json.loads(body)}).encode()
+
+        _PlanqkClient.set_transport(InProcessTransport(handler))
+        _PlanqkClient.set_payload_format("msgpack")
+
+        # When
+        job = _PlanqkClient.submit_job(JobDto(provider="QRYD", input={"operations": []}))
+
+        # Then
+        self.assertEqual("123", job.id)
+        self.assertEqual(["application/msgpack", "application/json"], received_content_types)
+        self.assertEqual("msgpack", _PlanqkClient._payload_format.name)
+
+    @unittest.skipIf(msgpack is None, "msgpack is not installed")
+    def test_fallback_to_json_keeps_compression(self):
+        # Given
+        received = []
+
+        def handler(method, url, params, headers, body):
+            received.append((headers["content-type"], headers.get("content-encoding")))
+            if headers["content-type"] != "application/json":
+                return 415, {}, b""
+            job = json.loads(decompress(body, headers.get("content-encoding")))
+            return 201, {"content-type": "application/json"}, json.dumps({"id": "123", **job}).encode()
+
+        _PlanqkClient.set_transport(InProcessTransport(handler))
+        _PlanqkClient.set_payload_format("msgpack")
+        _PlanqkClient.set_request_compression(GZIP, min_size=0)
+
+        # When
+        _PlanqkClient.submit_job(JobDto(provider="QRYD", input={"operations": []}))
+        _PlanqkClient.submit_job(JobDto(provider="QRYD", input={"operations": []}))
+
+        # Then
+        self.assertEqual([("application/msgpack", GZIP), ("application/json", GZIP)] * 2, received)
+        self.assertEqual("msgpack", _PlanqkClient._payload_format.name)
+        self.assertTrue(_PlanqkClient._request_compression.enabled)
+
+    def test_error_message_of_binary_error_response(self):
+        for format_name in FORMATS:
+            with self.subTest(format=format_name):
+                # Given
+                payload_format = get_payload_format(format_name)
+                error = {"status": 404, "error_message": "The job with id 123 could not be found"}
+                _PlanqkClient.set_transport(InProcessTransport(
+                    lambda *args: (404, {"content-type": payload_format.content_type}, payload_format.encode(error))))
+                _PlanqkClient.set_payload_format(format_name)
+
+                # When
+                with self.assertRaises(PlanqkClientError) as context:
+                    _PlanqkClient.get_job("123")
+
+                # Then
+                self.assertEqual("The job with id 123 could not be found (HTTP error: 404)", str(context.exception))
+
+    def test_error_message_of_undecodable_error_response(self):
+        # Given
+        _PlanqkClient.set_transport(InProcessTransport(
+            lambda *args: (502, {"content-type": "text/html"}, b"<html>Bad Gateway</html>")))
+
+        # When
+        with self.assertRaises(PlanqkClientError) as context:
+            _PlanqkClient.get_job("123")
+
+        # Then
+        self.assertEqual("HTTP error code: 502: <html>Bad Gateway</html>", str(context.exception))
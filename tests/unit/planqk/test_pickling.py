@@ -0,0 +1,103 @@
+import multiprocessing
+import os
+import pickle
+from unittest.mock import patch
+
+from qiskit import QuantumCircuit
+
+from planqk.qiskit import PlanqkQuantumProvider
+from planqk.qiskit.emulator import EmulatorServer
+from tests.unit.planqk.fixtures import EmulatorTestCase
+
+
+def _bell_circuit() -> QuantumCircuit:
+    circuit = QuantumCircuit(2, 2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.measure([0, 1], [0, 1])
+    return circuit
+
+
+def _run_pickled_backend(data: bytes) -> dict:
+    # Runs in a spawned process, i.e., with a client that was neither configured nor used before
+    backend = pickle.loads(data)
+    return backend.run(_bell_circuit(), shots=20).result().get_counts()
+
+
+class PicklingTestSuite(EmulatorTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.provider = PlanqkQuantumProvider(access_token="test_token")
+
+    def test_backend_pickling(self):
+        for backend_id in ["aws.sim.sv1", "azure.ionq.simulator", "qryd.sim.square", "ibm.eagle"]:
+            with self.subTest(backend_id=backend_id):
+                # Given
+                backend = self.provider.get_backend(backend_id)
+                backend.options.update_options(custom_option=123)
+
+                # When
+                data = pickle.dumps(backend)
+                restored_backend = pickle.loads(data)
+
+                # Then
+                self.assertLess(len(data), 16 * 1024)
+                self.assertIs(type(backend), type(restored_backend))
+                self.assertEqual(backend.name, restored_backend.name)
+                self.assertEqual(backend.num_qubits, restored_backend.num_qubits)
+                self.assertEqual(set(backend.operation_names), set(restored_backend.operation_names))
+                self.assertEqual(123, restored_backend.options.custom_option)
+
+    def test_job_pickling(self):
+        # Given
+        backend = self.provider.get_backend("aws.sim.sv1")
+        circuit = _bell_circuit()
+        for _ in range(1000):
+            circuit.barrier()
+            circuit.rz(0.1, 0)
+        job = backend.run(circuit, shots=20)
+
+        # When
+        data = pickle.dumps(job)
+        restored_job = pickle.loads(data)
+
+        # Then
+        self.assertLess(len(data), 8 * 1024)
+        self.assertEqual(job.job_id(), restored_job.job_id())
+        self.assertEqual(backend.name, restored_job.backend().name)
+        self.assertEqual(20, sum(restored_job.result().get_counts().values()))
+
+    def test_warmed_up_provider_pickling(self):
+        # Given
+        self.provider.warm_up(ids=["aws.sim.sv1"])
+
+        # When
+        restored_provider = pickle.loads(pickle.dumps(self.provider))
+
+        # Then
+        self.assertEqual({}, restored_provider._backend_cache)
+
+    def test_backend_in_spawned_process(self):
+        # Given
+        received_headers = []
+        handle = self.emulator.handle
+
+        def recording_handle(method, url, params, headers, body):
+            received_headers.append({name.lower(): value for name, value in headers.items()})
+            return handle(method, url, params, headers, body)
+
+        provider = PlanqkQuantumProvider(access_token="test_token", organization_id="test_organization")
+        backend = provider.get_backend("aws.sim.sv1")
+
+        with patch.object(self.emulator, "handle", recording_handle), EmulatorServer(self.emulator) as server, \
+                patch.dict(os.environ, {"PLANQK_QUANTUM_BASE_URL": server.url,
+                                        "PLANQK_PERSONAL_ACCESS_TOKEN": "test_token"}):
+            # When
+            with multiprocessing.get_context("spawn").Pool(1) as pool:
+                counts = pool.apply(_run_pickled_backend, (pickle.dumps(backend),))
+
+        # Then
+        self.assertEqual(20, sum(counts.values()))
+        self.assertTrue(received_headers)
+        self.assertEqual({"test_organization"}, {headers.get("x-organizationid") for headers in received_headers})
@@ -1,24 +1,18 @@
-import unittest
-from unittest.mock import patch, MagicMock, Mock
+import threading
+import time
+from unittest.mock import patch, Mock
 
 from requests import HTTPError
 
 from planqk.exceptions import InvalidAccessTokenError, PlanqkClientError
 from planqk.qiskit.client.backend_dtos import BackendDto, PROVIDER
-from planqk.qiskit.client.client import _PlanqkClient, HEADER_CLOUD_TRACE_CTX
+from planqk.qiskit.client.client import _PlanqkClient
 from planqk.qiskit.client.job_dtos import JobDto
 from tests.unit.planqk.client_mocks import rigetti_mock, oqc_lucy_mock, job_mock, job_result_mock
+from tests.unit.planqk.fixtures import PlanqkClientTestCase
 
 
-class PlanqkClientTestSuite(unittest.TestCase):
-
-    @classmethod
-    def setUpClass(cls):
-        cls._original_get_default_headers = _PlanqkClient._get_default_headers
-
-        # Override _get_default_headers to always return a specific token
-        _PlanqkClient._get_default_headers = MagicMock(
-            return_value={"x-auth-token": "test_token", HEADER_CLOUD_TRACE_CTX: "test_trace"})
+class PlanqkClientTestSuite(PlanqkClientTestCase):
 
     @patch("requests.get")
     def test_get_backends(self, mock_get):
@@ -150,6 +144,112 @@ class PlanqkClientTestSuite(unittest.TestCase):
         self.assertEqual(str(error_response.exception),
                          "The backend with id 123 could not be found (HTTP error: 404)")
 
+    @patch("requests.get")
+    def test_concurrent_get_job_requests_are_coalesced(self, mock_get):
+        # Given
+        request_started = threading.Event()
+        release_request = threading.Event()
+
+        def slow_get(*args, **kwargs):
+            request_started.set()
+            release_request.wait(5)
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = job_mock
+            return response
+
+        mock_get.side_effect = slow_get
+        results = []
+
+        def get_job():
+            results.append(_PlanqkClient.get_job("123"))
+
+        # When
+        threads = [threading.Thread(target=get_job) for _ in range(8)]
+        threads[0].start()
+        request_started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.1)
+        release_request.set()
+        for thread in threads:
+            thread.join(5)
+
+        # Then
+        self.assertEqual(1, mock_get.call_count)
+        self.assertEqual(8, len(results))
+        self.assertTrue(all(job.id == job_mock["id"] for job in results))
+        self.assertEqual(8, len({id(job) for job in results}))
+
+    @patch("requests.get")
+    def test_coalescing_window_shares_recent_result(self, mock_get):
+        # Given
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = rigetti_mock
+        _PlanqkClient.set_coalescing_window(60)
+
+        try:
+            # When
+            first = _PlanqkClient.get_backend(rigetti_mock["id"])
+            second = _PlanqkClient.get_backend(rigetti_mock["id"])
+        finally:
+            _PlanqkClient.set_coalescing_window(0)
+        third = _PlanqkClient.get_backend(rigetti_mock["id"])
+
+        # Then
+        self.assertEqual(2, mock_get.call_count)
+        self.assertEqual(first, second)
+        self.assertEqual(first, third)
+
+    @patch("requests.get")
+    def test_shared_results_are_deep_copies(self, mock_get):
+        # Given
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = rigetti_mock
+        _PlanqkClient.set_coalescing_window(60)
+
+        try:
+            first = _PlanqkClient.get_backend(rigetti_mock["id"])
+            second = _PlanqkClient.get_backend(rigetti_mock["id"])
+
+            # When
+            first.configuration.qubits.pop()
+            second.configuration.gates.pop()
+            second.documentation.description = "Modified"
+            third = _PlanqkClient.get_backend(rigetti_mock["id"])
+        finally:
+            _PlanqkClient.set_coalescing_window(0)
+
+        # Then
+        self.assertEqual(1, mock_get.call_count)
+        self.assert_backend(rigetti_mock, third)
+        self.assertEqual(len(rigetti_mock["configuration"]["qubits"]), len(third.configuration.qubits))
+        self.assertEqual(len(rigetti_mock["configuration"]["gates"]), len(third.configuration.gates))
+        self.assertEqual(rigetti_mock["documentation"]["description"], third.documentation.description)
+
+    @patch("requests.get")
+    def test_results_are_not_shared_across_identities(self, mock_get):
+        # Given
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = rigetti_mock
+        default_headers = _PlanqkClient._get_default_headers.return_value
+        _PlanqkClient.set_coalescing_window(60)
+
+        try:
+            # When
+            _PlanqkClient.get_backend(rigetti_mock["id"])
+            _PlanqkClient._get_default_headers.return_value = {**default_headers, "x-organizationid": "org"}
+            _PlanqkClient.get_backend(rigetti_mock["id"])
+            _PlanqkClient._get_default_headers.return_value = {**default_headers, "x-auth-token": "other_token"}
+            _PlanqkClient.get_backend(rigetti_mock["id"])
+            _PlanqkClient.get_backend(rigetti_mock["id"])
+        finally:
+            _PlanqkClient._get_default_headers.return_value = default_headers
+            _PlanqkClient.set_coalescing_window(0)
+
+        # Then
+        self.assertEqual(3, mock_get.call_count)
+
     def assert_backend(self, expected: dict, actual: BackendDto):
         # main attributes
         self.assertEqual(expected["id"], actual.id)
@@ -0,0 +1,76 @@
+
+from qiskit.providers import QiskitBackendNotFoundError
+
+from planqk.qiskit import PlanqkQuantumProvider
+from planqk.qiskit.providers.aws.aws_backend import PlanqkAwsBackend
+from tests.unit.planqk.fixtures import EmulatorTestCase
+
+
+class ProviderWarmUpTestSuite(EmulatorTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.provider = PlanqkQuantumProvider(access_token="test_token")
+
+    def test_warm_up_all_backends(self):
+        # When
+        backends = self.provider.warm_up(concurrency=4)
+
+        # Then
+        self.assertEqual(1, self.emulator.request_counts[("GET", "backends")])
+        self.assertEqual(0, self.emulator.request_counts[("GET", "backend")])
+        self.assertEqual(len(backends), self.emulator.request_counts[("GET", "backend_status")])
+        self.assertEqual(set(self.provider.backends()), set(backends))
+        self.assertIsInstance(backends["aws.sim.sv1"], PlanqkAwsBackend)
+        for backend in backends.values():
+            self.assertIsNotNone(backend._target)
+            self.assertIsNotNone(backend._configuration)
+
+    def test_get_backend_returns_warmed_up_backend(self):
+        # Given
+        backends = self.provider.warm_up(ids=["aws.sim.sv1", "qryd.sim.square"])
+        request_count = sum(self.emulator.request_counts.values())
+
+        # When
+        backend = self.provider.get_backend("aws.sim.sv1")
+
+        # Then
+        self.assertIs(backends["aws.sim.sv1"], backend)
+        self.assertEqual(request_count, sum(self.emulator.request_counts.values()))
+        self.assertEqual(2, self.emulator.request_counts[("GET", "backend")])
+        with self.assertRaises(QiskitBackendNotFoundError):
+            self.provider.get_backend("aws.sim.sv1", provider="QRYD")
+
+    def test_warm_up_unknown_backend(self):
+        with self.assertRaises(QiskitBackendNotFoundError):
+            self.provider.warm_up(ids=["aws.sim.sv1", "unknown"])
+
+    def test_get_backend_revalidates_expired_backend(self):
+        # Given
+        backends = self.provider.warm_up(ids=["aws.sim.sv1", "aws.rigetti.ankaa"], ttl=0)
+        self.emulator.add_backend({**self.emulator._backends["aws.sim.sv1"], "status": "OFFLINE"})
+        self.emulator.add_backend({**self.emulator._backends["aws.rigetti.ankaa"], "updated_at": "2024-06-01"})
+
+        # When
+        sv1 = self.provider.get_backend("aws.sim.sv1")
+        ankaa = self.provider.get_backend("aws.rigetti.ankaa")
+
+        # Then
+        self.assertIs(backends["aws.sim.sv1"], sv1)
+        self.assertEqual("OFFLINE", sv1.backend_info.status.value)
+        self.assertIsNot(backends["aws.rigetti.ankaa"], ankaa)
+        self.assertEqual("2024-06-01", ankaa.backend_info.updated_at.strftime("%Y-%m-%d"))
+        self.assertIsNotNone(ankaa._target)
+        self.assertIs(ankaa, self.provider._backend_cache["aws.rigetti.ankaa"][0])
+
+    def test_clear_backend_cache(self):
+        # Given
+        backends = self.provider.warm_up(ids=["aws.sim.sv1"])
+
+        # When
+        self.provider.clear_backend_cache()
+        backend = self.provider.get_backend("aws.sim.sv1")
+
+        # Then
+        self.assertIsNot(backends["aws.sim.sv1"], backend)
+        self.assertEqual({}, self.provider._backend_cache)
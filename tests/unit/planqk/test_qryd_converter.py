@@ -0,0 +1,150 @@
+import json
+import unittest
+from math import pi
+from unittest.mock import patch
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Gate
+
+from planqk.qiskit import PlanqkQuantumProvider
+from planqk.qiskit.client.client import _PlanqkClient
+from planqk.qiskit.client.serialization import dumps
+from planqk.qiskit.options import OptionsV2
+from planqk.qiskit.providers.qryd import qryd_backend, qryd_converter_utils
+from planqk.qiskit.providers.qryd.pcz_gate import PCZGate
+from planqk.qiskit.providers.qryd.qryd_converter_utils import convert_to_wire_format, register_operation_converter, \
+    stream_wire_format
+from tests.unit.planqk.fixtures import EmulatorTestCase
+
+
+def _operations(circuit: QuantumCircuit) -> list:
+    wire_format = convert_to_wire_format(circuit, OptionsV2(shots=100))
+    return wire_format["ClassicalRegister"]["measurement"]["circuits"][0]["operations"]
+
+
+def _deep_circuit(depth: int) -> QuantumCircuit:
+    circuit = QuantumCircuit(3, 3)
+    for i in range(depth):
+        circuit.rx(0.1 * (i % 7), i % 3)
+        circuit.cx(i % 3, (i + 1) % 3)
+    circuit.measure([0, 1, 2], [0, 1, 2])
+    return circuit
+
+
+class QrydConverterTestSuite(unittest.TestCase):
+
+    def test_convert_circuit(self):
+        # Given
+        circuit = QuantumCircuit(3, 2)
+        circuit.h(0)
+        circuit.rx(0.5, 1)
+        circuit.r(0.1, 0.2, 2)
+        circuit.barrier()
+        circuit.cx(0, 2)
+        circuit.append(PCZGate(), [1, 2])
+        circuit.u(0.1, 0.2, 0.3, 1)
+        circuit.measure([2, 0], [0, 1])
+
+        # When
+        operations = _operations(circuit)
+
+        # Then
+        self.assertEqual([
+            {"Hadamard": {"qubit": 0}},
+            {"RotateX": {"qubit": 1, "theta": 0.5}},
+            {"RotateXY": {"qubit": 2, "theta": 0.1, "phi": 0.2}},
+            {"CNOT": {"control": 0, "target": 2}},
+            {"PhaseShiftedControlledZ": {"control": 1, "target": 2, "phi": float(PCZGate.get_theta())}},
+            {"RotateZ": {"qubit": 1, "theta": 0.3 - pi / 2}},
+            {"RotateX": {"qubit": 1, "theta": 0.1}},
+            {"RotateZ": {"qubit": 1, "theta": 0.2 + pi / 2}},
+            {"MeasureQubit": {"readout": "ro", "qubit": 2, "readout_index": 0}},
+            {"MeasureQubit": {"readout": "ro", "qubit": 0, "readout_index": 1}},
+            {"PragmaSetNumberOfMeasurements": {"readout": "ro", "number_measurements": 100}},
+        ], operations)
+
+    def test_unsupported_operation(self):
+        # Given
+        circuit = QuantumCircuit(3)
+        circuit.ccx(0, 1, 2)
+
+        # Then
+        with self.assertRaises(RuntimeError):
+            _operations(circuit)
+
+    def test_register_operation_converter(self):
+        # Given
+        circuit = QuantumCircuit(2)
+        circuit.append(Gate("custom", 2, [0.5]), [1, 0])
+
+        def convert(operations, qubits, params):
+            operations.append({"ControlledPhaseShift": {"control": qubits[0], "target": qubits[1],
+                                                        "theta": 2 * float(params[0])}})
+
+        # When
+        register_operation_converter("custom", 2, 1, convert)
+        try:
+            operations = _operations(circuit)
+        finally:
+            del qryd_converter_utils._CONVERTERS["custom"]
+
+        # Then
+        self.assertEqual({"ControlledPhaseShift": {"control": 1, "target": 0, "theta": 1.0}}, operations[0])
+
+        # When
+        register_operation_converter("custom", 1, 1, convert)
+        try:
+            # Then
+            with self.assertRaises(AssertionError):
+                _operations(circuit)
+        finally:
+            del qryd_converter_utils._CONVERTERS["custom"]
+
+    def test_stream_wire_format(self):
+        # Given
+        options = OptionsV2(shots=100)
+
+        for depth in [0, 1, 5000]:
+            circuit = _deep_circuit(depth)
+
+            # When
+            streamed = stream_wire_format(circuit, options)
+
+            # Then
+            self.assertEqual(dumps(convert_to_wire_format(circuit, options)), streamed.to_bytes())
+
+    def test_stream_unsupported_operation(self):
+        # Given
+        circuit = _deep_circuit(10)
+        circuit.ccx(0, 1, 2)
+
+        # Then
+        with self.assertRaises(RuntimeError):
+            stream_wire_format(circuit, OptionsV2(shots=100))
+
+
+class QrydBackendStreamingTestSuite(EmulatorTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.backend = PlanqkQuantumProvider(access_token="test_token").get_backend("qryd.sim.square")
+
+    def tearDown(self):
+        _PlanqkClient.set_request_compression(None)
+
+    def test_run_streams_large_circuit(self):
+        # Given
+        circuit = _deep_circuit(600)
+
+        for encoding in [None, "gzip"]:
+            _PlanqkClient.set_request_compression(encoding)
+
+            # When
+            with patch.object(qryd_backend, "STREAMING_MIN_INSTRUCTIONS", 1000):
+                job = self.backend.run(circuit, shots=100)
+
+            # Then
+            submitted_input = self.emulator._jobs[job.id]["input"]
+            expected_input = json.loads(dumps(convert_to_wire_format(circuit, OptionsV2(shots=100))))
+            self.assertEqual(expected_input, submitted_input)
+            self.assertEqual(100, sum(job.result().get_counts().values()))
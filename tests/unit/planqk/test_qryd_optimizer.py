@@ -0,0 +1,214 @@
+import random
+import unittest
+from math import pi
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.quantum_info import Operator
+
+from planqk.qiskit import PlanqkQuantumProvider
+from planqk.qiskit.options import OptionsV2
+from planqk.qiskit.providers.qryd.pcp_gate import PCPGate
+from planqk.qiskit.providers.qryd.pcz_gate import PCZGate
+from planqk.qiskit.providers.qryd.qryd_converter_utils import convert_to_wire_format
+from planqk.qiskit.providers.qryd.qryd_optimizer import optimize_circuit
+from tests.unit.planqk.fixtures import EmulatorTestCase
+
+_SINGLE_QUBIT_GATES = ["h", "x", "y", "z", "sx", "sxdg"]
+_ROTATION_GATES = ["p", "rx", "ry", "rz"]
+_TWO_QUBIT_GATES = ["cx", "cy", "cz", "swap", "iswap"]
+
+
+def _random_qryd_circuit(seed: int, num_qubits: int = 3, size: int = 30) -> QuantumCircuit:
+    """Returns a random circuit of QRyd gates whose angles are likely to cancel out or match the PCZ phase shift."""
+    rng = random.Random(seed)
+
+    def angle():
+        return rng.choice([0, pi / 2, pi, -PCZGate.get_theta(), PCZGate.get_theta(), rng.uniform(-3, 3)])
+
+    circuit = QuantumCircuit(num_qubits)
+    for _ in range(size):
+        gate = rng.choice(_SINGLE_QUBIT_GATES + _ROTATION_GATES + _TWO_QUBIT_GATES + ["r", "u", "cp", "pcz", "pcp"])
+        qubits = rng.sample(range(num_qubits), 2)
+        if gate in _SINGLE_QUBIT_GATES:
+            getattr(circuit, gate)(qubits[0])
+        elif gate in _ROTATION_GATES:
+            getattr(circuit, gate)(angle(), qubits[0])
+        elif gate in _TWO_QUBIT_GATES:
+            getattr(circuit, gate)(*qubits)
+        elif gate == "r":
+            circuit.r(angle(), angle(), qubits[0])
+        elif gate == "u":
+            circuit.u(angle(), angle(), angle(), qubits[0])
+        elif gate == "cp":
+            circuit.cp(angle(), *qubits)
+        elif gate == "pcz":
+            circuit.append(PCZGate(), qubits)
+        else:
+            circuit.append(PCPGate(rng.uniform(0, 3)), qubits)
+    return circuit
+
+
+def _num_operations(circuit: QuantumCircuit) -> int:
+    wire_format = convert_to_wire_format(circuit, OptionsV2(shots=100))
+    return len(wire_format["ClassicalRegister"]["measurement"]["circuits"][0]["operations"])
+
+
+class QrydOptimizerTestSuite(unittest.TestCase):
+
+    def assertOptimized(self, circuit: QuantumCircuit, num_operations: int = None) -> QuantumCircuit:
+        optimized = optimize_circuit(circuit)
+        self.assertEqual(Operator(circuit), Operator(optimized))
+        self.assertLessEqual(_num_operations(optimized), _num_operations(circuit))
+        if num_operations is not None:
+            # The operations include the PragmaSetNumberOfMeasurements
+            self.assertEqual(num_operations + 1, _num_operations(optimized))
+        return optimized
+
+    def test_random_circuits_are_equivalent(self):
+        num_operations = 0
+        num_optimized_operations = 0
+        for seed in range(100):
+            with self.subTest(seed=seed):
+                # Given
+                circuit = _random_qryd_circuit(seed)
+
+                # When
+                optimized = self.assertOptimized(circuit)
+
+                # Then
+                num_operations += _num_operations(circuit)
+                num_optimized_operations += _num_operations(optimized)
+        self.assertLess(num_optimized_operations, 0.9 * num_operations)
+
+    def test_merge_rotations(self):
+        # Given
+        circuit = QuantumCircuit(2)
+        circuit.rx(0.1, 0)
+        circuit.rx(0.2, 0)
+        circuit.rz(0.3, 1)
+        circuit.p(-0.3, 1)
+
+        # Then
+        optimized = self.assertOptimized(circuit, num_operations=1)
+        self.assertEqual(["r"], [instruction.operation.name for instruction in optimized.data])
+
+    def test_fold_u_gates(self):
+        # Given
+        circuit = QuantumCircuit(1)
+        circuit.u(0.1, 0.2, 0.3, 0)
+        circuit.u(0.4, 0.5, 0.6, 0)
+
+        # Then
+        self.assertOptimized(circuit, num_operations=2)
+
+    def test_cancel_inverse_pairs(self):
+        # Given
+        circuit = QuantumCircuit(2)
+        circuit.h(1)
+        circuit.cx(0, 1)
+        circuit.cx(0, 1)
+        circuit.h(1)
+        circuit.swap(0, 1)
+        circuit.swap(1, 0)
+        circuit.cp(0.5, 0, 1)
+        circuit.cp(-0.5, 1, 0)
+
+        # Then
+        self.assertOptimized(circuit, num_operations=0)
+
+    def test_keep_gates_not_emitting_fewer_operations(self):
+        # Given
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.cx(1, 0)
+        circuit.ry(0.5, 1)
+
+        # When
+        optimized = optimize_circuit(circuit)
+
+        # Then
+        self.assertEqual(circuit, optimized)
+
+    def test_fuse_pcz_and_phase_gates(self):
+        # Given
+        theta = PCZGate.get_theta()
+        circuit = QuantumCircuit(2)
+        circuit.p(theta, 0)
+        circuit.cz(0, 1)
+        circuit.p(theta, 1)
+
+        # Then
+        optimized = self.assertOptimized(circuit, num_operations=1)
+        self.assertEqual(["pcz"], [instruction.operation.name for instruction in optimized.data])
+
+        # Given
+        circuit = QuantumCircuit(2)
+        circuit.append(PCZGate(), [0, 1])
+        circuit.rz(-theta, 0)
+        circuit.p(-theta, 1)
+
+        # Then
+        optimized = self.assertOptimized(circuit, num_operations=1)
+        self.assertEqual(["cz"], [instruction.operation.name for instruction in optimized.data])
+
+    def test_fuse_pcp_and_phase_gates(self):
+        # Given
+        theta = PCPGate.get_theta(1.0)
+        circuit = QuantumCircuit(2)
+        circuit.cp(1.0, 0, 1)
+        circuit.p(theta, 0)
+        circuit.p(theta, 1)
+
+        # Then
+        optimized = self.assertOptimized(circuit, num_operations=1)
+        self.assertEqual(["pcp"], [instruction.operation.name for instruction in optimized.data])
+
+    def test_keep_fixed_instructions(self):
+        # Given
+        theta = Parameter("theta")
+        circuit = QuantumCircuit(2, 2)
+        circuit.rx(0.1, 0)
+        circuit.barrier()
+        circuit.rx(0.2, 0)
+        circuit.rx(theta, 0)
+        circuit.rx(0.3, 0)
+        circuit.cx(0, 1)
+        circuit.cx(0, 1).c_if(0, 1)
+        circuit.measure([0, 1], [0, 1])
+
+        # When
+        optimized = optimize_circuit(circuit)
+
+        # Then
+        self.assertEqual(circuit, optimized)
+
+
+class QrydBackendOptimizationTestSuite(EmulatorTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.backend = PlanqkQuantumProvider(access_token="test_token").get_backend("qryd.sim.square")
+
+    def test_run_with_peephole_optimization(self):
+        # Given
+        circuit = QuantumCircuit(2, 2)
+        circuit.u(0.1, 0.2, 0.3, 0)
+        circuit.u(0.4, 0.5, 0.6, 0)
+        circuit.cx(0, 1)
+        circuit.cx(0, 1)
+        circuit.measure([0, 1], [0, 1])
+
+        # When
+        job = self.backend.run(circuit, shots=100)
+        optimized_job = self.backend.run(circuit, shots=100, peephole_optimization=True)
+
+        # Then
+        def operations(submitted_job):
+            wire_format = self.emulator._jobs[submitted_job.id]["input"]
+            return wire_format["ClassicalRegister"]["measurement"]["circuits"][0]["operations"]
+
+        self.assertEqual(11, len(operations(job)))
+        self.assertEqual(5, len(operations(optimized_job)))
+        self.assertEqual(100, sum(optimized_job.result().get_counts().values()))
@@ -0,0 +1,82 @@
+import json
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from planqk.qiskit.client import serialization
+from planqk.qiskit.client.job_dtos import JobDto, INPUT_FORMAT
+from planqk.qiskit.client.serialization import serialize_job, PreEncodedJson, StreamedJson, dumps
+
+
+class SerializationTestSuite(unittest.TestCase):
+
+    def test_serialize_job_excludes_none_values(self):
+        job = JobDto(provider="QRYD", backend_id="qryd.sim", input_format=INPUT_FORMAT.QOQO,
+                     input={"operations": [{"RotateX": {"qubit": 0, "theta": 1.0}}]},
+                     input_params={"seed_simulator": None, "fusion_max_qubits": 4})
+
+        job_dict = json.loads(serialize_job(job))
+
+        self.assertEqual({"provider", "shots", "backend_id", "input", "input_format", "input_params"},
+                         set(job_dict.keys()))
+        self.assertEqual("QOQO", job_dict["input_format"])
+        self.assertEqual({"fusion_max_qubits": 4}, job_dict["input_params"])
+        self.assertEqual(job.input, job_dict["input"])
+
+    def test_serialize_job_does_not_modify_input(self):
+        job_input = {"circuits": [{"name": None, "data": "abc"}]}
+        job = JobDto(provider="IBM", input=job_input, tags={"tag"})
+
+        job_dict = json.loads(serialize_job(job))
+
+        self.assertEqual(job_input, job_dict["input"])
+        self.assertEqual(["tag"], job_dict["tags"])
+
+    def test_serialize_job_embeds_pre_encoded_input(self):
+        encoded_input = PreEncodedJson.encode({"gateset": "qis", "qubits": 2})
+        job = JobDto(provider="AZURE", backend_id="azure.ionq.simulator", input=encoded_input)
+
+        body = serialize_job(job)
+
+        self.assertIn(b'"input":' + encoded_input + b"}", body)
+        self.assertEqual({"gateset": "qis", "qubits": 2}, json.loads(body)["input"])
+        self.assertEqual("AZURE", json.loads(body)["provider"])
+
+    def test_serialize_job_streams_streamed_input(self):
+        streamed_input = StreamedJson(lambda: iter([b'{"operations":[', b'{"PauliX":{"qubit":0}}', b"]}"]))
+        job = JobDto(provider="QRYD", backend_id="qryd.sim", input=streamed_input)
+
+        body = serialize_job(job)
+
+        self.assertIsInstance(body, StreamedJson)
+        self.assertEqual(body.to_bytes(), body.to_bytes())
+        self.assertEqual({"operations": [{"PauliX": {"qubit": 0}}]}, json.loads(body.to_bytes())["input"])
+        self.assertEqual("qryd.sim", json.loads(body.to_bytes())["backend_id"])
+
+    def test_serialize_job_with_string_input(self):
+        job = JobDto(provider="AWS", input='OPENQASM 3.0;\nh q[0];')
+
+        job_dict = json.loads(serialize_job(job))
+
+        self.assertEqual('OPENQASM 3.0;\nh q[0];', job_dict["input"])
+
+    def test_dumps_non_string_keys(self):
+        self.assertEqual({"1": 2}, json.loads(dumps({1: 2})))
+
+    def test_dumps_rejects_non_finite_floats(self):
+        encoders = ["orjson", "json"] if serialization.orjson is not None else ["json"]
+        for encoder in encoders:
+            with patch.object(serialization, "orjson", serialization.orjson if encoder == "orjson" else None):
+                for value in [float("nan"), float("inf"), -float("inf")]:
+                    with self.subTest(encoder=encoder, value=value), self.assertRaises(ValueError):
+                        dumps({"input_params": {"theta": [0.5, value]}, "shots": None})
+                with self.subTest(encoder=encoder):
+                    self.assertEqual({"theta": [0.5, None]}, json.loads(dumps({"theta": [0.5, None]})))
+
+    def test_dumps_rejects_non_finite_numpy_values(self):
+        if serialization.orjson is None:
+            self.skipTest("orjson is not installed")
+        with self.assertRaises(ValueError):
+            dumps({"theta": np.array([0.5, np.nan]), "phi": None})
+        self.assertEqual({"theta": [0.5], "phi": None}, json.loads(dumps({"theta": np.array([0.5]), "phi": None})))
@@ -0,0 +1,122 @@
+import gc
+import unittest
+
+from qiskit import QuantumCircuit
+
+from planqk.qiskit import PlanqkQuantumProvider
+from planqk.qiskit.client.client import _PlanqkClient, HEADER_CLOUD_TRACE_CTX
+from planqk.qiskit.client.transport import InProcessTransport
+from planqk.qiskit.emulator import MiddlewareEmulator
+from planqk.qiskit.tracing import enable_tracing, disable_tracing
+from tests.unit.planqk.fixtures import FakeClock, EmulatorTestCase
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+except ImportError:
+    TracerProvider = None
+
+
+@unittest.skipIf(TracerProvider is None, "opentelemetry-sdk is not installed")
+class TracingTestSuite(EmulatorTestCase):
+
+    def setUp(self):
+        self.exporter = InMemorySpanExporter()
+        self.tracer_provider = TracerProvider()
+        self.tracer_provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+        self.tracer = self.tracer_provider.get_tracer("test")
+        enable_tracing(self.tracer_provider)
+
+        super().setUp()
+        self.received_headers = []
+
+        def handler(method, url, params, headers, body):
+            self.received_headers.append(headers)
+            return self.emulator.handle(method, url, params, headers, body)
+
+        _PlanqkClient.set_transport(InProcessTransport(handler))
+        self.backend = PlanqkQuantumProvider(access_token="test_token").get_backend("aws.sim.sv1")
+        self.circuit = QuantumCircuit(1, 1)
+        self.circuit.h(0)
+        self.circuit.measure(0, 0)
+        self.exporter.clear()
+
+    def create_emulator(self) -> MiddlewareEmulator:
+        self.clock = FakeClock()
+        return MiddlewareEmulator(seed=42, clock=self.clock, execution_time=10)
+
+    def tearDown(self):
+        disable_tracing()
+
+    def test_trace_context_is_propagated(self):
+        # When
+        with self.tracer.start_as_current_span("iteration") as iteration_span:
+            self.backend.run(self.circuit, shots=10)
+
+        # Then
+        trace_id = iteration_span.get_span_context().trace_id
+        submit_headers = self.received_headers[-1]
+        self.assertTrue(submit_headers[HEADER_CLOUD_TRACE_CTX].startswith(f"{trace_id:032x}/"))
+        self.assertTrue(submit_headers[HEADER_CLOUD_TRACE_CTX].endswith(";o=1"))
+        self.assertIn(f"{trace_id:032x}", submit_headers["traceparent"])
+
+        spans = self.exporter.get_finished_spans()
+        span_names = {span.name for span in spans}
+        self.assertTrue({"planqk.run", "planqk.convert_to_job_input", "planqk.submit_job",
+                         "planqk.http_request"} <= span_names)
+        self.assertTrue(all(span.context.trace_id == trace_id for span in spans))
+
+    def test_job_lifecycle_events(self):
+        # Given
+        with self.tracer.start_as_current_span("iteration") as iteration_span:
+            job = self.backend.run(self.circuit, shots=10)
+            self.clock.now += 20
+
+        # When
+        job.result()
+
+        # Then
+        spans = {span.name: span for span in self.exporter.get_finished_spans()}
+        job_span = spans["planqk.job"]
+        self.assertEqual(["submitted", "running", "completed"], [event.name for event in job_span.events])
+        self.assertEqual(spans["planqk.run"].context.span_id, job_span.parent.span_id)
+        self.assertEqual(iteration_span.get_span_context().trace_id, job_span.context.trace_id)
+        self.assertEqual(job.job_id(), job_span.attributes["planqk.job.id"])
+
+    def test_job_span_ends_on_cancel(self):
+        # Given
+        job = self.backend.run(self.circuit, shots=10)
+
+        # When
+        job.cancel()
+        job.status()
+
+        # Then
+        job_span, = [span for span in self.exporter.get_finished_spans() if span.name == "planqk.job"]
+        self.assertEqual(["submitted", "running", "cancel_requested"], [event.name for event in job_span.events])
+
+    def test_job_span_ends_when_job_is_dropped(self):
+        # Given
+        job = self.backend.run(self.circuit, shots=10)
+        self.assertNotIn("planqk.job", [span.name for span in self.exporter.get_finished_spans()])
+
+        # When
+        del job
+        gc.collect()
+
+        # Then
+        job_span, = [span for span in self.exporter.get_finished_spans() if span.name == "planqk.job"]
+        self.assertEqual(["submitted", "running", "dropped"], [event.name for event in job_span.events])
+
+    def test_trace_header_is_not_changed_when_tracing_is_disabled(self):
+        # Given
+        disable_tracing()
+
+        # When
+        with self.tracer.start_as_current_span("iteration"):
+            self.backend.run(self.circuit, shots=10)
+
+        # Then
+        self.assertEqual("test_trace", self.received_headers[-1][HEADER_CLOUD_TRACE_CTX])
+        self.assertNotIn("traceparent", self.received_headers[-1])
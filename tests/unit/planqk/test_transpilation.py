@@ -0,0 +1,194 @@
+import tempfile
+from unittest.mock import patch
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.quantum_info import Operator
+
+from planqk.qiskit import PlanqkQuantumProvider, transpilation
+from planqk.qiskit.transpilation import TranspilationCache, circuit_fingerprint
+from tests.unit.planqk.fixtures import EmulatorTestCase
+
+
+def _ghz_circuit(num_qubits: int) -> QuantumCircuit:
+    circuit = QuantumCircuit(num_qubits)
+    circuit.h(0)
+    for qubit in range(1, num_qubits):
+        circuit.cx(0, qubit)
+    circuit.measure_all()
+    return circuit
+
+
+def _ansatz() -> QuantumCircuit:
+    theta = Parameter("theta")
+    circuit = QuantumCircuit(2)
+    circuit.ry(theta, 0)
+    circuit.cx(0, 1)
+    circuit.rz(2 * theta, 1)
+    return circuit
+
+
+class TranspilationCacheTestSuite(EmulatorTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.provider = PlanqkQuantumProvider(access_token="test_token")
+        self.backend = self.provider.get_backend("aws.rigetti.ankaa")
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = TranspilationCache(directory=self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_fingerprint(self):
+        # Given
+        circuit = _ghz_circuit(3)
+        other_circuit = _ghz_circuit(3)
+        other_circuit.name = "other"
+
+        # Then
+        self.assertEqual(circuit_fingerprint(circuit), circuit_fingerprint(other_circuit))
+        self.assertEqual(circuit_fingerprint(_ansatz()), circuit_fingerprint(_ansatz()))
+        self.assertNotEqual(circuit_fingerprint(circuit), circuit_fingerprint(_ghz_circuit(4)))
+        self.assertNotEqual(circuit_fingerprint(_ansatz()), circuit_fingerprint(_ansatz().assign_parameters([0.1])))
+
+        bound_circuits = [_ansatz().assign_parameters([value]) for value in [0.1, 0.2]]
+        self.assertNotEqual(circuit_fingerprint(bound_circuits[0]), circuit_fingerprint(bound_circuits[1]))
+
+    def test_circuits_are_transpiled_once(self):
+        # Given
+        circuits = [_ghz_circuit(3), _ghz_circuit(4), _ghz_circuit(3)]
+
+        # When
+        with patch.object(transpilation, "transpile", side_effect=transpilation.transpile) as transpile:
+            transpiled_circuits = self.backend.transpile_cached(circuits, cache=self.cache, seed_transpiler=42)
+            cached_circuits = self.backend.transpile_cached(circuits, cache=self.cache, seed_transpiler=42)
+
+        # Then
+        self.assertEqual(1, transpile.call_count)
+        self.assertEqual(2, len(transpile.call_args.args[0]))
+        self.assertEqual(transpiled_circuits, cached_circuits)
+        self.assertIsNot(transpiled_circuits[0], cached_circuits[0])
+        self.assertEqual(transpiled_circuits[0], transpiled_circuits[2])
+        self.assertEqual(2, len(self.cache))
+
+    def test_options_and_backend_version_are_part_of_key(self):
+        # Given
+        circuit = _ghz_circuit(3)
+        other_backend = self.provider.get_backend("aws.rigetti.ankaa")
+        other_backend.backend_info.updated_at = "2024-02-01"
+
+        # When
+        with patch.object(transpilation, "transpile", side_effect=transpilation.transpile) as transpile:
+            self.backend.transpile_cached(circuit, cache=self.cache, optimization_level=1)
+            self.backend.transpile_cached(circuit, cache=self.cache, optimization_level=1, num_processes=1)
+            self.backend.transpile_cached(circuit, cache=self.cache, optimization_level=2)
+            other_backend.transpile_cached(circuit, cache=self.cache, optimization_level=1)
+
+        # Then
+        self.assertEqual(3, transpile.call_count)
+
+    def test_circuits_of_backends_without_version_are_not_cached(self):
+        # Given
+        circuit = _ghz_circuit(3)
+        self.backend.backend_info.updated_at = None
+
+        # When
+        with patch.object(transpilation, "transpile", side_effect=transpilation.transpile) as transpile:
+            self.backend.transpile_cached(circuit, cache=self.cache)
+            self.backend.transpile_cached(circuit, cache=self.cache)
+
+        # Then
+        self.assertEqual(2, transpile.call_count)
+        self.assertEqual(0, len(self.cache))
+        self.assertEqual([], self.cache._disk_entries())
+
+    def test_cached_circuit_has_name_and_metadata_of_circuit(self):
+        # Given
+        circuit = _ghz_circuit(3)
+        circuit.name = "first"
+        circuit.metadata = {"experiment": 1}
+        other_circuit = _ghz_circuit(3)
+        other_circuit.name = "second"
+        other_circuit.metadata = {"experiment": 2}
+
+        # When
+        transpiled_circuit = self.backend.transpile_cached(circuit, cache=self.cache)
+        cached_circuit = self.backend.transpile_cached(other_circuit, cache=self.cache)
+
+        # Then
+        self.assertEqual(1, len(self.cache))
+        self.assertEqual(("first", {"experiment": 1}), (transpiled_circuit.name, transpiled_circuit.metadata))
+        self.assertEqual(("second", {"experiment": 2}), (cached_circuit.name, cached_circuit.metadata))
+
+    def test_circuits_are_read_from_disk(self):
+        # Given
+        circuit = _ghz_circuit(3)
+        transpiled_circuit = self.backend.transpile_cached(circuit, cache=self.cache, seed_transpiler=42)
+
+        # When
+        other_cache = TranspilationCache(directory=self.directory.name)
+        with patch.object(transpilation, "transpile") as transpile:
+            cached_circuit = self.backend.transpile_cached(circuit, cache=other_cache, seed_transpiler=42)
+
+        # Then
+        transpile.assert_not_called()
+        self.assertEqual(transpiled_circuit, cached_circuit)
+        self.assertEqual(transpiled_circuit.layout.initial_layout, cached_circuit.layout.initial_layout)
+
+    def test_cache_is_bounded(self):
+        # Given
+        cache = TranspilationCache(max_entries=2, directory=self.directory.name, max_disk_entries=3)
+
+        # When
+        self.backend.transpile_cached([_ghz_circuit(num_qubits) for num_qubits in range(2, 7)], cache=cache)
+
+        # Then
+        self.assertEqual(2, len(cache))
+        self.assertEqual(3, len(cache._disk_entries()))
+
+    def test_parameterized_circuit_is_transpiled_once(self):
+        # Given
+        values = [0.1, 0.5, 1.2]
+
+        # When
+        with patch.object(transpilation, "transpile", side_effect=transpilation.transpile) as transpile:
+            transpiled_circuits = self.backend.transpile_cached(
+                _ansatz(), cache=self.cache, parameter_binds=[{"theta": value} for value in values])
+            ansatz = _ansatz()
+            theta = ansatz.parameters[0]
+            other_circuits = self.backend.transpile_cached(
+                ansatz, cache=self.cache, parameter_binds=[{theta: value} for value in values])
+
+        # Then
+        self.assertEqual(1, transpile.call_count)
+        self.assertEqual(transpiled_circuits, other_circuits)
+        for value, transpiled_circuit in zip(values, transpiled_circuits):
+            self.assertEqual(0, len(transpiled_circuit.parameters))
+            expected = Operator(_ansatz().assign_parameters([value]))
+            self.assertTrue(_equivalent_on_logical_qubits(transpiled_circuit, expected))
+
+    def test_default_cache_directory(self):
+        # When
+        with patch.dict("os.environ", {"PLANQK_TRANSPILATION_CACHE_DIR": self.directory.name}):
+            cache_dir = transpilation.get_cache_dir()
+
+        # Then
+        self.assertEqual(self.directory.name, cache_dir)
+
+
+def _equivalent_on_logical_qubits(transpiled_circuit: QuantumCircuit, expected: Operator) -> bool:
+    """Compares the transpiled circuit with the expected operator, restricted to the used physical qubits."""
+    layout = transpiled_circuit.layout
+    physical_qubits = [layout.final_index_layout()[index] for index in range(expected.num_qubits)]
+    reduced = QuantumCircuit(len(physical_qubits))
+    mapping = {transpiled_circuit.qubits[physical]: reduced.qubits[index]
+               for index, physical in enumerate(physical_qubits)}
+    for instruction in transpiled_circuit.data:
+        if any(qubit not in mapping for qubit in instruction.qubits):
+            if instruction.operation.name in ("barrier", "delay"):
+                continue
+            return False
+        reduced.append(instruction.operation, [mapping[qubit] for qubit in instruction.qubits])
+    reduced.global_phase = transpiled_circuit.global_phase
+    return Operator(reduced).equiv(expected)
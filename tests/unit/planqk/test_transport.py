@@ -0,0 +1,100 @@
+import json
+import threading
+import unittest
+
+import requests
+
+from planqk.exceptions import PlanqkClientError
+from planqk.qiskit.client.client import _PlanqkClient
+from planqk.qiskit.client.transport import InProcessTransport, HttpxTransport
+from tests.unit.planqk.client_mocks import rigetti_mock, job_mock
+from tests.unit.planqk.fixtures import PlanqkClientTestCase
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class TransportTestSuite(PlanqkClientTestCase):
+
+    def test_in_process_transport(self):
+        # Given
+        requests = []
+
+        def handler(method, url, params, headers, body):
+            requests.append((method, url, params, headers, body))
+            if "/jobs" in url:
+                return 201, {"content-type": "application/json"}, json.dumps(job_mock | {"tags": None}).encode()
+            return 200, {"content-type": "application/json"}, json.dumps(rigetti_mock).encode()
+
+        _PlanqkClient.set_transport(InProcessTransport(handler))
+
+        # When
+        backend = _PlanqkClient.get_backend(rigetti_mock["id"])
+        job = _PlanqkClient.submit_job(_PlanqkClient.get_job("123"))
+
+        # Then
+        self.assertEqual(rigetti_mock["id"], backend.id)
+        self.assertEqual(job_mock["id"], job.id)
+        method, url, _, headers, body = requests[-1]
+        self.assertEqual("POST", method)
+        self.assertEqual("test_token", headers["x-auth-token"])
+        self.assertEqual(job_mock["backend_id"], json.loads(body)["backend_id"])
+
+    def test_perform_request_with_deprecated_request_function(self):
+        # Given
+        requests_sent = []
+
+        def handler(method, url, params, headers, body):
+            requests_sent.append((method, url))
+            return 200, {"content-type": "application/json"}, json.dumps(rigetti_mock).encode()
+
+        _PlanqkClient.set_transport(InProcessTransport(handler))
+
+        # When
+        with self.assertWarns(DeprecationWarning):
+            response = _PlanqkClient.perform_request(requests.get, "http://localhost/backends/123")
+
+        # Then
+        self.assertEqual(rigetti_mock, response)
+        self.assertEqual([("GET", "http://localhost/backends/123")], requests_sent)
+
+    def test_in_process_transport_error(self):
+        # Given
+        error = {"status": 404, "error_message": "The backend with id 123 could not be found"}
+        _PlanqkClient.set_transport(InProcessTransport(lambda *args: (404, {}, json.dumps(error).encode())))
+
+        # When
+        with self.assertRaises(PlanqkClientError) as error_response:
+            _PlanqkClient.get_backend("123")
+
+        # Then
+        self.assertEqual(404, error_response.exception.response.status_code)
+        self.assertEqual("The backend with id 123 could not be found (HTTP error: 404)",
+                         str(error_response.exception))
+
+    @unittest.skipIf(httpx is None, "httpx is not installed")
+    def test_httpx_transport_shares_client_between_threads(self):
+        # Given
+        request_count = []
+
+        def handler(request):
+            request_count.append(request.url.path)
+            return httpx.Response(200, json=job_mock | {"tags": None})
+
+        transport = HttpxTransport(client=httpx.Client(transport=httpx.MockTransport(handler)))
+        _PlanqkClient.set_transport(transport)
+
+        # When
+        jobs = []
+        threads = [threading.Thread(target=lambda i=i: jobs.append(_PlanqkClient.get_job(str(i)))) for i in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        # Then
+        self.assertEqual(10, len(request_count))
+        self.assertEqual(10, len(jobs))
+        self.assertEqual(1, len(set(transport._clients.values())))
@@ -0,0 +1,113 @@
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Gate
+
+from planqk.exceptions import CircuitValidationError
+from planqk.qiskit import PlanqkQuantumProvider
+from tests.unit.planqk.fixtures import EmulatorTestCase
+
+
+def _bell_circuit(num_qubits: int = 2) -> QuantumCircuit:
+    circuit = QuantumCircuit(num_qubits)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.measure_all()
+    return circuit
+
+
+class CircuitValidationTestSuite(EmulatorTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.provider = PlanqkQuantumProvider(access_token="test_token")
+
+    def test_all_violations_are_reported_before_submission(self):
+        # Given
+        backend = self.provider.get_backend("aws.rigetti.ankaa")
+        backend.options.update_options(disable_qubit_rewiring=True)
+        circuit = _bell_circuit(43)
+        circuit.cx(0, 41)
+        circuit.cx(0, 40)
+        circuit.cz(0, 2)
+        circuit.cz(0, 1)
+
+        # When
+        with self.assertRaises(CircuitValidationError) as context:
+            backend.run(circuit, shots=1000000)
+
+        # Then
+        self.assertEqual([
+            "1000000 shots are outside of the supported range [1, 100000]",
+            "circuit has 43 qubits, the backend supports 42",
+            "instruction cx is not supported on qubits (0, 40), (0, 41)",
+            "instruction measure is not supported on qubits (42,)",
+            "instruction cz is not supported on qubits (0, 2)",
+        ], context.exception.violations)
+        self.assertEqual({}, self.emulator._jobs)
+
+    def test_qubits_are_not_checked_if_rewired(self):
+        # Given
+        backend = self.provider.get_backend("aws.rigetti.ankaa")
+        circuit = QuantumCircuit(6)
+        circuit.cx(0, 5)
+        circuit.cz(0, 5)
+        circuit.measure_all()
+
+        # When
+        job = backend.run(circuit, shots=100)
+
+        # Then
+        self.assertEqual({"disable_qubit_rewiring": False}, self.emulator._jobs[job.id]["input_params"])
+        with self.assertRaises(CircuitValidationError) as context:
+            backend.run(circuit, shots=100, disable_qubit_rewiring=True)
+        self.assertEqual(["instruction cx is not supported on qubits (0, 5)",
+                          "instruction cz is not supported on qubits (0, 5)"], context.exception.violations)
+
+    def test_verbatim_circuit_must_only_contain_target_instructions(self):
+        # Given
+        backend = self.provider.get_backend("aws.rigetti.ankaa")
+        backend.options.update_options(verbatim=True)
+
+        # When
+        with self.assertRaises(CircuitValidationError) as context:
+            backend.validate_circuit(_bell_circuit(), 100)
+
+        # Then
+        self.assertEqual(["instruction h is not supported (1 occurrences)",
+                          "instruction cx is not supported (1 occurrences)"], context.exception.violations)
+
+    def test_instructions_translated_by_conversion(self):
+        # Given
+        backend = self.provider.get_backend("azure.ionq.simulator")
+        circuit = _bell_circuit(3)
+        circuit.ccx(0, 1, 2)
+        circuit.append(Gate("custom", 1, []), [2])
+
+        # When
+        with self.assertRaises(CircuitValidationError) as context:
+            backend.validate_circuit(circuit)
+
+        # Then
+        self.assertEqual(["instruction custom is not supported (1 occurrences)"], context.exception.violations)
+
+    def test_valid_circuits(self):
+        for backend_id in ["aws.sim.sv1", "aws.rigetti.ankaa", "azure.ionq.simulator", "qryd.sim.square"]:
+            with self.subTest(backend_id=backend_id):
+                # Given
+                backend = self.provider.get_backend(backend_id)
+                circuit = _bell_circuit()
+                circuit.barrier()
+
+                # Then
+                backend.validate_circuit(circuit, 100)
+
+    def test_validation_can_be_disabled(self):
+        # Given
+        backend = self.provider.get_backend("qryd.sim.square")
+        circuit = _bell_circuit()
+
+        # When
+        job = backend.run(circuit, shots=10, validate=False)
+
+        # Then
+        self.assertIsNotNone(job.job_id())